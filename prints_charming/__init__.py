@@ -22,9 +22,10 @@ from .prints_charming import PrintsCharming, TerminalSizeWatcher
 
 
 from .dynamic_formatter import DynamicFormatter
-from .frame_builder import FrameBuilder
+from .frame_builder import FrameBuilder, FrameTemplate
 from .interactive_menu import InteractiveMenu
-from .table_manager import TableManager, BoundCell
+from .table_manager import TableManager, BoundCell, AsyncBoundCell, ColumnStyle
+from .table_view import TableView
 from .toggle_manager import ToggleManager
 from .prints_ui import PrintsUI
 from .segment_styler import SegmentStyler
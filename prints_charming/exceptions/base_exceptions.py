@@ -4,6 +4,7 @@ import re
 import traceback
 import sys
 import copy
+import weakref
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 from ..prints_charming_defaults import DEFAULT_STYLES
 
@@ -31,6 +32,246 @@ def get_all_subclass_names(cls: Type[Any],
 
 
 
+_CAUSE_MESSAGE = "\nThe above exception was the direct cause of the following exception:\n\n"
+_CONTEXT_MESSAGE = "\nDuring handling of the above exception, another exception occurred:\n\n"
+
+
+def collapse_repeated_frames(frames: List[traceback.FrameSummary],
+                             max_period: int = 8,
+                             min_repeats: int = 3
+                             ) -> List[Union[traceback.FrameSummary, str]]:
+    """
+    Collapse consecutive repeats of a run of frames, as produced by deep or
+    mutual recursion, into the run followed by a marker line.
+
+    Frames are compared by (filename, lineno, name). At each position the run
+    length (1 to `max_period`) covering the most frames is chosen.
+
+    Args:
+        frames (List[traceback.FrameSummary]): Frames, outermost first.
+        max_period (int): Longest run of frames detected as a repeat unit.
+        min_repeats (int): Minimum number of consecutive occurrences of a run
+            before it is collapsed.
+
+    Returns:
+        List[Union[traceback.FrameSummary, str]]: Frames, with collapsed
+        repeats replaced by marker strings.
+    """
+    keys = [(frame.filename, frame.lineno, frame.name) for frame in frames]
+    count = len(keys)
+    result: List[Union[traceback.FrameSummary, str]] = []
+
+    i = 0
+    while i < count:
+        best_period, best_repeats = 1, 1
+        for period in range(1, min(max_period, (count - i) // min_repeats) + 1):
+            block = keys[i:i + period]
+            repeats = 1
+            while keys[i + repeats * period:i + (repeats + 1) * period] == block:
+                repeats += 1
+            if repeats >= min_repeats and repeats * period > best_repeats * best_period:
+                best_period, best_repeats = period, repeats
+
+        if best_repeats >= min_repeats:
+            result.extend(frames[i:i + best_period])
+            noun = 'frame' if best_period == 1 else f'{best_period} frames'
+            result.append(f"  [Previous {noun} repeated {best_repeats - 1} more times]\n")
+            i += best_period * best_repeats
+        else:
+            result.append(frames[i])
+            i += 1
+
+    return result
+
+
+def collapse_repeated_lines(frames: List[traceback.FrameSummary]
+                            ) -> List[Union[traceback.FrameSummary, str]]:
+    """
+    Collapse consecutive identical frames the way `traceback.StackSummary.format`
+    does: the first few are kept and the rest replaced by a
+    "[Previous line repeated N more times]" line.
+
+    Args:
+        frames (List[traceback.FrameSummary]): Frames, outermost first.
+
+    Returns:
+        List[Union[traceback.FrameSummary, str]]: Frames, with collapsed
+        repeats replaced by marker strings.
+    """
+    cutoff = getattr(traceback, '_RECURSIVE_CUTOFF', 3)
+    result: List[Union[traceback.FrameSummary, str]] = []
+    last_key = None
+    count = 0
+
+    def marker(count: int) -> str:
+        count -= cutoff
+        return f'  [Previous line repeated {count} more time{"s" if count > 1 else ""}]\n'
+
+    for frame in frames:
+        key = (frame.filename, frame.lineno, frame.name)
+        if key != last_key:
+            if count > cutoff:
+                result.append(marker(count))
+            last_key = key
+            count = 0
+        count += 1
+        if count <= cutoff:
+            result.append(frame)
+    if count > cutoff:
+        result.append(marker(count))
+    return result
+
+
+def format_bounded_traceback(exc_type: Optional[Type[BaseException]],
+                             exc_value: Optional[BaseException],
+                             exc_tb: Optional[Any],
+                             max_frames: Optional[int] = None,
+                             max_chain: Optional[int] = None,
+                             collapse_repeats: bool = True
+                             ) -> str:
+    """
+    Format an exception like `traceback.format_exception`, with repeated frame
+    runs collapsed and the number of frames and chained exceptions bounded.
+
+    Source lines are only read for frames that are emitted.
+
+    Args:
+        exc_type (Optional[Type[BaseException]]): Exception type.
+        exc_value (Optional[BaseException]): Exception value.
+        exc_tb (Optional[Any]): Traceback object.
+        max_frames (Optional[int]): Maximum frames shown per exception. The
+            outermost and innermost halves are kept. None means unbounded.
+        max_chain (Optional[int]): Maximum exceptions shown from the
+            __cause__/__context__ chain, keeping those closest to the final
+            exception. None means unbounded.
+        collapse_repeats (bool): Collapse repeated runs of frames. If False,
+            only identical consecutive frames are collapsed, exactly as
+            `traceback.format_exception` does.
+
+    Returns:
+        str: The formatted traceback.
+    """
+    if exc_value is None:
+        return ''.join(traceback.format_exception(exc_type, exc_value, exc_tb))
+
+    top = traceback.TracebackException(
+        type(exc_value), exc_value, exc_tb, lookup_lines=False
+    )
+
+    # Walk the chain from the final exception back to the root cause
+    chain: List[Tuple[traceback.TracebackException, Optional[str]]] = []
+    current, link = top, None
+    seen = set()
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        chain.append((current, link))
+        if current.__cause__ is not None:
+            current, link = current.__cause__, _CAUSE_MESSAGE
+        elif current.__context__ is not None and not current.__suppress_context__:
+            current, link = current.__context__, _CONTEXT_MESSAGE
+        else:
+            current = None
+
+    omitted_chain = 0
+    if max_chain is not None and len(chain) > max_chain:
+        omitted_chain = len(chain) - max(1, max_chain)
+        chain = chain[:max(1, max_chain)]
+
+    output: List[str] = []
+    if omitted_chain:
+        output.append(f"[{omitted_chain} earlier chained exception(s) omitted]\n\n")
+
+    # Root cause first, as Python prints it
+    for te, link in reversed(chain):
+        if getattr(te, 'exceptions', None):
+            # Exception groups keep the standard layout
+            output.extend(te.format(chain=False))
+        else:
+            if te.stack:
+                output.append('Traceback (most recent call last):\n')
+                frames = collapse_repeated_frames(te.stack) if collapse_repeats else collapse_repeated_lines(te.stack)
+
+                frame_count = sum(1 for entry in frames if not isinstance(entry, str))
+                if max_frames is not None and frame_count > max_frames:
+                    head = max(1, max_frames // 2)
+                    tail = max(0, max_frames - head)
+                    kept, index = [], 0
+                    for entry in frames:
+                        if not isinstance(entry, str):
+                            index += 1
+                        if index <= head or index > frame_count - tail:
+                            kept.append(entry)
+                        elif index == head + 1 and not isinstance(entry, str):
+                            kept.append(f"  [... {frame_count - head - tail} frames omitted ...]\n")
+                    frames = kept
+
+                for entry in frames:
+                    if not isinstance(entry, str):
+                        # Source lines are read here, only for emitted frames
+                        entry = te.stack.format_frame_summary(entry)
+                    if entry:
+                        output.append(entry)
+            output.extend(te.format_exception_only())
+
+        if link is not None:
+            output.append(link)
+
+    return ''.join(output)
+
+
+
+class StyledFragmentCache:
+    """
+    Memoizes `PrintsCharming.apply_style` results for traceback fragments
+    (paths, filenames, function names, keywords) that repeat across
+    tracebacks.
+
+    Each entry remembers the style code it was built with, so editing a style
+    on the PrintsCharming instance invalidates the affected entries.
+    """
+
+    def __init__(self, pc: 'PrintsCharming', maxsize: int = 4096) -> None:
+        """
+        Args:
+            pc (PrintsCharming): Instance of PrintsCharming used for styling.
+            maxsize (int): Number of fragments kept before the cache is cleared.
+        """
+        self.pc = pc
+        self.maxsize = maxsize
+        self._cache: Dict[Tuple[str, str], Tuple[Any, str]] = {}
+
+    def _style_key(self, style_name: str) -> Any:
+        pc = self.pc
+        code = pc.style_codes.get(style_name)
+        if code is None:
+            code = pc.color_map.get(style_name)
+        return code, pc.plain_output
+
+    def style(self, style_name: str, text: str) -> str:
+        """
+        Returns `pc.apply_style(style_name, text)`, memoized.
+
+        Args:
+            style_name (str): Name of the style.
+            text (str): Text to style.
+
+        Returns:
+            str: The styled text.
+        """
+        key = (style_name, text)
+        style_key = self._style_key(style_name)
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == style_key:
+            return entry[1]
+
+        styled = self.pc.apply_style(style_name, text)
+        if len(self._cache) >= self.maxsize:
+            self._cache.clear()
+        self._cache[key] = (style_key, styled)
+        return styled
+
+
+
 class PrintsCharmingException(Exception):
     """Base class for all exceptions using PrintsCharming.
 
@@ -53,6 +294,56 @@ class PrintsCharmingException(Exception):
         SystemExit, MemoryError, KeyboardInterrupt, OSError
     )
 
+    # Traceback bounds used by handle_exception (see format_bounded_traceback)
+    max_traceback_frames: Optional[int] = None
+    max_exception_chain: Optional[int] = None
+    collapse_repeats: bool = True
+
+    # Alternation regex over all subclass names (with trailing colon). Built
+    # lazily and reset by __init_subclass__ whenever a subclass is defined.
+    # False means there are no subclasses to match.
+    _subclass_name_regex: Optional[Union[re.Pattern, bool]] = None
+
+    # One StyledFragmentCache per PrintsCharming instance
+    _fragment_caches: 'weakref.WeakKeyDictionary[Any, StyledFragmentCache]' = weakref.WeakKeyDictionary()
+
+    # Precompiled per-line patterns used by stylize_traceback
+    _leading_whitespace_regex: re.Pattern = re.compile(r"\s*")
+    _raise_line_regex: re.Pattern = re.compile(r"raise|ColorNotFoundError|ValueError")
+    _raise_line_styles: Dict[str, str] = {
+        'raise': 'vcyan',
+        'ColorNotFoundError': 'lav',
+        'ValueError': 'lav',
+    }
+
+
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Invalidate the cached subclass-name regex when a subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        PrintsCharmingException._subclass_name_regex = None
+
+
+    @classmethod
+    def get_subclass_name_regex(cls) -> Optional[re.Pattern]:
+        """
+        Returns a compiled alternation regex matching any subclass name
+        followed by a colon, longest names first, or None if there are no
+        subclasses. The regex is cached until a new subclass is defined.
+
+        Returns:
+            Optional[re.Pattern]: The compiled regex or None.
+        """
+        regex = PrintsCharmingException._subclass_name_regex
+        if regex is None:
+            names = sorted(
+                get_all_subclass_names(PrintsCharmingException, trailing_char=':'),
+                key=lambda name: (-len(name), name)
+            )
+            regex = re.compile('|'.join(map(re.escape, names))) if names else False
+            PrintsCharmingException._subclass_name_regex = regex
+        return regex or None
+
 
 
     def __init__(
@@ -96,6 +387,11 @@ class PrintsCharmingException(Exception):
         self.file_line_regex = re.compile(file_line_regex)
         self.check_subclass_names = check_subclass_names
 
+        fragment_cache = PrintsCharmingException._fragment_caches.get(self.pc)
+        if fragment_cache is None:
+            fragment_cache = PrintsCharmingException._fragment_caches[self.pc] = StyledFragmentCache(self.pc)
+        self.fragment_cache = fragment_cache
+
     def __str__(self) -> str:
         """Return the exception message as a string."""
         return self.message
@@ -132,26 +428,21 @@ class PrintsCharmingException(Exception):
         """
 
         styled_lines: List[str] = []
+        style = self.fragment_cache.style
 
-        # Only fetch subclass names if the flag is set to True
-        subclass_names_with_colon: List[str] = []
-        if check_subclass_names:
-            subclass_names_with_colon = list(
-                get_all_subclass_names(
-                    PrintsCharmingException,
-                    trailing_char=':'
-                )
-            )
+        # The subclass regex is cached across calls and rebuilt only when a
+        # new subclass has been defined
+        subclass_name_regex = self.get_subclass_name_regex() if check_subclass_names else None
 
         for line in tb_lines:
-            leading_whitespace_match = re.match(r"^\s*", line)
-            leading_whitespace = leading_whitespace_match.group() if leading_whitespace_match else ''
+            leading_whitespace = self._leading_whitespace_regex.match(line).group()
+            stripped_line = line[len(leading_whitespace):]
 
             if line.startswith("Traceback"):
-                styled_line = self.apply_style('header', line)
+                styled_line = style('header', line)
                 styled_lines.extend([styled_line, ' '])
 
-            elif line.strip().startswith("File"):
+            elif stripped_line.startswith("File"):
                 match = self.file_line_regex.search(line)
                 if match:
                     path_style_code = self.pc.get_style_code('path')
@@ -168,12 +459,12 @@ class PrintsCharmingException(Exception):
                     # Apply styles to each section
                     styled_sections = [
                         path_style_code + section1 + reset,
-                        self.apply_style('error_filename', section2),
-                        self.apply_style('line_info', section3),
-                        self.apply_style('error_line_number', section4),
+                        style('error_filename', section2),
+                        style('line_info', section3),
+                        style('error_line_number', section4),
                         path_style_code + section5 + reset,
                         path_style_code + section6 + reset,
-                        self.apply_style('function_name', section7)
+                        style('function_name', section7)
                     ]
 
                     # Combine the styled sections
@@ -185,51 +476,41 @@ class PrintsCharmingException(Exception):
                     styled_line = self.apply_style('regex_fail_line_fb', line)
                     styled_lines.append(f"{leading_whitespace}{styled_line}")
 
-            elif line.strip().startswith("raise"):
-                styled_line = line.replace(
-                    "raise",
-                    self.apply_style('vcyan', 'raise'))
-                if "ColorNotFoundError" in styled_line:
-                    styled_line = styled_line.replace(
-                        "ColorNotFoundError",
-                        self.apply_style("lav", "ColorNotFoundError"))
-                if "ValueError" in styled_line:
-                    styled_line = styled_line.replace(
-                        "ValueError",
-                        self.apply_style('lav', 'ValueError'))
+            elif stripped_line.startswith("raise"):
+                # Style 'raise' and the known exception names in a single pass
+                styled_line = self._raise_line_regex.sub(
+                    lambda m: style(self._raise_line_styles[m.group()], m.group()),
+                    line
+                )
                 styled_lines.extend([' ', styled_line, ' '])
 
             else:
                 # Skip subclass name checks if the flag is False
                 if check_subclass_names:
-                    for name in subclass_names_with_colon:
-                        if name in line:
-                            start_index = line.find(name)
-                            before_name = line[:start_index]
-                            subclass_name = line[start_index:start_index + len(name)]
-                            after_name = line[start_index + len(name):]
-
-                            styled_parts = [
-                                self.apply_style(
-                                    'subclass_name_before',
-                                    before_name
-                                ),
-                                self.apply_style(
-                                    'subclass_name',
-                                    subclass_name
-                                ),
-                                self.apply_style(
-                                    'subclass_name_after',
-                                    after_name
-                                )
-                            ]
-
-                            # Combine the styled parts
-                            styled_line = ''.join(styled_parts)
-                            styled_lines.extend(
-                                [' ', f"{leading_whitespace}{styled_line}", ' ']
+                    match = subclass_name_regex.search(line) if subclass_name_regex else None
+                    if match:
+                        start_index, end_index = match.span()
+
+                        styled_parts = [
+                            self.apply_style(
+                                'subclass_name_before',
+                                line[:start_index]
+                            ),
+                            style(
+                                'subclass_name',
+                                match.group()
+                            ),
+                            self.apply_style(
+                                'subclass_name_after',
+                                line[end_index:]
                             )
-                            break
+                        ]
+
+                        # Combine the styled parts
+                        styled_line = ''.join(styled_parts)
+                        styled_lines.extend(
+                            [' ', f"{leading_whitespace}{styled_line}", ' ']
+                        )
 
                     else:
                         styled_line = self.apply_style('default', line)
@@ -249,10 +530,17 @@ class PrintsCharmingException(Exception):
                          exc_info: Optional[Any] = None,
                          print_error: bool = False,
                          full_traceback: bool = True,
+                         max_frames: Optional[int] = None,
+                         max_chain: Optional[int] = None,
+                         collapse_repeats: Optional[bool] = None,
                          ) -> None:
         """
         Handle the exception by printing or logging the styled traceback.
 
+        Repeated runs of frames (e.g. from a RecursionError) are collapsed and
+        the traceback can be bounded, so only the emitted lines are read and
+        styled.
+
         Args:
             logger (Optional[Any]): Logger to log the exception.
             exc_type (Optional[Type[BaseException]]): Exception type.
@@ -260,21 +548,32 @@ class PrintsCharmingException(Exception):
             exc_info (Optional[Any]): Exception info.
             print_error (Optional[bool]): Print unstyled error message first.
             full_traceback (bool): Current active exception if True else specific.
+            max_frames (Optional[int]): Maximum frames shown per exception.
+                Defaults to the class attribute max_traceback_frames.
+            max_chain (Optional[int]): Maximum chained exceptions shown.
+                Defaults to the class attribute max_exception_chain.
+            collapse_repeats (Optional[bool]): Collapse repeated frame runs.
+                Defaults to the class attribute collapse_repeats.
         """
         if print_error:
             self.print_error()
 
+        cls = self.__class__
+        bounds = dict(
+            max_frames=max_frames if max_frames is not None else cls.max_traceback_frames,
+            max_chain=max_chain if max_chain is not None else cls.max_exception_chain,
+            collapse_repeats=collapse_repeats if collapse_repeats is not None else cls.collapse_repeats,
+        )
 
         if self.format_specific_exception:
             if full_traceback:
                 # Current active exception traceback (more detailed)
-                tb = traceback.format_exc()
+                tb = format_bounded_traceback(*sys.exc_info(), **bounds)
             else:
                 # Specific styled traceback from this instance
-                tb = ''.join(traceback.format_exception(None, self, self.__traceback__))
+                tb = format_bounded_traceback(type(self), self, self.__traceback__, **bounds)
         else:
-            tb = ''.join(traceback.format_exception(exc_type, exc_value, exc_info))
-            #tb = traceback.format_exc()
+            tb = format_bounded_traceback(exc_type, exc_value, exc_info, **bounds)
 
         tb_lines = tb.split('\n')
 
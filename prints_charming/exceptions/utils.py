@@ -13,7 +13,10 @@ def set_excepthook(
         logger: Optional[logging.Logger] = None,
         log_exc_info: bool = False,
         critical_exceptions: Optional[Tuple[Type[BaseException], ...]] = None,
-        update_exception_logging: bool = False
+        update_exception_logging: bool = False,
+        max_traceback_frames: Optional[int] = None,
+        max_exception_chain: Optional[int] = None,
+        collapse_repeated_frames: Optional[bool] = None
 ) -> None:
     """
     Configures a custom exception handler for unhandled exceptions, optionally
@@ -28,6 +31,12 @@ def set_excepthook(
             of exception types considered critical.
         update_exception_logging (bool): Whether to override an existing custom
             exception hook.
+        max_traceback_frames (Optional[int]): Maximum frames shown per
+            exception in styled tracebacks.
+        max_exception_chain (Optional[int]): Maximum chained exceptions shown
+            in styled tracebacks.
+        collapse_repeated_frames (Optional[bool]): Collapse repeated runs of
+            frames, e.g. from deep recursion. Enabled by default.
     """
 
     if pc:
@@ -36,6 +45,15 @@ def set_excepthook(
     if critical_exceptions:
         PrintsCharmingException.critical_exceptions = critical_exceptions
 
+    if max_traceback_frames is not None:
+        PrintsCharmingException.max_traceback_frames = max_traceback_frames
+
+    if max_exception_chain is not None:
+        PrintsCharmingException.max_exception_chain = max_exception_chain
+
+    if collapse_repeated_frames is not None:
+        PrintsCharmingException.collapse_repeats = collapse_repeated_frames
+
 
 
     def custom_excepthook(
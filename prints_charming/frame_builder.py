@@ -1,5 +1,7 @@
 # frame_builder.py
 
+import sys
+import unicodedata
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .prints_charming import PrintsCharming
@@ -14,6 +16,155 @@ class BoundCell:
 
 
 
+class FrameTemplate:
+    """
+    A frame layout compiled by FrameBuilder.compile_frame.
+
+    Borders, the available width and each slot's alignment and style codes
+    are computed once. render fills in only the slot texts and reuses the
+    lines of slots whose text did not change. A template compiled with a
+    frame_name is stored as that frame, so draw and refresh redraw it in
+    place with FrameBuilder.draw_frame and refresh_frame.
+
+    The style codes are captured when the template is compiled; compile it
+    again after editing the styles it uses.
+    """
+
+    def __init__(self, frame_builder: 'FrameBuilder', slots: List[str], text_styles: List[str],
+                 text_alignments: List[str], border_top: Optional[str], border_left: str,
+                 border_right: str, border_bottom: Optional[str], table_lines: List[str],
+                 frame_name: Optional[str] = None):
+        self.frame_builder = frame_builder
+        self.slots = slots
+        self.frame_name = frame_name
+        self.available_width = frame_builder.get_available_width()
+        self.top_lines = [border_top] if border_top else []
+        self.bottom_lines = table_lines + ([border_bottom] if border_bottom else [])
+        self.border_left = border_left
+        self.border_right = border_right
+
+        pc = frame_builder.pc
+        aligners = {'left': str.ljust, 'right': str.rjust, 'center': str.center}
+        self.aligners = []
+        self.affixes = []
+        for style, align in zip(text_styles, text_alignments):
+            if align not in aligners:
+                raise ValueError("Invalid alignment. Choose from 'left', 'right', or 'center'.")
+            self.aligners.append(aligners[align])
+            self.affixes.append(tuple(pc.apply_style(style, '\0').split('\0', 1)))
+        self.text_styles = text_styles
+        self.text_alignments = text_alignments
+
+        self.blank_line = f"{border_left}{' ' * self.available_width}{border_right}"
+
+        # Slot index -> (text, rendered lines) of the last render
+        self.slot_lines: Dict[int, Tuple[str, List[str]]] = {}
+
+
+    def render_slot(self, slot_idx: int, text: str) -> List[str]:
+        """
+        Returns the frame lines of one slot.
+
+        :param slot_idx: Index of the slot.
+        :param text: The slot's text.
+        :return: The slot's lines, including the vertical borders.
+        """
+        cached = self.slot_lines.get(slot_idx)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+
+        frame_builder = self.frame_builder
+        width = self.available_width
+        align = self.aligners[slot_idx]
+        prefix, suffix = self.affixes[slot_idx]
+        lines = []
+        for line, line_width in frame_builder.split_text_to_lines_with_widths(text, width):
+            if line == 'invisible_text' or line == '':
+                lines.append(self.blank_line)
+                continue
+            if line_width == len(line):
+                aligned_text = align(line, width)
+            else:
+                aligned_text = frame_builder.align_text(line, width, self.text_alignments[slot_idx], line_width)
+            if aligned_text.isspace():
+                aligned_text = frame_builder.pc.apply_style(self.text_styles[slot_idx], aligned_text)
+            else:
+                aligned_text = f"{prefix}{aligned_text}{suffix}"
+            lines.append(f"{self.border_left}{aligned_text}{self.border_right}")
+
+        self.slot_lines[slot_idx] = (text, lines)
+        return lines
+
+
+    def render_texts(self, texts: List[Any]) -> List[str]:
+        """
+        Returns the frame lines for slot texts given in slot order.
+
+        :param texts: One text per slot. Missing trailing texts render empty.
+        :return: The frame lines.
+        """
+        lines = list(self.top_lines)
+        for slot_idx in range(len(self.slots)):
+            text = texts[slot_idx] if slot_idx < len(texts) else ''
+            lines.extend(self.render_slot(slot_idx, str(text)))
+        lines.extend(self.bottom_lines)
+        return lines
+
+
+    def slot_texts(self, slots: Dict[str, Any], texts: Optional[List[Any]] = None) -> List[Any]:
+        """
+        Returns slot texts in slot order, taking values from slots and the rest from texts.
+
+        :param slots: Slot name to text.
+        :param texts: Previous texts in slot order, if any.
+        :return: The texts in slot order.
+        """
+        unknown = set(slots) - set(self.slots)
+        if unknown:
+            raise ValueError(f"Unknown slots {sorted(unknown)}. Choose from {self.slots}.")
+        texts = texts or []
+        return [
+            slots[name] if name in slots else (texts[i] if i < len(texts) else '')
+            for i, name in enumerate(self.slots)
+        ]
+
+
+    def render_lines(self, **slots: Any) -> List[str]:
+        """
+        Returns the frame lines with the given slot texts. Slots not given render empty.
+        """
+        return self.render_texts(self.slot_texts(slots))
+
+
+    def render(self, **slots: Any) -> str:
+        """
+        Returns the frame with the given slot texts, as generate_frame would.
+        Slots not given render empty.
+        """
+        return "\n".join(self.render_lines(**slots))
+
+
+    def draw(self, row: int = 1, col: int = 1) -> None:
+        """
+        Draws the stored frame at a screen position. See FrameBuilder.draw_frame.
+        """
+        if not self.frame_name:
+            raise ValueError("Only templates compiled with a frame_name can be drawn.")
+        self.frame_builder.draw_frame(self.frame_name, row, col)
+
+
+    def refresh(self, **slots: Any) -> Optional[Dict[str, int]]:
+        """
+        Updates the given slots of the stored frame and redraws what changed.
+        Slots not given keep their text. See FrameBuilder.refresh_frame.
+        """
+        if not self.frame_name:
+            raise ValueError("Only templates compiled with a frame_name can be refreshed.")
+        frame_info = self.frame_builder.frames[self.frame_name]
+        return self.frame_builder.refresh_frame(self.frame_name, self.slot_texts(slots, frame_info["texts"]))
+
+
+
 class FrameBuilder:
 
     def __init__(self, pc=None, horiz_width=None, horiz_char=' ', vert_width=2, vert_padding=1, vert_char='|', inner_char='|', inner_width=2, inner_padding=1, ansi_escape_pattern='sgr_strict'):
@@ -51,6 +202,10 @@ class FrameBuilder:
         self.frames = {}
         self.previous_values = {}
 
+        # (style name, text, fill_space) -> (style code, plain_output, styled text)
+        self.styled_cache = {}
+        self.max_styled_cache = 512
+
 
 
 
@@ -133,15 +288,14 @@ class FrameBuilder:
                 text_alignments = [text_alignments] * len(texts)
 
             available_width = self.get_available_width()
-            lines_list = [self.split_text_to_lines(text, available_width) for text in texts]
+            lines_list = [self.split_text_to_lines_with_widths(text, available_width) for text in texts]
 
             for lines, text_style, text_align in zip(lines_list, text_styles, text_alignments):
-                for line in lines:
+                for line, line_width in lines:
                     if line == 'invisible_text' or line == '':
-                        line = ' '
-                        aligned_text = self.align_text(line, available_width, text_align)
+                        aligned_text = self.get_blank(available_width)
                     else:
-                        aligned_text = self.pc.apply_style(text_style, self.align_text(line, available_width, text_align))
+                        aligned_text = self.pc.apply_style(text_style, self.align_text(line, available_width, text_align, line_width))
 
                     final_text = self.construct_text(vert_border_left_str, vert_border_right_str, aligned_text)
                     frame_lines.append(final_text)
@@ -151,12 +305,11 @@ class FrameBuilder:
             if isinstance(table_strs_alignments, str):
                 table_strs_alignments = [table_strs_alignments] * len(table_strs)
 
+            available_width = self.get_available_width()
             for table_str, table_align in zip(table_strs, table_strs_alignments):
                 table_lines = table_str.split("\n")
                 for line in table_lines:
-                    #stripped_line = self.strip_ansi_escape_sequences(line)
-                    stripped_line = self.pc.__class__.remove_ansi_codes(line)
-                    padding_needed = self.get_available_width() - len(stripped_line)
+                    padding_needed = available_width - self.measure_text(line)
                     if table_align == 'center':
                         leading_spaces = padding_needed // 2
                         trailing_spaces = padding_needed - leading_spaces
@@ -184,6 +337,7 @@ class FrameBuilder:
             self.frames[frame_name] = {
                 "texts": texts,
                 "frame_content": frame_str,
+                "lines": frame_lines,
                 "format_params": {
                     "text_styles": text_styles,
                     "text_alignments": text_alignments,
@@ -205,12 +359,37 @@ class FrameBuilder:
         return frame_str
 
 
-    def refresh_frame(self, frame_name: str, new_texts: Optional[List[str]] = None) -> None:
+    def draw_frame(self, frame_name: str, row: int = 1, col: int = 1) -> None:
+        """
+        Draws a stored frame at a screen position and records it as the frame's
+        origin, so refresh_frame can redraw only what changed.
+
+        :param frame_name: The name of the frame to draw.
+        :param row: Screen row (1-based) of the frame's first line.
+        :param col: Screen column (1-based) of the frame's left edge.
+        """
+        if frame_name not in self.frames:
+            raise ValueError(f"Frame '{frame_name}' does not exist.")
+
+        frame_info = self.frames[frame_name]
+        lines = frame_info["lines"]
+        self.pc.write(''.join(f"\033[{row + i};{col}H{line}" for i, line in enumerate(lines)))
+        frame_info["origin"] = (row, col)
+        frame_info["drawn_lines"] = list(lines)
+
+
+    def refresh_frame(self, frame_name: str, new_texts: Optional[List[str]] = None) -> Optional[Dict[str, int]]:
         """
         Refreshes a stored frame by updating its content.
 
+        If the frame was drawn with draw_frame, the new lines are compared with
+        the ones on screen and only the changed span of each changed line is
+        rewritten, using cursor positioning, in a single write. Otherwise the
+        whole frame is printed.
+
         :param frame_name: The name of the frame to refresh.
         :param new_texts: New texts to update the frame with.
+        :return: Refresh statistics: 'lines_changed' and 'bytes_written', or None if the frame was never drawn.
         """
         if frame_name not in self.frames:
             raise ValueError(f"Frame '{frame_name}' does not exist.")
@@ -222,20 +401,284 @@ class FrameBuilder:
         texts = new_texts if new_texts else frame_info["texts"]
 
         # Re-generate the frame
-        frame_str = self.generate_frame(
-            frame_name=frame_name,
-            texts=texts,
-            ephemeral=True,
-            **format_params
-        )
+        template = frame_info.get("template")
+        if template:
+            new_lines = template.render_texts(texts)
+            frame_str = "\n".join(new_lines)
+        else:
+            frame_str = self.generate_frame(
+                frame_name=frame_name,
+                texts=texts,
+                ephemeral=True,
+                **format_params
+            )
+            new_lines = frame_str.split("\n")
 
         # Update the stored frame content
-        self.frames[frame_name]["frame_content"] = frame_str
+        frame_info["texts"] = texts
+        frame_info["frame_content"] = frame_str
+        frame_info["lines"] = new_lines
+
+        if "origin" not in frame_info:
+            self.pc.write(f"{frame_str}\n")
+            return None
+
+        row, col = frame_info["origin"]
+        old_lines = frame_info["drawn_lines"]
+
+        output = []
+        lines_changed = 0
+        for i in range(max(len(old_lines), len(new_lines))):
+            old_line = old_lines[i] if i < len(old_lines) else ''
+            new_line = new_lines[i] if i < len(new_lines) else ''
+            if old_line == new_line:
+                continue
+            span = self.get_changed_span(old_line, new_line)
+            if span:
+                offset, text = span
+                output.append(f"\033[{row + i};{col + offset}H{text}")
+                lines_changed += 1
+
+        frame_info["drawn_lines"] = new_lines
+
+        bytes_written = 0
+        if output:
+            buffer = ''.join(output)
+            self.pc.write(buffer)
+            bytes_written = len(buffer.encode(getattr(sys.stdout, 'encoding', None) or 'utf-8', 'replace'))
+
+        return {"lines_changed": lines_changed, "bytes_written": bytes_written}
+
+
+    @staticmethod
+    def char_width(char: str) -> int:
+        """
+        Returns the number of screen columns a character occupies: 0 for
+        combining and format characters, 2 for wide East Asian characters and
+        most emoji, 1 otherwise.
+
+        :param char: A single character.
+        :return: 0, 1 or 2.
+        """
+        if char < '\u0300':
+            return 1
+        if unicodedata.combining(char) or unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            return 0
+        return 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+
+
+    def append_cells(self, cells: List[Tuple[str, str]], codes: str, text: str) -> None:
+        """
+        Appends one (codes, text) cell per screen column of text. A wide
+        character is followed by a ('', '') cell for its second column, and
+        zero-width characters join the preceding cell.
+
+        :param cells: The list of cells to extend.
+        :param codes: The escape codes active for text.
+        :param text: Text without escape codes.
+        """
+        if text.isascii():
+            cells.extend((codes, char) for char in text)
+            return
+
+        for char in text:
+            width = self.char_width(char)
+            if width == 0 and cells:
+                # Attach to the preceding character (after the placeholder of a wide one)
+                index = len(cells) - 2 if cells[-1] == ('', '') and len(cells) > 1 else len(cells) - 1
+                cell_codes, cell_text = cells[index]
+                cells[index] = (cell_codes, cell_text + char)
+            else:
+                cells.append((codes, char))
+                if width == 2:
+                    cells.append(('', ''))
+
+
+    def split_line_cells(self, line: str) -> List[Tuple[str, str]]:
+        """
+        Splits a line into one (active escape codes, text) pair per screen
+        column. The second column of a wide character is an empty ('', '') cell.
+
+        :param line: The line, possibly containing ANSI codes.
+        :return: A list of (codes, text) tuples.
+        """
+        cells = []
+        if '\x1b' not in line:
+            self.append_cells(cells, '', line)
+            return cells
+
+        reset = self.pc.__class__.RESET
+        codes = ''
+        pos = 0
+        for match in self.pc.__class__.ansi_escape_patterns['all'].finditer(line):
+            self.append_cells(cells, codes, line[pos:match.start()])
+            code = match.group()
+            codes = '' if code == reset or code == '\x1b[m' else codes + code
+            pos = match.end()
+        self.append_cells(cells, codes, line[pos:])
+        return cells
+
+
+    def get_changed_span(self, old_line: str, new_line: str) -> Optional[Tuple[int, str]]:
+        """
+        Returns the part of new_line that differs on screen from old_line.
+
+        Columns past the end of the shorter line are compared as blanks, so
+        the span also erases what is left of a longer old line. Wide
+        characters are never split: the span is widened to cover both of
+        their columns in either line.
+
+        :param old_line: The line currently on screen.
+        :param new_line: The line replacing it.
+        :return: (column offset, text to write there), or None if both lines look the same.
+        """
+        old_cells = self.split_line_cells(old_line)
+        new_cells = self.split_line_cells(new_line)
+
+        width = max(len(old_cells), len(new_cells))
+        blank = ('', ' ')
+        old_cells.extend([blank] * (width - len(old_cells)))
+        new_cells.extend([blank] * (width - len(new_cells)))
+
+        start = 0
+        while start < width and old_cells[start] == new_cells[start]:
+            start += 1
+        if start == width:
+            return None
+        end = width
+        while old_cells[end - 1] == new_cells[end - 1]:
+            end -= 1
+
+        # Don't start or stop inside a wide character, old or new
+        placeholder = ('', '')
+        while start > 0 and placeholder in (old_cells[start], new_cells[start]):
+            start -= 1
+        while end < width and placeholder in (old_cells[end], new_cells[end]):
+            end += 1
+
+        reset = self.pc.__class__.RESET
+        parts = []
+        codes = ''
+        for cell_codes, char in new_cells[start:end]:
+            if cell_codes != codes:
+                parts.append(f"{reset}{cell_codes}" if codes else cell_codes)
+                codes = cell_codes
+            parts.append(char)
+        if codes:
+            parts.append(reset)
+
+        return start, ''.join(parts)
+
+
+    def compile_frame(self,
+                      slots: List[str],
+                      frame_name: Optional[str] = None,
+                      text_styles: Union[str, List[str]] = None,
+                      text_alignments: Union[str, List[str]] = 'center',
+                      horiz_border_top: bool = True,
+                      horiz_border_top_style: Optional[str] = None,
+                      horiz_border_bottom: bool = True,
+                      horiz_border_bottom_style: Optional[str] = None,
+                      vert_border_left: bool = True,
+                      vert_border_left_style: Optional[str] = None,
+                      vert_border_right: bool = True,
+                      vert_border_right_style: Optional[str] = None,
+                      default_text_alignment: str = 'center',
+                      table_strs: Optional[List[str]] = None,
+                      table_strs_alignments: Union[str, List[str]] = 'center',
+                      **initial_texts) -> FrameTemplate:
+        """
+        Compiles a frame layout into a FrameTemplate with one named slot per text.
+
+        The template renders the same lines generate_frame would for the same
+        texts and parameters. table_strs are static and rendered once, below
+        the slots.
+
+        :param slots: Slot names, in display order.
+        :param frame_name: If given, the frame is stored under this name for draw_frame and refresh_frame.
+        :param text_styles: Style(s) to apply to the slots.
+        :param text_alignments: Alignment(s) for the slots.
+        :param horiz_border_top: Whether to display the top horizontal border.
+        :param horiz_border_top_style: Style for the top horizontal border.
+        :param horiz_border_bottom: Whether to display the bottom horizontal border.
+        :param horiz_border_bottom_style: Style for the bottom horizontal border.
+        :param vert_border_left: Whether to display the left vertical border.
+        :param vert_border_left_style: Style for the left vertical border.
+        :param vert_border_right: Whether to display the right vertical border.
+        :param vert_border_right_style: Style for the right vertical border.
+        :param default_text_alignment: Default text alignment if not specified.
+        :param table_strs: List of table strings to include in the frame.
+        :param table_strs_alignments: Alignment(s) for the table strings.
+        :param initial_texts: Initial slot texts of a stored frame.
+        :return: The compiled FrameTemplate.
+        """
+        if not text_styles:
+            text_styles = ['default'] * len(slots)
+        if isinstance(text_styles, str):
+            text_styles = [text_styles] * len(slots)
 
-        # Move cursor to the starting position of the frame
-        # This assumes you have stored the starting line when you first printed the frame
-        # For simplicity, we'll just print the updated frame
-        print(frame_str, flush=True)
+        if not text_alignments:
+            text_alignments = [default_text_alignment] * len(slots)
+        if isinstance(text_alignments, str):
+            text_alignments = [text_alignments] * len(slots)
+
+        border_params = {
+            "horiz_border_top": horiz_border_top,
+            "horiz_border_top_style": horiz_border_top_style,
+            "horiz_border_bottom": horiz_border_bottom,
+            "horiz_border_bottom_style": horiz_border_bottom_style,
+            "vert_border_left": vert_border_left,
+            "vert_border_left_style": vert_border_left_style,
+            "vert_border_right": vert_border_right,
+            "vert_border_right_style": vert_border_right_style,
+        }
+
+        border_top, border_left, _, border_right, border_bottom = self.build_styled_border_box(
+            border_top=horiz_border_top,
+            border_top_style=horiz_border_top_style,
+            border_bottom=horiz_border_bottom,
+            border_bottom_style=horiz_border_bottom_style,
+            border_left=vert_border_left,
+            border_left_style=vert_border_left_style,
+            border_inner=False,
+            border_right=vert_border_right,
+            border_right_style=vert_border_right_style
+        )
+
+        # Static table lines, rendered once between the same vertical borders
+        table_lines = []
+        if table_strs:
+            table_lines = self.generate_frame(
+                table_strs=table_strs,
+                table_strs_alignments=table_strs_alignments,
+                ephemeral=True,
+                **{**border_params, "horiz_border_top": False, "horiz_border_bottom": False}
+            ).split("\n")
+
+        template = FrameTemplate(
+            self, list(slots), text_styles, text_alignments,
+            border_top, border_left, border_right, border_bottom, table_lines, frame_name
+        )
+
+        if frame_name:
+            texts = template.slot_texts(initial_texts)
+            lines = template.render_texts(texts)
+            self.frames[frame_name] = {
+                "texts": texts,
+                "frame_content": "\n".join(lines),
+                "lines": lines,
+                "template": template,
+                "format_params": {
+                    "text_styles": text_styles,
+                    "text_alignments": text_alignments,
+                    **border_params,
+                    "default_text_alignment": default_text_alignment,
+                    "table_strs": table_strs,
+                    "table_strs_alignments": table_strs_alignments,
+                }
+            }
+
+        return template
 
 
     def get_frame(self, frame_name: str) -> str:
@@ -267,10 +710,29 @@ class FrameBuilder:
         return construction_map[key]()
 
 
-    def align_text(self, text, available_width=None, align='center'):
+    def align_text(self, text, available_width=None, align='center', text_width=None):
         if not available_width:
             available_width = self.get_available_width()
 
+        # Pad by visible width when the text contains ANSI codes
+        if text_width is None:
+            text_width = self.measure_text(text)
+        if text_width != len(text):
+            margin = available_width - text_width
+            if margin <= 0:
+                left = right = 0
+            elif align == 'left':
+                left, right = 0, margin
+            elif align == 'right':
+                left, right = margin, 0
+            elif align == 'center':
+                # Same split as str.center
+                left = margin // 2 + (margin & available_width & 1)
+                right = margin - left
+            else:
+                raise ValueError("Invalid alignment. Choose from 'left', 'right', or 'center'.")
+            return f"{' ' * left}{text}{' ' * right}"
+
         if align == 'left':
             return text.ljust(available_width)
         elif align == 'right':
@@ -357,25 +819,104 @@ class FrameBuilder:
 
 
 
-    def split_text_to_lines(self, text, available_width, preserve_newlines=True):
+    def measure_text(self, text):
+        """
+        Returns the visible width of text, ignoring ANSI escape sequences.
+
+        :param text: The text to measure.
+        :return: The number of visible characters.
+        """
+        if '\x1b' not in text:
+            return len(text)
+        return len(self.pc.__class__.remove_ansi_codes(text))
+
+
+    def split_text_to_lines_with_widths(self, text, available_width, preserve_newlines=True):
+        """
+        Word-wraps text to available_width and returns each line with its visible width.
+
+        Words are measured once, ignoring ANSI escape sequences. A style left
+        open at the end of a line is reset there and reopened at the start of
+        the next line, so wrapped styled text never bleeds into borders.
+
+        :param text: The text to split.
+        :param available_width: The maximum visible width of a line.
+        :param preserve_newlines: Whether to start a new line at each newline.
+        :return: A list of (line, visible width) tuples.
+        """
         lines = text.split('\n') if preserve_newlines else [text]
         split_lines = []
+
+        if '\x1b' not in text:
+            for line in lines:
+                words = []
+                width = 0
+                for word in line.split():
+                    if width + len(word) + 1 <= available_width:
+                        if words:
+                            width += 1
+                        words.append(word)
+                        width += len(word)
+                    else:
+                        split_lines.append((' '.join(words), width))
+                        words = [word]
+                        width = len(word)
+                if words:
+                    split_lines.append((' '.join(words), width))
+            return split_lines
+
+        escape_pattern = self.pc.__class__.ansi_escape_pattern
+        reset = self.pc.__class__.RESET
+
+        # SGR codes active at the start of the current line, and after the last word read
+        start_codes = codes = ''
         for line in lines:
-            words = line.split()
-            current_line = ""
-            for word in words:
-                if len(current_line) + len(word) + 1 <= available_width:
-                    if current_line:
-                        current_line += " "
-                    current_line += word
+            words = []
+            width = 0
+            for word in line.split():
+                word_start_codes = codes
+                if '\x1b' in word:
+                    word_width = 0
+                    pos = 0
+                    for match in escape_pattern.finditer(word):
+                        word_width += match.start() - pos
+                        code = match.group()
+                        if code.startswith('\x1b[') and code.endswith('m'):
+                            codes = '' if code == reset or code == '\x1b[m' else codes + code
+                        pos = match.end()
+                    word_width += len(word) - pos
+                else:
+                    word_width = len(word)
+
+                if width + word_width + 1 <= available_width:
+                    if words:
+                        width += 1
+                    words.append(word)
+                    width += word_width
                 else:
-                    split_lines.append(current_line)
-                    current_line = word
-            if current_line:
-                split_lines.append(current_line)
+                    split_lines.append((self._wrap_styled_line(words, start_codes, word_start_codes, reset), width))
+                    start_codes = word_start_codes
+                    words = [word]
+                    width = word_width
+            if words:
+                split_lines.append((self._wrap_styled_line(words, start_codes, codes, reset), width))
+                start_codes = codes
+
         return split_lines
 
 
+    @staticmethod
+    def _wrap_styled_line(words, start_codes, end_codes, reset):
+        """Joins a wrapped line's words, reopening the style it starts in and resetting the one it ends in."""
+        if not words:
+            return ''
+        return f"{start_codes}{' '.join(words)}{reset if end_codes else ''}"
+
+
+    def split_text_to_lines(self, text, available_width, preserve_newlines=True):
+        return [line for line, _ in self.split_text_to_lines_with_widths(text, available_width, preserve_newlines)]
+
+
 
     def get_available_width(self, num_inner_borders=0):
         if self.available_width is None:
@@ -405,6 +946,52 @@ class FrameBuilder:
 
 
 
+    def get_styled(self, style_name, text, fill_space=True):
+        """
+        Returns text styled with style_name, memoized for borders and blank lines.
+
+        Entries are checked against the style's current code, so they are
+        rebuilt after add_style, edit_style or a change of plain_output.
+
+        :param style_name: The name of the style to apply.
+        :param text: The text to style.
+        :param fill_space: Passed to apply_style.
+        :return: The styled text.
+        """
+        key = (style_name, text, fill_space)
+        code = self.pc.style_codes.get(style_name)
+        plain_output = self.pc.plain_output
+        cached = self.styled_cache.get(key)
+        if cached is not None and cached[0] == code and cached[1] == plain_output:
+            return cached[2]
+
+        if len(self.styled_cache) >= self.max_styled_cache:
+            self.styled_cache.clear()
+        styled = self.pc.apply_style(style_name, text, fill_space=fill_space)
+        self.styled_cache[key] = (code, plain_output, styled)
+        return styled
+
+
+    def get_blank(self, width, style_name=None, fill_space=True):
+        """
+        Returns a blank line of width spaces, styled with style_name if given.
+
+        :param width: The width of the line.
+        :param style_name: The name of the style to apply, or None.
+        :param fill_space: Passed to apply_style.
+        :return: The blank line.
+        """
+        return self.get_styled(style_name, ' ' * width, fill_space) if style_name else ' ' * width
+
+
+    def clear_style_cache(self):
+        """
+        Clears the memoized borders and blank lines, e.g. after changing
+        horiz_width or the border characters.
+        """
+        self.styled_cache.clear()
+
+
     def strip_ansi_escape_sequences(self, text):
         return self.ansi_escape_pattern.sub('', text)
 
@@ -427,17 +1014,23 @@ class FrameBuilder:
                                 border_right=True, border_right_style=None,
                                 width=100):
 
+        # Plain output uses the raw border characters without any SGR codes
+        if self.pc.plain_output:
+            style = horiz_style = vert_style = None
+            border_top_style = border_bottom_style = None
+            border_left_style = border_inner_style = border_right_style = None
+
         # Apply top border style
         if border_top:
             top_style = border_top_style or horiz_style or style
-            horiz_border_top = self.horiz_border if not top_style else self.pc.apply_style(top_style, self.horiz_border)
+            horiz_border_top = self.horiz_border if not top_style else self.get_styled(top_style, self.horiz_border)
         else:
             horiz_border_top = None
 
         # Apply bottom border style
         if border_bottom:
             bottom_style = border_bottom_style or horiz_style or style
-            horiz_border_bottom = self.horiz_border if not bottom_style else self.pc.apply_style(bottom_style, self.horiz_border)
+            horiz_border_bottom = self.horiz_border if not bottom_style else self.get_styled(bottom_style, self.horiz_border)
         else:
             horiz_border_bottom = None
 
@@ -445,7 +1038,7 @@ class FrameBuilder:
         if border_left:
             left_style = border_left_style or vert_style or style
             vert_border_left = (self.vert_border + self.vert_padding if not left_style
-                                else self.pc.apply_style(left_style, self.vert_border) + self.vert_padding)
+                                else self.get_styled(left_style, self.vert_border) + self.vert_padding)
         else:
             vert_border_left = self.vert_padding
 
@@ -453,7 +1046,7 @@ class FrameBuilder:
         if border_right:
             right_style = border_right_style or vert_style or style
             vert_border_right = (self.vert_padding + self.vert_border if not right_style
-                                 else self.vert_padding + self.pc.apply_style(right_style, self.vert_border))
+                                 else self.vert_padding + self.get_styled(right_style, self.vert_border))
         else:
             vert_border_right = self.vert_padding
 
@@ -462,10 +1055,10 @@ class FrameBuilder:
             inner_style = border_inner_style or vert_style or style
             if isinstance(border_inner, str):
                 vert_border_inner = (self.inner_padding + border_inner + self.inner_padding if not inner_style
-                                     else self.inner_padding + self.pc.apply_style(inner_style, border_inner) + self.inner_padding)
+                                     else self.inner_padding + self.get_styled(inner_style, border_inner) + self.inner_padding)
             else:
                 vert_border_inner = (self.inner_padding + self.inner_border + self.inner_padding if not inner_style
-                                     else self.inner_padding + self.pc.apply_style(inner_style, self.inner_border) + self.inner_padding)
+                                     else self.inner_padding + self.get_styled(inner_style, self.inner_border) + self.inner_padding)
 
         else:
             vert_border_inner = None
@@ -1299,47 +1892,41 @@ class FrameBuilder:
             blank_line = ' '.center(available_width)
             print(f'{vert_border_left}{blank_line}{vert_border_right}')
 
+        # Measure each table line once
+        table_widths_list = [[self.measure_text(line) for line in table_lines] for table_lines in table_lines_list]
+
         current_width = 0
         row_buffer = []
 
         for line_index in range(max_lines):
-            row = ""
+            row = []
             row_length = 0
             for table_index, table_lines in enumerate(table_lines_list):
                 line = table_lines[line_index]
-                #stripped_line = self.strip_ansi_escape_sequences(line)
-                stripped_line = self.pc.__class__.remove_ansi_codes(line)
-                line_length = len(stripped_line)
+                line_length = table_widths_list[table_index][line_index]
                 if current_width + line_length > available_width:
-                    row_buffer.append(row.rstrip())
-                    row = ""
+                    row_buffer.append(self._rstrip_row(row, row_length))
+                    row = []
+                    row_length = 0
                     current_width = 0
                 if row:
-                    row += " " * table_padding
+                    row.append(" " * table_padding)
                     row_length += table_padding
-                row += line
+                row.append(line)
                 row_length += line_length
                 current_width += line_length + table_padding
 
             if row:
-                row_buffer.append(row.rstrip())
+                row_buffer.append(self._rstrip_row(row, row_length))
                 current_width = 0
 
-        for row in row_buffer:
-
-            #row_length = len(self.strip_ansi_escape_sequences(row))
-            row_length = len(self.pc.__class__.remove_ansi_codes(row))
+        for row, row_length in row_buffer:
             leading_spaces = (available_width - row_length) // 2
             if (available_width - row_length) % 2 != 0:
                 leading_spaces += 1  # Adjust if the remaining space is odd
-            #print(leading_spaces)
-            #padding_needed = available_width - len(self.strip_ansi_escape_sequences(row))
-            #aligned_text = row + ' ' * padding_needed
-            aligned_text = ' ' * leading_spaces + row
-            #padding_needed = available_width - len(self.strip_ansi_escape_sequences(aligned_text))
-            padding_needed = available_width - len(self.pc.__class__.remove_ansi_codes(aligned_text))
+            padding_needed = available_width - leading_spaces - row_length
 
-            print(f"{vert_border_left}{aligned_text + ' ' * padding_needed}{vert_border_right}")
+            print(f"{vert_border_left}{' ' * leading_spaces}{row}{' ' * padding_needed}{vert_border_right}")
 
 
 
@@ -1351,6 +1938,15 @@ class FrameBuilder:
 
 
 
+    @staticmethod
+    def _rstrip_row(parts, row_length):
+        """Joins a row of table lines and strips trailing whitespace, returning the row and its visible width."""
+        row = ''.join(parts)
+        stripped = row.rstrip()
+        return stripped, row_length - (len(row) - len(stripped))
+
+
+
     def print_border_boxed_tables2(self,
                                   table_strs,
                                   horiz_border_top,
@@ -1526,8 +2122,8 @@ class FrameBuilder:
         if total_col_width > available_width:
             raise ValueError("Total width of columns exceeds available width.")
 
-        horiz_border = self.pc.apply_style('horiz_border', self.horiz_border)
-        vert_border = self.pc.apply_style('vert_border', self.vert_border) if self.vert_border else ''
+        horiz_border = self.get_styled('horiz_border', self.horiz_border)
+        vert_border = self.get_styled('vert_border', self.vert_border) if self.vert_border else ''
 
         if horiz_border_top:
             print(horiz_border)
@@ -1547,7 +2143,7 @@ class FrameBuilder:
                                                        self.align_text(line, col_widths[col_num], col_align),
                                                        fill_space=False)
                 else:
-                    aligned_text = self.pc.apply_style(col_style, ' ' * col_widths[col_num], fill_space=False)
+                    aligned_text = self.get_blank(col_widths[col_num], col_style, fill_space=False)
                 row.append(aligned_text)
 
             # Join with padding and col_sep
@@ -1976,9 +2572,6 @@ class FrameBuilder:
         if total_col_width > available_width:
             raise ValueError("Total width of columns exceeds available width.")
 
-        horiz_border = self.pc.apply_style('horiz_border', self.horiz_border)
-        vert_border = self.pc.apply_style('vert_border', self.vert_border) if self.vert_border else ''
-
         border_top, border_left, border_inner, border_right, border_bottom = self.build_styled_border_box(horiz_style='horiz_border', vert_style='vert_border', border_inner=col_sep, border_inner_style=col_sep_style)
 
         if horiz_border_top:
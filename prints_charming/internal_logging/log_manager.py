@@ -1,8 +1,10 @@
 # log_manager.py
 
+import time
 import logging
 import inspect
-from datetime import datetime
+
+from ..timestamp_formatter import TimestampFormatter
 
 
 class LoggingManager:
@@ -14,13 +16,15 @@ class LoggingManager:
         self.logger = logging.getLogger("prints_charming")
         self.log_level = getattr(logging, log_level.upper(), logging.DEBUG)
         self.logger.setLevel(self.log_level)
+        self.timestamp_formatter = TimestampFormatter(ms_sep='.')
 
     def format_message(self, level, message):
         """
         Uses the PrintsCharming instance to format log messages with styles.
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        styled_timestamp = self.pc._apply_style_internal("timestamp", timestamp)
+        styled_timestamp = self.timestamp_formatter.format_styled(
+            time.time(), "timestamp", self.pc._apply_style_internal
+        )
         styled_level = self.pc._apply_style_internal(level.lower(), level.upper())
         styled_message = self.pc._apply_style_internal(level.lower(), message)
 
@@ -9,7 +9,19 @@ from typing import Any, Optional, Dict, Union, List, Tuple, Type
 
 
 from .formatter import PrintsCharmingFormatter
-from .log_handler import PrintsCharmingLogHandler
+from .log_handler import (
+    PrintsCharmingLogHandler,
+    PrintsCharmingQueueHandler,
+    PrintsCharmingRingBufferHandler,
+    CompactLogRecord,
+)
+from .filters import LogSuppressionFilter
+from .archive_handler import PrintsCharmingArchiveHandler
+from .multiprocess import (
+    PrintsCharmingQueueSender,
+    PrintsCharmingSocketSender,
+    PrintsCharmingLogListener,
+)
 from ..prints_charming_defaults import (
     DEFAULT_COLOR_MAP,
     DEFAULT_STYLES,
@@ -101,6 +113,7 @@ def setup_logger(
     critical_exceptions: Optional[Tuple[Type[BaseException], ...]] = None,
     unhandled_exception_debug: bool = False,
     unique: bool = True,
+    suppression: Optional[Dict[str, Any]] = None,
 ) -> logging.Logger:
     """
     Setup and return a logger with customizable handlers and formatters, including
@@ -118,13 +131,45 @@ def setup_logger(
                     'console': {
                         'enabled': True,
                         'use_styles': True,
-                        'formatter': CustomFormatter()
+                        'formatter': CustomFormatter(),
+                        # Optional: format and write on a background thread
+                        # using PrintsCharmingQueueHandler
+                        'queued': True,
+                        'queue_size': 10000,
+                        'overflow_policy': 'block',  # or 'drop', 'drop_oldest'
+                        'batch_size': 256,
+                        # Optional: per-handler LogSuppressionFilter options
+                        'suppression': {'rate': 5, 'burst': 10}
                     },
                     'file': {
                         'path': '/path/to/log',
                         'use_styles': False,
                         'level': logging.INFO
                     },
+                    'archive': {
+                        # Plain, compressed and rotated on a background thread
+                        'path': '/path/to/app.log.gz',
+                        'compression': 'gzip',  # 'bz2', 'lzma', 'zstd' or None
+                        'max_bytes': 104857600,
+                        'backup_count': 5,
+                        'fsync_interval': 1.0
+                    },
+                    'ring_buffer': {
+                        # Keeps the last `capacity` records in memory for a
+                        # TUI pane; see PrintsCharmingRingBufferHandler.render_window
+                        'capacity': 1000,
+                        'width': 80
+                    },
+                    'process_queue': {
+                        # In a child process: send raw records to a
+                        # PrintsCharmingLogListener in the parent, which
+                        # styles and writes them
+                        'queue': multiprocessing_queue
+                    },
+                    'unix_socket': {
+                        # Same, over the listener's local Unix socket
+                        'path': '/tmp/app-logs.sock'
+                    },
                     'custom_handler': {
                         'handler': MyCustomHandler(),
                         'formatter': CustomFormatter(),
@@ -144,6 +189,11 @@ def setup_logger(
         unhandled_exception_debug (bool): Debug mode for unhandled exceptions.
         unique (bool): If True (default), create a unique logger if the specified
             or derived name already exists.
+        suppression (Optional[Dict[str, Any]]): Keyword arguments for a
+            LogSuppressionFilter added to the logger, which coalesces identical
+            consecutive records and optionally rate limits each call site
+            before any formatting happens. Example:
+                {'coalesce_duplicates': True, 'rate': 10, 'burst': 20, 'summary_interval': 60}
 
     Returns:
         logging.Logger: Configured logger instance with specified handlers.
@@ -175,6 +225,9 @@ def setup_logger(
     # Attach the `pc` instance to the logger for future access
     logger.pc = pc
 
+    if suppression is not None:
+        LogSuppressionFilter(**suppression).attach(logger)
+
     if enable_unhandled_exception_logging:
         set_custom_excepthook_with_logging(
             logger,
@@ -234,7 +287,25 @@ def setup_logger(
         """
 
         if handler_name == 'console':
+            if config.get('queued', False):
+                return PrintsCharmingQueueHandler(
+                    pc=pc,
+                    queue_size=config.get('queue_size', 10000),
+                    overflow_policy=config.get('overflow_policy', 'block'),
+                    block_timeout=config.get('block_timeout'),
+                    batch_size=config.get('batch_size', 256),
+                )
             return PrintsCharmingLogHandler(pc=pc)
+        elif handler_name == 'ring_buffer':
+            return PrintsCharmingRingBufferHandler(
+                pc=pc,
+                capacity=config.get('capacity', 1000),
+                container_width=config.get('width'),
+            )
+        elif handler_name == 'process_queue':
+            return PrintsCharmingQueueSender(config['queue'])
+        elif handler_name == 'unix_socket':
+            return PrintsCharmingSocketSender(config['path'])
         elif handler_name == 'file':
             return logging.FileHandler(config['path'])  # Use standard FileHandler
         elif handler_name == 'rotating_file':
@@ -243,6 +314,17 @@ def setup_logger(
                 maxBytes=config.get('max_bytes', 10485760),
                 backupCount=config.get('backup_count', 5)
             )
+        elif handler_name == 'archive':
+            return PrintsCharmingArchiveHandler(
+                config['path'],
+                compression=config.get('compression', 'gzip'),
+                compresslevel=config.get('compresslevel', 6),
+                max_bytes=config.get('max_bytes', 0),
+                backup_count=config.get('backup_count', 5),
+                fsync_interval=config.get('fsync_interval', 1.0),
+                queue_size=config.get('queue_size', 10000),
+                batch_size=config.get('batch_size', 512),
+            )
         elif handler_name == 'syslog':
             return logging.handlers.SysLogHandler(address=config.get('address', '/dev/log'))
         elif handler_name == 'smtp':
@@ -300,7 +382,8 @@ def setup_logger(
         if not handler:
             continue  # Skip if no handler was created
 
-        use_styles = config.get('use_styles', True)
+        # Archives are plain text unless styles are explicitly requested
+        use_styles = config.get('use_styles', handler_name != 'archive')
         custom_formatter = config.get('formatter')  # User-supplied custom formatter (optional)
 
         # Determine the formatter to use (custom or default)
@@ -312,11 +395,17 @@ def setup_logger(
         # Add the handler to the logger
         add_handler(handler, handler_level, log_formatter)
 
+        if config.get('suppression') is not None:
+            LogSuppressionFilter(**config['suppression']).attach(handler)
+
     return logger
 
 
 
-__all__ = ['PrintsCharmingFormatter', 'PrintsCharmingLogHandler', 'setup_logger']
+__all__ = ['PrintsCharmingFormatter', 'PrintsCharmingLogHandler', 'PrintsCharmingQueueHandler',
+           'PrintsCharmingRingBufferHandler', 'CompactLogRecord', 'LogSuppressionFilter',
+           'PrintsCharmingArchiveHandler', 'PrintsCharmingQueueSender', 'PrintsCharmingSocketSender', 'PrintsCharmingLogListener',
+           'setup_logger']
 
 
 
@@ -0,0 +1,277 @@
+# prints_charming.logging.archive_handler.py
+
+import os
+import bz2
+import gzip
+import lzma
+import time
+import queue
+import logging
+import threading
+from typing import BinaryIO, List, Optional
+
+from ..regex_patterns import ansi_escape_patterns
+
+
+
+
+def _open_zstd(raw: BinaryIO, level: int) -> BinaryIO:
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        raise ValueError("zstd compression requires Python 3.14 or newer (compression.zstd).")
+    return zstd.ZstdFile(raw, 'ab', level=level)
+
+
+
+
+class PrintsCharmingArchiveHandler(logging.Handler):
+    """
+    Background archival handler writing plain, compressed log files.
+
+    `emit` only enqueues the record. A writer thread formats the records,
+    strips any ANSI codes, compresses them, rotates the file when it reaches
+    `max_bytes` and calls `os.fsync` at most once per `fsync_interval`
+    seconds.
+
+    Compression is one of 'gzip', 'bz2', 'lzma', 'zstd' (Python 3.14+) or
+    None. gzip output is sync-flushed before each fsync, so everything up to
+    the last fsync can be recovered from the active file (`zcat` reads it and
+    reports the missing trailer). bz2, lzma and zstd streams are only
+    complete once rotated or closed.
+
+    When an existing archive is reopened, its size on disk counts towards
+    `max_bytes` (the compressed size for compressed formats, a lower bound of
+    the uncompressed size). Records emitted after `close()` are dropped and
+    counted in `dropped_records`. Write and fsync errors are reported through
+    `handleError`.
+
+    Attributes:
+        path (str): Path of the active archive file.
+        compression (Optional[str]): Compression format.
+        max_bytes (int): Uncompressed bytes written before rotating. 0 disables rotation.
+        backup_count (int): Number of rotated files kept.
+        fsync_interval (float): Minimum seconds between fsyncs.
+        dropped_records (int): Records dropped because the queue was full or
+            the handler was closed.
+    """
+
+    compressions = ('gzip', 'bz2', 'lzma', 'zstd', None)
+
+    _openers = {
+        'gzip': lambda raw, level: gzip.GzipFile(fileobj=raw, mode='ab', compresslevel=level),
+        'bz2': lambda raw, level: bz2.BZ2File(raw, 'ab', compresslevel=level),
+        'lzma': lambda raw, level: lzma.LZMAFile(raw, 'ab', preset=level),
+        'zstd': _open_zstd,
+        None: lambda raw, level: raw,
+    }
+
+    _ansi_pattern = ansi_escape_patterns['all']
+
+    _sentinel = None
+
+    def __init__(
+        self,
+        path: str,
+        compression: Optional[str] = 'gzip',
+        compresslevel: int = 6,
+        max_bytes: int = 0,
+        backup_count: int = 5,
+        fsync_interval: float = 1.0,
+        queue_size: int = 10000,
+        batch_size: int = 512,
+        formatter: Optional[logging.Formatter] = None,
+        encoding: str = 'utf-8'
+    ) -> None:
+        """
+        Initialize the PrintsCharmingArchiveHandler.
+
+        Args:
+            path (str): Path of the archive file, e.g. 'app.log.gz'.
+            compression (Optional[str]): 'gzip', 'bz2', 'lzma', 'zstd' or None.
+            compresslevel (int): Compression level (preset for lzma).
+            max_bytes (int): Uncompressed bytes written before rotating to
+                `path.1`, `path.2`, ... 0 disables rotation.
+            backup_count (int): Number of rotated files kept.
+            fsync_interval (float): Minimum seconds between fsyncs. 0 fsyncs
+                after every batch.
+            queue_size (int): Maximum number of pending records. When full,
+                new records are dropped and counted in dropped_records.
+            batch_size (int): Maximum number of records written per batch.
+            formatter (Optional[logging.Formatter]): Formatter to use. Output
+                is stripped of ANSI codes, but a non-styled formatter avoids
+                the styling work entirely.
+            encoding (str): Text encoding.
+
+        Raises:
+            ValueError: If the compression format is unknown.
+        """
+        if compression not in self.compressions:
+            raise ValueError(
+                f"Invalid compression '{compression}'. "
+                f"Choose from {list(self.compressions)}."
+            )
+        super().__init__()
+        if formatter:
+            self.setFormatter(formatter)
+
+        self.path = os.path.abspath(path)
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.fsync_interval = fsync_interval
+        self.batch_size = max(1, batch_size)
+        self.encoding = encoding
+        self.dropped_records = 0
+
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._raw: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+        self._bytes_written = 0
+        self._last_fsync = 0.0
+        self._dirty = False
+        self._last_record: Optional[logging.LogRecord] = None
+        self._closed = False
+
+        self._open()
+        self._writer_thread = threading.Thread(
+            target=self._monitor, name=f"{self.__class__.__name__}-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a record for the writer thread. Records emitted after
+        `close()` are dropped and counted.
+
+        Args:
+            record (logging.LogRecord): The log record.
+        """
+        if self._closed:
+            self.dropped_records += 1
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._writer_thread and self._writer_thread.is_alive():
+            self.queue.join()
+
+    def close(self) -> None:
+        """Write pending records, stop the writer thread and close the file."""
+        try:
+            # Handler.handle holds the lock around emit, so no record can be
+            # queued behind the sentinel
+            self.acquire()
+            try:
+                self._closed = True
+            finally:
+                self.release()
+            if self._writer_thread:
+                self.queue.put(self._sentinel)
+                self._writer_thread.join()
+                self._writer_thread = None
+            self._close_stream()
+        finally:
+            super().close()
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._raw = open(self.path, 'ab')
+        self._stream = self._openers[self.compression](self._raw, self.compresslevel)
+        # A reopened archive keeps counting towards max_bytes from its current size
+        self._bytes_written = os.fstat(self._raw.fileno()).st_size
+
+    def _close_stream(self) -> None:
+        if self._stream is None:
+            return
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+        self._stream = self._raw = None
+
+    def _rotate(self) -> None:
+        """Close the active file and shift it to path.1, path.1 to path.2, and so on."""
+        self._close_stream()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def _sync(self) -> None:
+        """Flush buffered data to disk."""
+        if self.compression == 'gzip':
+            self._stream.flush()  # Sync flush, keeps the file readable
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._last_fsync = time.monotonic()
+        self._dirty = False
+
+    def _format(self, record: logging.LogRecord) -> str:
+        text = self.format(record)
+        if '\x1b' in text:
+            text = self._ansi_pattern.sub('', text)
+        return text
+
+    def _monitor(self) -> None:
+        """Writer thread: drain records in batches, compress, rotate and fsync."""
+        q = self.queue
+        running = True
+        while running:
+            try:
+                # Wake up after fsync_interval to sync data written by the last batch
+                batch = [q.get(timeout=self.fsync_interval if self._dirty else None)]
+            except queue.Empty:
+                try:
+                    self._sync()
+                except Exception:
+                    # Reported once; the next write marks the stream dirty again
+                    self._dirty = False
+                    self.handleError(self._last_record)
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines: List[str] = []
+            for record in batch:
+                if record is self._sentinel:
+                    running = False
+                    continue
+                self._last_record = record
+                try:
+                    lines.append(self._format(record))
+                except Exception:
+                    self.handleError(record)
+
+            try:
+                if lines:
+                    data = ('\n'.join(lines) + '\n').encode(self.encoding, 'replace')
+                    self._stream.write(data)
+                    self._bytes_written += len(data)
+                    self._dirty = True
+
+                    if self.max_bytes and self._bytes_written >= self.max_bytes:
+                        self._rotate()
+                    elif time.monotonic() - self._last_fsync >= self.fsync_interval:
+                        self._sync()
+            except Exception:
+                self.handleError(self._last_record)
+            finally:
+                for _ in batch:
+                    q.task_done()
@@ -0,0 +1,265 @@
+# prints_charming.logging.filters.py
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple, Union
+
+
+
+
+class LogSuppressionFilter(logging.Filter):
+    """
+    Filter that coalesces identical consecutive records and rate limits each
+    call site with a token bucket.
+
+    Filters run in `Logger.handle`/`Handler.handle` before any formatter is
+    called, so suppressed records never reach `PrintsCharmingFormatter`.
+
+    Suppressed records are reported through summary records handed to the
+    attached target (the logger or handler the filter was added to):
+
+    - "last message repeated N times" when a different record arrives or
+      the summary interval elapses, and
+    - "suppressed N records from <file>:<line>" for rate-limited call sites,
+      every `summary_interval` seconds.
+
+    Summaries are checked lazily when records arrive: no timer thread is
+    started, so once `summary_interval` has elapsed a pending summary is only
+    emitted with the next record that passes through the filter. Call
+    `flush()` (for example at shutdown or from your own timer) to emit
+    pending summaries immediately.
+
+    Records are compared by call site, level, template and the `repr` of
+    their args, so args that cannot be compared by value (numpy arrays,
+    DataFrames) are safe. Records whose args cannot be repr'd are never
+    treated as duplicates.
+
+    Attributes:
+        coalesce_duplicates (bool): Whether identical consecutive records are coalesced.
+        rate (Optional[float]): Records per second allowed per call site, or None.
+        burst (int): Token bucket capacity per call site.
+        summary_interval (float): Seconds between rate-limit summaries.
+        max_call_sites (int): Maximum number of call-site buckets kept.
+    """
+
+    summary_attr = '_pc_suppression_summary'
+
+    def __init__(
+        self,
+        coalesce_duplicates: bool = True,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        summary_interval: float = 60.0,
+        max_call_sites: int = 1024,
+        target: Optional[Union[logging.Logger, logging.Handler]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize the LogSuppressionFilter.
+
+        Args:
+            coalesce_duplicates (bool): Coalesce identical consecutive records
+                (same call site, level, template and args).
+            rate (Optional[float]): Records per second allowed per call site.
+                None disables rate limiting.
+            burst (Optional[int]): Token bucket capacity per call site.
+                Defaults to `max(1, rate)`.
+            summary_interval (float): Seconds between rate-limit summaries.
+            max_call_sites (int): Maximum number of call-site buckets kept.
+                The least recently used bucket is dropped beyond this, after
+                reporting any records it suppressed.
+            target (Optional[Union[logging.Logger, logging.Handler]]): Where
+                summary records are sent. Set automatically by `attach`.
+            clock (Callable[[], float]): Monotonic clock, replaceable for tests.
+
+        Raises:
+            ValueError: If rate, burst, summary_interval or max_call_sites is not positive.
+        """
+        super().__init__()
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst is not None and burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        if summary_interval <= 0:
+            raise ValueError(f"summary_interval must be positive, got {summary_interval}")
+        if max_call_sites < 1:
+            raise ValueError(f"max_call_sites must be at least 1, got {max_call_sites}")
+
+        self.coalesce_duplicates = coalesce_duplicates
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.summary_interval = summary_interval
+        self.max_call_sites = max_call_sites
+        self.target = target
+        self.clock = clock
+
+        self._lock = threading.RLock()
+
+        # Duplicate coalescing state
+        self._last_key: Optional[Tuple[Any, ...]] = None
+        self._last_record: Optional[logging.LogRecord] = None
+        self._repeat_count = 0
+
+        # (pathname, lineno) -> [tokens, last refill time, suppressed count, last suppressed record],
+        # in least recently used order
+        self._buckets: 'OrderedDict[Tuple[str, int], list]' = OrderedDict()
+        self._next_summary = self.clock() + summary_interval
+
+
+    def attach(self, target: Union[logging.Logger, logging.Handler]) -> 'LogSuppressionFilter':
+        """
+        Add the filter to a logger or handler and send summaries to it.
+
+        Args:
+            target (Union[logging.Logger, logging.Handler]): Logger or handler.
+
+        Returns:
+            LogSuppressionFilter: self, for chaining.
+        """
+        self.target = target
+        target.addFilter(self)
+        return self
+
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether a record is emitted. Only the record's call site,
+        level, template and args are inspected, never its formatted output.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            bool: True if the record should be emitted.
+        """
+        if record.__dict__.get(self.summary_attr):
+            return True
+
+        summaries = []
+        with self._lock:
+            now = self.clock()
+
+            key = self._duplicate_key(record) if self.coalesce_duplicates else None
+            if key is not None and self._last_record is not None and key == self._last_key:
+                self._repeat_count += 1
+                allowed = False
+            else:
+                allowed = self.rate is None or self._consume_token(record, now, summaries)
+                if self.coalesce_duplicates:
+                    # A different record ends the run of repeats. Only an emitted
+                    # record can be repeated: repeats of a rate-limited one are
+                    # rate limited as well.
+                    summaries.extend(self._take_repeat_summary())
+                    self._last_key = key if allowed else None
+                    self._last_record = record if allowed else None
+
+            if now >= self._next_summary:
+                summaries.extend(self._take_repeat_summary())
+                summaries.extend(self._take_rate_summaries(now))
+
+        for summary in summaries:
+            self._emit_summary(summary)
+
+        return allowed
+
+
+    def flush(self) -> None:
+        """Emit any pending repeat and rate-limit summaries now."""
+        with self._lock:
+            summaries = self._take_repeat_summary()
+            summaries.extend(self._take_rate_summaries(self.clock()))
+            self._last_key = None
+            self._last_record = None
+        for summary in summaries:
+            self._emit_summary(summary)
+
+
+    @staticmethod
+    def _duplicate_key(record: logging.LogRecord) -> Optional[Tuple[Any, ...]]:
+        """
+        Build the key identical consecutive records share, or None if the
+        record's template or args cannot be represented.
+        """
+        try:
+            return (
+                record.name, record.levelno, record.pathname, record.lineno,
+                repr(record.msg), repr(record.args)
+            )
+        except Exception:
+            return None
+
+
+    def _consume_token(self, record: logging.LogRecord, now: float, summaries: list) -> bool:
+        """
+        Refill the call site's bucket and take a token if one is available.
+        A summary for an evicted bucket is appended to `summaries`.
+        """
+        site = (record.pathname, record.lineno)
+        bucket = self._buckets.get(site)
+        if bucket is None:
+            bucket = self._buckets[site] = [float(self.burst), now, 0, None]
+            if len(self._buckets) > self.max_call_sites:
+                (_, evicted_lineno), evicted = self._buckets.popitem(last=False)
+                if evicted[2]:
+                    summaries.append(self._make_rate_summary(evicted, evicted_lineno))
+        else:
+            self._buckets.move_to_end(site)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return True
+
+        bucket[2] += 1
+        bucket[3] = record
+        return False
+
+
+    def _take_repeat_summary(self) -> list:
+        """Return the pending "last message repeated" summary and reset the count."""
+        if not self._repeat_count:
+            return []
+        summary = self._make_summary(
+            self._last_record, f"last message repeated {self._repeat_count} times"
+        )
+        self._repeat_count = 0
+        return [summary]
+
+
+    def _take_rate_summaries(self, now: float) -> list:
+        """Return summaries for rate-limited call sites and reset their counts."""
+        self._next_summary = now + self.summary_interval
+        summaries = []
+        for (pathname, lineno), bucket in self._buckets.items():
+            if bucket[2]:
+                summaries.append(self._make_rate_summary(bucket, lineno))
+                bucket[2] = 0
+                bucket[3] = None
+        return summaries
+
+
+    def _make_rate_summary(self, bucket: list, lineno: int) -> logging.LogRecord:
+        """Create the "suppressed N records" summary for a call-site bucket."""
+        return self._make_summary(
+            bucket[3],
+            f"suppressed {bucket[2]} records from {bucket[3].filename}:{lineno} "
+            f"(rate limit {self.rate:g}/s)"
+        )
+
+
+    def _make_summary(self, record: logging.LogRecord, message: str) -> logging.LogRecord:
+        """Create a summary record at the call site and level of `record`."""
+        summary = logging.LogRecord(
+            record.name, record.levelno, record.pathname, record.lineno,
+            message, None, None, func=record.funcName
+        )
+        setattr(summary, self.summary_attr, True)
+        return summary
+
+
+    def _emit_summary(self, summary: logging.LogRecord) -> None:
+        if self.target is not None:
+            self.target.handle(summary)
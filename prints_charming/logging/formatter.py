@@ -2,7 +2,8 @@
 
 import logging
 import copy
-import time
+import warnings
+from collections import OrderedDict
 from socket import gethostname
 from typing import Any, Callable, Dict, Optional, Union
 
@@ -14,6 +15,8 @@ from ..prints_charming_defaults import (
 )
 
 from ..prints_charming import PrintsCharming
+from ..timestamp_formatter import TimestampFormatter
+from .render_cache import RecordRenderCache
 
 
 
@@ -32,6 +35,9 @@ class PrintsCharmingFormatter(logging.Formatter):
         level_styles (Dict[int, str]): Mapping from log levels to style names.
         use_styles (bool): Whether to apply styles.
         _style_cache (Dict[str, str]): Cache for style codes.
+        _level_labels (Dict[int, str]): Precomputed styled `LOG[LEVEL]` labels.
+        _prefix_cache (OrderedDict): Bounded LRU of styled static prefixes per call site.
+        timestamp_formatter (TimestampFormatter): Per-second cached timestamp formatting.
     """
 
     def __init__(
@@ -43,7 +49,8 @@ class PrintsCharmingFormatter(logging.Formatter):
         level_styles: Optional[Dict[int, str]] = None,
         use_styles: bool = True,
         args_style_name: str = 'args',
-        internal_logging: bool = False
+        internal_logging: bool = False,
+        call_site_cache_size: int = 1024
     ) -> None:
         """
         Initialize the PrintsCharmingFormatter.
@@ -56,6 +63,8 @@ class PrintsCharmingFormatter(logging.Formatter):
             level_styles (Optional[Dict[int, str]]): Mapping from log levels to style names.
             use_styles (bool): Whether to apply styles.
             internal_logging (bool): Whether internal logging is enabled.
+            call_site_cache_size (int): Maximum number of call sites whose
+                styled static prefix is cached.
         """
         super().__init__(datefmt=datefmt, style=style)
         self.pc = pc or PrintsCharming(styles=copy.deepcopy(DEFAULT_STYLES))
@@ -83,6 +92,32 @@ class PrintsCharmingFormatter(logging.Formatter):
         self.args_style_name = args_style_name
         self._style_cache: Dict[str, str] = {}
 
+        self.styled_hostname = self.apply_style('hostname', self.hostname)
+        self._level_labels: Dict[int, str] = {
+            levelno: self.build_log_level_label(levelno)
+            for levelno in self.level_styles
+        }
+        self.call_site_cache_size = call_site_cache_size
+        self._prefix_cache: 'OrderedDict[tuple, str]' = OrderedDict()
+
+        self.timestamp_formatter = TimestampFormatter(datefmt=datefmt, ms_sep=',')
+        self._msecs_head, _, self._msecs_tail = self.apply_style('default', '\x00').partition('\x00')
+
+
+    def clear_caches(self) -> None:
+        """
+        Clears the cached level labels and call-site prefixes. Call this after
+        editing the styles used by the formatter.
+        """
+        self.styled_hostname = self.apply_style('hostname', self.hostname)
+        self._level_labels = {
+            levelno: self.build_log_level_label(levelno)
+            for levelno in self.level_styles
+        }
+        self._prefix_cache.clear()
+        self.timestamp_formatter.clear()
+        self._msecs_head, _, self._msecs_tail = self.apply_style('default', '\x00').partition('\x00')
+
 
 
     @property
@@ -119,17 +154,50 @@ class PrintsCharmingFormatter(logging.Formatter):
         Returns:
             str: Formatted timestamp.
         """
-        t = time.localtime(record.created)
+        # The seconds part is formatted once per second and cached
         if datefmt:
-            s = time.strftime(datefmt, t)
+            s = self.timestamp_formatter.format_seconds(record.created, datefmt)
             if '%f' in datefmt:
                 # Replace the microsecond directive (%f) with milliseconds
                 s = s.replace('%f', ms_format.format(record.msecs))
         else:
-            s = f"{t.tm_year}-{t.tm_mon:02}-{t.tm_mday:02} {t.tm_hour:02}:{t.tm_min:02}:{t.tm_sec:02},{ms_format.format(record.msecs)}"
+            s = f"{self.timestamp_formatter.format_seconds(record.created)},{ms_format.format(record.msecs)}"
         return s
 
 
+    def format_styled_timestamp(self, record: logging.LogRecord, timestamp: str) -> str:
+        """
+        Styles the timestamp and appends the styled milliseconds. Unless the
+        date format contains `%f`, the styled seconds come from the per-second
+        cache and only the milliseconds are added per record. Without a date
+        format the milliseconds from `formatTime` are placed inside the cached
+        style span, so the output matches styling the whole timestamp.
+
+        Args:
+            record (logging.LogRecord): The log record.
+            timestamp (str): Timestamp returned by `formatTime`.
+
+        Returns:
+            str: Styled timestamp.
+        """
+        timestamp_style = self.get_timestamp_style(record)
+        seconds = self.timestamp_formatter.format_seconds(record.created) if not self.datefmt else None
+        if self.datefmt and '%f' not in self.datefmt:
+            styled_timestamp_part = self.timestamp_formatter.format_styled(
+                record.created, timestamp_style, self.apply_style,
+                datefmt=self.datefmt, include_msecs=False
+            )
+        elif seconds is not None and timestamp.startswith(seconds):
+            head, tail = self.timestamp_formatter.get_styled_parts(
+                record.created, timestamp_style, self.apply_style
+            )
+            styled_timestamp_part = f"{head}{timestamp[len(seconds):]}{tail}"
+        else:
+            styled_timestamp_part = self.apply_style(timestamp_style, timestamp)
+
+        return f"{styled_timestamp_part}{self._msecs_head}{int(record.msecs):04.0f}{self._msecs_tail}"
+
+
     def get_log_level_style(self, record: logging.LogRecord) -> str:
         """
         Returns the style for the current log level.
@@ -143,8 +211,23 @@ class PrintsCharmingFormatter(logging.Formatter):
         return self.level_styles.get(record.levelno, 'default')
 
 
+    def build_log_level_label(self, levelno: int) -> str:
+        """
+        Builds the styled log level label for a level number.
+
+        Args:
+            levelno (int): The log level number.
+
+        Returns:
+            str: Styled log level label.
+        """
+        levelname = logging.getLevelName(levelno)
+        log_level_label = f"LOG[{levelname}]" + ' ' * (8 - len(levelname))
+        return self.apply_style(self.level_styles.get(levelno, 'default'), log_level_label)
+
+
     def format_log_level_label(self, record: logging.LogRecord) -> str:
-        """Constructs the log level label.
+        """Returns the precomputed log level label, building it for unknown levels.
 
         Args:
             record (logging.LogRecord): The log record.
@@ -152,30 +235,108 @@ class PrintsCharmingFormatter(logging.Formatter):
         Returns:
             str: Styled log level label.
         """
-        log_level_label = f"LOG[{record.levelname}]" + ' ' * (8 - len(record.levelname))
-        return self.apply_style(self.get_log_level_style(record), log_level_label)
+        label = self._level_labels.get(record.levelno)
+        if label is None:
+            label = self._level_labels[record.levelno] = self.build_log_level_label(record.levelno)
+        return label
+
 
+    def build_styled_prefix(
+        self,
+        pathname: str,
+        funcName: str,
+        lineno: int,
+        levelno: int,
+        name: str,
+        filename: str
+    ) -> str:
+        """
+        Builds the styled static part of a log line for a call site: the level
+        label followed by hostname, filename, logger name, function name and
+        line number. Results are memoized by `get_styled_prefix`.
 
-    def style_record_attributes(self, record: logging.LogRecord) -> None:
+        Returns:
+            str: Styled prefix that precedes the record message.
         """
-        Styles the record attributes (hostname, filename, etc.).
+        label = self._level_labels.get(levelno)
+        if label is None:
+            label = self._level_labels[levelno] = self.build_log_level_label(levelno)
+
+        return (
+            f"{label}{self.space}{self.styled_hostname}{self.padded_dash}"
+            f"{self.apply_style('filename', filename)}{self.space}"
+            f"{self.apply_style('record_name', name)}{self.space}"
+            f"{self.apply_style('method_name', funcName)}{self.colon}"
+            f"{self.apply_style('line_number', lineno)}{self.padded_dash}"
+        )
+
+
+    def get_styled_prefix(self, record: logging.LogRecord) -> str:
+        """
+        Returns the cached styled prefix for the record's call site.
 
         Args:
             record (logging.LogRecord): The log record.
+
+        Returns:
+            str: Styled prefix that precedes the record message.
+        """
+        key = (
+            record.pathname, record.funcName, record.lineno, record.levelno,
+            record.name, record.filename
+        )
+        cache = self._prefix_cache
+        prefix = cache.get(key)
+        if prefix is None:
+            prefix = cache[key] = self.build_styled_prefix(*key)
+            if len(cache) > self.call_site_cache_size:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    pass  # Evicted concurrently by another thread
+        else:
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass
+        return prefix
+
+
+    def style_record_attributes(self, record: logging.LogRecord) -> Dict[str, str]:
         """
-        record.hostname = self.apply_style('hostname', self.hostname)
-        record.filename = self.apply_style('filename', record.filename)
-        record.name = self.apply_style('record_name', record.name)
-        record.funcName = self.apply_style('method_name', record.funcName)
-        record.lineno = self.apply_style('line_number', record.lineno)
+        Returns the styled record attributes (hostname, filename, etc.).
+
+        Deprecated: `format` uses the cached prefix from `get_styled_prefix`.
+        The record is no longer modified; the styled values are returned
+        instead of being set on it.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            Dict[str, str]: Styled `hostname`, `filename`, `name`, `funcName` and `lineno`.
+        """
+        warnings.warn(
+            "style_record_attributes is deprecated; use get_styled_prefix instead.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return {
+            'hostname': self.styled_hostname,
+            'filename': self.apply_style('filename', record.filename),
+            'name': self.apply_style('record_name', record.name),
+            'funcName': self.apply_style('method_name', record.funcName),
+            'lineno': self.apply_style('line_number', record.lineno),
+        }
 
 
     def format_message(
         self,
         record: logging.LogRecord,
         log_level_style_code: str,
-        log_level_label: str,
-        timestamp: str
+        styled_prefix: str,
+        timestamp: str,
+        message: str
     ) -> str:
         """
         Constructs the final log message.
@@ -183,19 +344,17 @@ class PrintsCharmingFormatter(logging.Formatter):
         Args:
             record (logging.LogRecord): The log record.
             log_level_style_code (str): Style code for the log level.
-            log_level_label (str): Styled log level label.
+            styled_prefix (str): Cached styled call-site prefix, including the
+                log level label.
             timestamp (str): Formatted timestamp.
+            message (str): Styled message from `format_record_message`.
 
         Returns:
             str: Final formatted log message.
         """
-        #styled_timestamp = self.apply_style(self.get_timestamp_style(record), timestamp) + f"{int(record.msecs):04.0f}"
-        styled_timestamp_part = self.apply_style(self.get_timestamp_style(record), timestamp)
-        styled_msecs = self.apply_style('default', f"{int(record.msecs):04.0f}")
-        styled_timestamp = styled_timestamp_part + styled_msecs
-        styled_log_level_prefix = log_level_label
+        styled_timestamp = self.format_styled_timestamp(record, timestamp)
 
-        return f"{styled_timestamp}{self.space}{styled_log_level_prefix}{self.space}{record.msg}"
+        return f"{styled_timestamp}{self.space}{styled_prefix}{message}"
 
 
     def get_timestamp_style(self, record: logging.LogRecord) -> str:
@@ -223,13 +382,13 @@ class PrintsCharmingFormatter(logging.Formatter):
         """
         timestamp = f"{self.formatTime(record, self.datefmt)}"
         log_level_style_code = self.get_style_code(self.get_log_level_style(record))
-        log_level_label = self.format_log_level_label(record)
 
         if self.use_styles:
-            self.style_record_attributes(record)
-            self.format_record_message(record, log_level_style_code)
-            log_message = self.format_message(record, log_level_style_code, log_level_label, timestamp)
+            styled_prefix = self.get_styled_prefix(record)
+            message = self.format_record_message(record, log_level_style_code)
+            log_message = self.format_message(record, log_level_style_code, styled_prefix, timestamp, message)
         else:
+            log_level_label = self.format_log_level_label(record)
             log_message = self.format_plain_message(record, timestamp, log_level_label)
 
         return log_message
@@ -239,25 +398,37 @@ class PrintsCharmingFormatter(logging.Formatter):
         self,
         record: logging.LogRecord,
         log_level_style_code: str
-    ) -> None:
+    ) -> str:
         """
-        Formats the `record.msg`.
+        Formats the record message with styled args. The record is not
+        modified; the parsed message is kept in the record's
+        `RecordRenderCache` and shared with other handlers.
 
         Args:
             record (logging.LogRecord): The log record.
             log_level_style_code (str): Style code for the log level.
+
+        Returns:
+            str: Styled message.
         """
-        if record.args:
-            args_style_code = self.get_style_code(self.args_style_name)
-            record.msg = record.msg.format(*[
-                f"{args_style_code}{arg}{self.reset}{log_level_style_code}" for arg in record.args
-            ])
-            record.args = ()  # Clear args to prevent further formatting
-        record.msg = f"{log_level_style_code}{record.msg}{self.reset}"
-        record.msg = (
-            f"{record.hostname}{self.padded_dash}{record.filename}{self.space}{record.name}{self.space}"
-            f"{record.funcName}{self.colon}{record.lineno}{self.padded_dash}{record.msg}"
-        )
+        render_cache = RecordRenderCache.for_record(record)
+        args_style_code = self.get_style_code(self.args_style_name) if render_cache.args else ''
+        return render_cache.styled_message(args_style_code, log_level_style_code, self.reset)
+
+
+    def prepare_record(self, record: logging.LogRecord) -> None:
+        """
+        Renders the record's message now and keeps it in the record's
+        `RecordRenderCache`, so a later `format` on another thread does not
+        read args that may have changed in the meantime.
+
+        Args:
+            record (logging.LogRecord): The log record.
+        """
+        if self.use_styles:
+            self.format_record_message(record, self.get_style_code(self.get_log_level_style(record)))
+        else:
+            RecordRenderCache.for_record(record).plain_message()
 
 
     def format_plain_message(
@@ -267,7 +438,7 @@ class PrintsCharmingFormatter(logging.Formatter):
         log_level_label: str
     ) -> str:
         """
-        Formats a plain (non-styled) log message.
+        Formats a plain (non-styled) log message without modifying the record.
 
         Args:
             record (logging.LogRecord): The log record.
@@ -277,15 +448,11 @@ class PrintsCharmingFormatter(logging.Formatter):
         Returns:
             str: Plain formatted log message.
         """
-        if record.args:
-            record.msg = record.msg.format(record.args)
-            record.args = ()  # Prevent further formatting attempts
-        #return f"{timestamp} {log_level_label} {self.hostname} - {record.filename} {record.name} {record.funcName}:{record.lineno} - {record.msg}"
-        record.msg = (
-            f"{self.hostname} - {record.filename} {record.name} "
-            f"{record.funcName}:{record.lineno} - {record.msg}"
+        message = RecordRenderCache.for_record(record).plain_message()
+        return (
+            f"{timestamp} {log_level_label} {self.hostname} - {record.filename} {record.name} "
+            f"{record.funcName}:{record.lineno} - {message}"
         )
-        return f"{timestamp} {log_level_label} {record.msg}"
 
 
     def format_orig(self, record: logging.LogRecord) -> str:
@@ -1,8 +1,13 @@
 # prints_charming.logging.log_handler.py
 
 import sys
+import copy
+import time
+import queue
+import shutil
 import logging
-from typing import Optional
+import threading
+from typing import Any, List, NamedTuple, Optional, Tuple
 from .formatter import PrintsCharmingFormatter
 
 
@@ -18,7 +23,10 @@ class PrintsCharmingLogHandler(logging.Handler):
         self,
         pc: 'PrintsCharming',
         formatter: Optional[logging.Formatter] = None,
-        internal_logging: bool = False
+        internal_logging: bool = False,
+        container_width: Optional[int] = None,
+        word_wrap: bool = True,
+        tab_width: int = 8
     ) -> None:
         """
        Initialize the PrintsCharmingLogHandler.
@@ -27,21 +35,70 @@ class PrintsCharmingLogHandler(logging.Handler):
            pc (PrintsCharming): PrintsCharming instance for styling.
            formatter (Optional[logging.Formatter]): Formatter to use.
            internal_logging (bool): Whether internal logging is enabled.
+           container_width (Optional[int]): Width to wrap and pad to. If None,
+               the terminal width is used and kept up to date, through the
+               TerminalSizeWatcher's resize notifications while the
+               watcher is running, or else by re-reading the
+               terminal size at most every `width_poll_interval` seconds.
+           word_wrap (bool): Whether to wrap records wider than the container.
+           tab_width (int): Tab width used for wrapping and padding.
        """
         super().__init__()
         self.pc = pc
-        self.container_width = self.pc.terminal_width
-        self.word_wrap = False,
-        self.tab_width = 8
+        self.track_terminal_width = container_width is None
+        self.container_width = container_width or self.pc.terminal_width
+        self.word_wrap = word_wrap
+        self.tab_width = tab_width
         self.remove_ansi_codes = self.pc.__class__.remove_ansi_codes
         self.fill_to_end = True if self.pc.default_bg_color else False
         self.fill_with = ' '
+        self.reset = self.pc.reset
         self.setFormatter(
             formatter or PrintsCharmingFormatter(
                 pc=pc, internal_logging=internal_logging
             )
         )
 
+        self.term_size_watcher = getattr(self.pc, 'term_size_watcher', None)
+        if self.track_terminal_width and self.term_size_watcher:
+            self.term_size_watcher.add_resize_callback(self.on_terminal_resize)
+
+        # Without a running watcher, the terminal size is polled when records are rendered
+        self.width_poll_interval = 1.0
+        self._width_polled_at = 0.0
+
+    def on_terminal_resize(self, width: int, height: int) -> None:
+        """
+        Resize callback registered with the TerminalSizeWatcher.
+
+        Args:
+            width (int): New terminal width.
+            height (int): New terminal height.
+        """
+        self.container_width = width
+
+    def get_container_width(self) -> int:
+        """
+        Returns the width to wrap and pad to, re-reading the terminal size if
+        it is tracked and no TerminalSizeWatcher is running.
+
+        Returns:
+            int: The container width.
+        """
+        watcher = self.term_size_watcher
+        if self.track_terminal_width and not (watcher and watcher.is_watching):
+            now = time.monotonic()
+            if now - self._width_polled_at >= self.width_poll_interval:
+                self._width_polled_at = now
+                self.container_width = shutil.get_terminal_size((self.container_width or 80, 24)).columns
+        return self.container_width
+
+    def close(self) -> None:
+        """Unregister the resize callback and close the handler."""
+        if self.term_size_watcher:
+            self.term_size_watcher.remove_resize_callback(self.on_terminal_resize)
+        super().close()
+
     def emit(self, record: logging.LogRecord) -> None:
         """
         Emit a log record.
@@ -50,68 +107,527 @@ class PrintsCharmingLogHandler(logging.Handler):
             record (logging.LogRecord): The log record to emit.
         """
         try:
-            formatted_message = self.format(record)
-
-            if self.fill_to_end or self.word_wrap:
-                if self.word_wrap:
-                    # Use the new wrap_styled_text function
-                    wrapped_styled_lines = self.pc.wrap_styled_text(formatted_message, self.container_width, self.tab_width)
-                else:
-                    wrapped_styled_lines = formatted_message.splitlines(keepends=True)
-
-                final_lines = []
-                for line in wrapped_styled_lines:
-
-                    # Calculate the number of trailing newlines
-                    trailing_newlines = len(line) - len(line.rstrip('\n'))
-
-                    # Check if the line is empty (contains only a newline character)
-                    stripped_line = line.rstrip('\n')
-                    has_newline = line.endswith('\n')
-
-                    if self.fill_to_end:
-                        # Calculate the visible length of the line
-                        visible_line = self.remove_ansi_codes(stripped_line)
-                        current_length = self.pc.get_visible_length(visible_line.expandtabs(self.tab_width), tab_width=self.tab_width)
-                        chars_needed = max(0, self.container_width - current_length)
-
-                        # If the line ends with the ANSI reset code, remove it temporarily
-                        has_reset = stripped_line.endswith(self.pc.reset)
-                        if has_reset:
-                            stripped_line = stripped_line[:-len(self.pc.reset)]
-
-                        # Add padding spaces and then the reset code if it was present
-                        padded_line = stripped_line + self.fill_with * chars_needed
-                        if has_reset:
-                            padded_line += self.pc.reset
-
-                        # Re-append the newline character if it was present
-                        if trailing_newlines > 0:
-                            padded_line += '\n' * trailing_newlines
-
-                        final_lines.append(padded_line)
-                    else:
-                        final_lines.append(line)
-
-                # Combine the lines into the final styled output
-                if any(line.endswith('\n') for line in final_lines):
-                    # Lines already contain newline characters; avoid adding extra newlines
-                    final_all_styled_text = ''.join(final_lines)
-                else:
-                    # Lines do not contain newlines; join them with '\n'
-                    final_all_styled_text = '\n'.join(final_lines)
-
-                """
-                # Combine the lines into the final styled output
-                final_all_styled_text = '\n'.join(final_lines)
-                """
+            sys.stdout.write(self.render(record) + '\n')
+
+        except Exception as e:
+            self.handleError(record)
+
+    def visible_width(self, line: str) -> int:
+        """
+        Returns the visible width of a single line, with ANSI codes removed
+        and tabs expanded.
+
+        Args:
+            line (str): The line, without a trailing newline.
+
+        Returns:
+            int: The visible width.
+        """
+        if '\x1b' in line:
+            line = self.remove_ansi_codes(line)
+        if '\t' in line:
+            line = line.expandtabs(self.tab_width)
+        return len(line)
+
+    def pad_line(self, line: str, width: int) -> str:
+        """
+        Pads a line with `fill_with` up to `width` visible characters. A
+        trailing reset code is kept at the end so the padding carries the
+        line's background, and trailing newlines are preserved.
+
+        Args:
+            line (str): The styled line.
+            width (int): The width to pad to.
+
+        Returns:
+            str: The padded line.
+        """
+        stripped_line = line.rstrip('\n')
+        newlines = line[len(stripped_line):]
+
+        chars_needed = width - self.visible_width(stripped_line)
+        if chars_needed <= 0:
+            return line
+
+        if self.reset and stripped_line.endswith(self.reset):
+            return f"{stripped_line[:-len(self.reset)]}{self.fill_with * chars_needed}{self.reset}{newlines}"
+        return f"{stripped_line}{self.fill_with * chars_needed}{newlines}"
+
+    def render(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record and apply wrapping and padding.
+
+        Args:
+            record (logging.LogRecord): The log record to render.
+
+        Returns:
+            str: The rendered text, without a trailing newline.
+        """
+        formatted_message = self.format(record)
+
+        if not (self.fill_to_end or self.word_wrap):
+            return formatted_message
+
+        width = self.get_container_width()
+
+        # Single line that needs no wrapping: pad it directly
+        if '\n' not in formatted_message and (
+                not self.word_wrap
+                or ('\t' not in formatted_message and self.visible_width(formatted_message) <= width)
+        ):
+            return self.pad_line(formatted_message, width) if self.fill_to_end else formatted_message
+
+        if self.word_wrap:
+            wrapped_styled_lines = self.pc.wrap_styled_text(formatted_message, width, self.tab_width)
+        else:
+            wrapped_styled_lines = formatted_message.splitlines(keepends=True)
+
+        if self.fill_to_end:
+            final_lines = [self.pad_line(line, width) for line in wrapped_styled_lines]
+        else:
+            final_lines = wrapped_styled_lines
+
+        # Combine the lines into the final styled output
+        if any(line.endswith('\n') for line in final_lines):
+            # Lines already contain newline characters; avoid adding extra newlines
+            return ''.join(final_lines)
+        # Lines do not contain newlines; join them with '\n'
+        return '\n'.join(final_lines)
+
+
+
+class PrintsCharmingQueueHandler(PrintsCharmingLogHandler):
+    """
+    Non-blocking variant of PrintsCharmingLogHandler.
+
+    Follows `logging.handlers.QueueHandler`/`QueueListener` semantics: `emit`
+    snapshots the record's message (see `prepare`) and enqueues it on the
+    calling thread, while a writer thread formats, wraps and pads records
+    off-thread and writes each drained batch to sys.stdout with a single
+    write.
+
+    Attributes:
+        queue (queue.Queue): Bounded queue of pending log records.
+        overflow_policy (str): What to do when the queue is full: 'block'
+            waits for space, 'drop' discards the new record and 'drop_oldest'
+            discards the oldest pending record.
+        batch_size (int): Maximum number of records written per batch.
+        dropped_records (int): Number of records discarded due to overflow.
+    """
+
+    overflow_policies = ('block', 'drop', 'drop_oldest')
+
+    _sentinel = None
+
+    def __init__(
+        self,
+        pc: 'PrintsCharming',
+        formatter: Optional[logging.Formatter] = None,
+        internal_logging: bool = False,
+        queue_size: int = 10000,
+        overflow_policy: str = 'block',
+        block_timeout: Optional[float] = None,
+        batch_size: int = 256,
+        auto_start: bool = True
+    ) -> None:
+        """
+        Initialize the PrintsCharmingQueueHandler.
+
+        Args:
+            pc (PrintsCharming): PrintsCharming instance for styling.
+            formatter (Optional[logging.Formatter]): Formatter to use.
+            internal_logging (bool): Whether internal logging is enabled.
+            queue_size (int): Maximum number of pending records. 0 means unbounded.
+            overflow_policy (str): 'block', 'drop' or 'drop_oldest'.
+            block_timeout (Optional[float]): Seconds to wait for space with the
+                'block' policy before dropping the record. None waits forever.
+            batch_size (int): Maximum number of records written per batch.
+            auto_start (bool): Start the writer thread immediately.
+        """
+        if overflow_policy not in self.overflow_policies:
+            raise ValueError(
+                f"Invalid overflow_policy '{overflow_policy}'. "
+                f"Choose from {list(self.overflow_policies)}."
+            )
+
+        super().__init__(pc=pc, formatter=formatter, internal_logging=internal_logging)
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.batch_size = max(1, batch_size)
+        self.dropped_records = 0
+        self._drop_lock = threading.Lock()
+        self._writer_thread: Optional[threading.Thread] = None
+
+        if auto_start:
+            self.start()
+
+    def start(self) -> None:
+        """Start the writer thread if it is not already running."""
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+        self._writer_thread = threading.Thread(
+            target=self._monitor, name=f"{self.__class__.__name__}-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def stop(self) -> None:
+        """Write all pending records and stop the writer thread."""
+        if not self._writer_thread:
+            return
+        # The sentinel must not be dropped, so always block here
+        self.queue.put(self._sentinel)
+        self._writer_thread.join()
+        self._writer_thread = None
+
+    def count_dropped(self) -> None:
+        """Count one discarded record. Producers may call this from any thread."""
+        with self._drop_lock:
+            self.dropped_records += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Snapshot the record's message on the calling thread, as
+        `logging.handlers.QueueHandler.prepare` does, so args mutated after
+        the logging call do not change what is written.
+
+        A PrintsCharmingFormatter renders the message into the record's
+        render cache and the record is queued as is. With any other formatter
+        a copy is queued whose `msg` is the merged message and `args` is None.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            logging.LogRecord: The record to enqueue.
+        """
+        if isinstance(self.formatter, PrintsCharmingFormatter):
+            self.formatter.prepare_record(record)
+            return record
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a record according to the overflow policy.
+
+        Args:
+            record (logging.LogRecord): The log record to enqueue.
+        """
+        if self.overflow_policy == 'block':
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self.count_dropped()
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow_policy == 'drop_oldest':
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()
+                except queue.Empty:
+                    pass
+                try:
+                    self.queue.put_nowait(record)
+                    self.count_dropped()
+                    return
+                except queue.Full:
+                    pass
+            self.count_dropped()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Snapshot a log record and enqueue it for the writer thread.
+
+        Args:
+            record (logging.LogRecord): The log record to emit.
+        """
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def _monitor(self) -> None:
+        """Writer thread loop: drain records in batches and write each batch once."""
+        q = self.queue
+        running = True
+        while running:
+            batch: List[logging.LogRecord] = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            rendered = []
+            last_record = None
+            for record in batch:
+                if record is self._sentinel:
+                    running = False
+                    continue
+                last_record = record
+                try:
+                    rendered.append(self.render(record))
+                except Exception:
+                    self.handleError(record)
+
+            try:
+                if rendered:
+                    sys.stdout.write('\n'.join(rendered) + '\n')
+                    sys.stdout.flush()
+            except Exception:
+                self.handleError(last_record)
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._writer_thread and self._writer_thread.is_alive():
+            self.queue.join()
+
+    def close(self) -> None:
+        """Flush pending records, stop the writer thread and close the handler."""
+        try:
+            self.stop()
+        finally:
+            super().close()
+
+
+
+class CompactLogRecord(NamedTuple):
+    """
+    The fields of a LogRecord needed to re-render it later. Args that are not
+    simple values are stored as strings so the buffer does not keep arbitrary
+    objects (or tracebacks) alive.
+    """
+    name: str
+    levelno: int
+    levelname: str
+    pathname: str
+    filename: str
+    module: str
+    funcName: str
+    lineno: int
+    created: float
+    msecs: float
+    msg: str
+    args: Any
+    exc_text: Optional[str]
+
+    _simple_types = (str, int, float, bool, type(None))
+
+    @classmethod
+    def from_record(cls, record: logging.LogRecord, formatter: Optional[logging.Formatter] = None) -> 'CompactLogRecord':
+        """
+        Build a compact record from a LogRecord.
+
+        Args:
+            record (logging.LogRecord): The log record.
+            formatter (Optional[logging.Formatter]): Used to format exc_info.
 
+        Returns:
+            CompactLogRecord: The compact record.
+        """
+        args = record.args
+        if args:
+            if isinstance(args, tuple):
+                args = tuple(arg if isinstance(arg, cls._simple_types) else str(arg) for arg in args)
             else:
-                final_all_styled_text = formatted_message
+                args = {k: v if isinstance(v, cls._simple_types) else str(v) for k, v in dict(args).items()}
 
-            sys.stdout.write(final_all_styled_text + '\n')
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = (formatter or logging.Formatter()).formatException(record.exc_info)
 
-        except Exception as e:
+        return cls(
+            record.name, record.levelno, record.levelname, record.pathname, record.filename,
+            record.module, record.funcName, record.lineno, record.created, record.msecs,
+            str(record.msg), args, exc_text
+        )
+
+    def to_record(self) -> logging.LogRecord:
+        """Rebuild a LogRecord that can be passed to a formatter."""
+        return logging.makeLogRecord(self._asdict())
+
+    def append_exc_text(self, text: str) -> str:
+        """
+        Append the exception text to a record formatted from `to_record`,
+        unless the formatter already included it (`logging.Formatter.format`
+        appends `record.exc_text` itself).
+
+        Args:
+            text (str): The formatted record.
+
+        Returns:
+            str: The formatted record followed by the exception text.
+        """
+        if self.exc_text and self.exc_text not in text:
+            return f"{text}\n{self.exc_text}"
+        return text
+
+
+
+class PrintsCharmingRingBufferHandler(PrintsCharmingLogHandler):
+    """
+    Keeps the last `capacity` records in memory for display in a TUI pane
+    (e.g. a FrameBuilder or PrintsUI box) instead of writing them out.
+
+    Records are stored as CompactLogRecord tuples in a preallocated list used
+    as a ring buffer, so memory stays constant at any log rate. Nothing is
+    formatted on emit; `render_window` formats only the records that are
+    visible, through the handler's formatter, and caches their styled lines
+    per slot until the slot is overwritten or the width changes.
+
+    Attributes:
+        capacity (int): Number of records kept.
+        total_records (int): Number of records emitted since creation.
+    """
+
+    def __init__(
+        self,
+        pc: 'PrintsCharming',
+        capacity: int = 1000,
+        formatter: Optional[logging.Formatter] = None,
+        internal_logging: bool = False,
+        container_width: Optional[int] = None,
+        word_wrap: bool = True,
+        tab_width: int = 8
+    ) -> None:
+        """
+        Initialize the PrintsCharmingRingBufferHandler.
+
+        Args:
+            pc (PrintsCharming): PrintsCharming instance for styling.
+            capacity (int): Number of records kept.
+            formatter (Optional[logging.Formatter]): Formatter to use.
+            internal_logging (bool): Whether internal logging is enabled.
+            container_width (Optional[int]): Default pane width. If None, the
+                terminal width is tracked.
+            word_wrap (bool): Whether records wider than the pane are wrapped
+                onto several lines (otherwise they are cut at the pane width).
+            tab_width (int): Tab width used for wrapping and padding.
+
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        super().__init__(
+            pc=pc, formatter=formatter, internal_logging=internal_logging,
+            container_width=container_width, word_wrap=word_wrap, tab_width=tab_width
+        )
+        self.capacity = capacity
+        self.total_records = 0
+        self._records: List[Optional[CompactLogRecord]] = [None] * capacity
+
+        # Per slot: (sequence number, width, styled lines)
+        self._line_cache: List[Optional[Tuple[int, int, List[str]]]] = [None] * capacity
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Store a compact copy of the record, overwriting the oldest one when full.
+
+        Args:
+            record (logging.LogRecord): The log record to store.
+        """
+        try:
+            compact = CompactLogRecord.from_record(record, self.formatter)
+            slot = self.total_records % self.capacity
+            self._records[slot] = compact
+            self._line_cache[slot] = None
+            self.total_records += 1
+        except Exception:
             self.handleError(record)
 
+    @property
+    def record_count(self) -> int:
+        """Number of records currently stored."""
+        return min(self.total_records, self.capacity)
+
+    def clear(self) -> None:
+        """Discard all stored records and cached lines."""
+        with self.lock:
+            self._records = [None] * self.capacity
+            self._line_cache = [None] * self.capacity
+            self.total_records = 0
 
+    def invalidate(self) -> None:
+        """Drop cached styled lines, e.g. after the formatter's styles changed."""
+        with self.lock:
+            self._line_cache = [None] * self.capacity
+
+    def records(self) -> List[CompactLogRecord]:
+        """
+        Returns the stored records, oldest first.
+
+        Returns:
+            List[CompactLogRecord]: The stored records.
+        """
+        with self.lock:
+            start = self.total_records - self.record_count
+            return [self._records[seq % self.capacity] for seq in range(start, self.total_records)]
+
+    def styled_lines(self, seq: int, width: int) -> List[str]:
+        """
+        Returns the styled, padded lines of the record with sequence number
+        `seq` at the given width, formatting it only on a cache miss.
+
+        Args:
+            seq (int): Sequence number of a stored record.
+            width (int): Pane width.
+
+        Returns:
+            List[str]: The record's lines, each `width` visible characters wide.
+        """
+        slot = seq % self.capacity
+        cached = self._line_cache[slot]
+        if cached is not None and cached[0] == seq and cached[1] == width:
+            return cached[2]
+
+        compact = self._records[slot]
+        text = compact.append_exc_text(self.format(compact.to_record()))
+
+        lines = []
+        for line in text.split('\n'):
+            if self.word_wrap and ('\t' in line or self.visible_width(line) > width):
+                lines.extend(self.pc.wrap_styled_text(line, width, self.tab_width))
+            elif self.visible_width(line) > width:
+                lines.append(self.pc.wrap_styled_text(line, width, self.tab_width)[0] + self.reset)
+            else:
+                lines.append(line)
+
+        lines = [self.pad_line(line, width) for line in lines]
+        self._line_cache[slot] = (seq, width, lines)
+        return lines
+
+    def render_window(self, height: int, width: Optional[int] = None, scroll: int = 0) -> List[str]:
+        """
+        Render the visible window of the buffer: the last `height` lines,
+        ending `scroll` records before the newest one. Only records inside
+        the window are formatted.
+
+        Args:
+            height (int): Number of lines in the pane.
+            width (Optional[int]): Pane width. Defaults to container_width.
+            scroll (int): Number of newest records to skip.
+
+        Returns:
+            List[str]: Up to `height` styled lines, oldest first.
+        """
+        width = width or self.get_container_width()
+        with self.lock:
+            oldest = self.total_records - self.record_count
+            seq = self.total_records - 1 - max(0, scroll)
+            window: List[str] = []
+            while seq >= oldest and len(window) < height:
+                lines = self.styled_lines(seq, width)
+                window[:0] = lines[-(height - len(window)):]
+                seq -= 1
+            return window
@@ -0,0 +1,351 @@
+# prints_charming.logging.multiprocess.py
+
+import os
+import sys
+import json
+import socket
+import struct
+import logging
+import logging.handlers
+import threading
+from queue import Empty, Queue
+from typing import Any, Dict, List, Optional, TextIO
+
+from .log_handler import CompactLogRecord, PrintsCharmingLogHandler
+
+
+
+
+def encode_record(compact: CompactLogRecord) -> bytes:
+    """
+    Encode a compact record as a length-prefixed JSON frame for socket transport.
+
+    Args:
+        compact (CompactLogRecord): The compact record.
+
+    Returns:
+        bytes: 4-byte big-endian length followed by the JSON payload.
+    """
+    payload = json.dumps(compact._asdict(), default=str).encode('utf-8')
+    return struct.pack('>L', len(payload)) + payload
+
+
+def decode_record(payload: bytes) -> CompactLogRecord:
+    """
+    Decode a JSON payload produced by `encode_record` (without the length prefix).
+
+    Args:
+        payload (bytes): The JSON payload.
+
+    Returns:
+        CompactLogRecord: The compact record.
+    """
+    fields = json.loads(payload.decode('utf-8'))
+    if isinstance(fields.get('args'), list):
+        fields['args'] = tuple(fields['args'])
+    return CompactLogRecord(**fields)
+
+
+
+
+class PrintsCharmingQueueSender(logging.handlers.QueueHandler):
+    """
+    Child-process handler that puts CompactLogRecords on a
+    `multiprocessing.Queue` read by a PrintsCharmingLogListener.
+
+    No styling is done in the child; only the record data is sent.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> CompactLogRecord:
+        """
+        Convert the record to a picklable CompactLogRecord.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            CompactLogRecord: The compact record.
+        """
+        return CompactLogRecord.from_record(record)
+
+
+
+
+class PrintsCharmingSocketSender(logging.handlers.SocketHandler):
+    """
+    Child-process handler that sends records to a PrintsCharmingLogListener
+    over a local Unix socket, as length-prefixed JSON frames.
+
+    Reconnection and retry follow `logging.handlers.SocketHandler`. JSON is
+    used instead of pickle so the listener never unpickles socket data.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the PrintsCharmingSocketSender.
+
+        Args:
+            path (str): Path of the listener's Unix socket.
+        """
+        super().__init__(path, None)
+
+    def makePickle(self, record: logging.LogRecord) -> bytes:
+        """
+        Encode the record as a length-prefixed JSON frame.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            bytes: The encoded frame.
+        """
+        return encode_record(CompactLogRecord.from_record(record))
+
+
+
+
+class PrintsCharmingLogListener:
+    """
+    Parent-side listener that receives records from child processes and
+    renders them once, through a PrintsCharmingLogHandler and its
+    PrintsCharmingFormatter.
+
+    Records arrive on `queue` (a `multiprocessing.Queue` shared with
+    PrintsCharmingQueueSender) and/or on a Unix socket at `socket_path`
+    (PrintsCharmingSocketSender). A single writer thread drains up to
+    `batch_size` records at a time and writes each batch with one write, so
+    lines from different processes never tear.
+
+    `stop()` waits up to `drain_timeout` seconds for each socket reader to
+    queue what its sender has already sent, then closes the remaining
+    connections and joins their readers before stopping the writer, so
+    records received before `stop()` are written.
+
+    Attributes:
+        queue (Any): Queue the writer thread drains.
+        socket_path (Optional[str]): Path of the Unix socket, if any.
+        handler (PrintsCharmingLogHandler): Handler used to render records.
+        batch_size (int): Maximum number of records written per batch.
+    """
+
+    _sentinel = None
+
+    # Seconds between checks for stop() while accepting or reading connections
+    poll_interval = 0.5
+
+    drain_timeout = 2.0
+
+    def __init__(
+        self,
+        pc: 'PrintsCharming',
+        queue: Optional[Any] = None,
+        socket_path: Optional[str] = None,
+        handler: Optional[PrintsCharmingLogHandler] = None,
+        stream: Optional[TextIO] = None,
+        batch_size: int = 256,
+        auto_start: bool = True
+    ) -> None:
+        """
+        Initialize the PrintsCharmingLogListener.
+
+        Args:
+            pc (PrintsCharming): PrintsCharming instance for styling.
+            queue (Optional[Any]): Queue shared with the children, typically a
+                `multiprocessing.Queue`. A local queue is created if None.
+            socket_path (Optional[str]): If given, also accept records on a
+                Unix socket at this path.
+            handler (Optional[PrintsCharmingLogHandler]): Handler whose
+                formatter, wrapping and padding are used to render records.
+            stream (Optional[TextIO]): Output stream. Defaults to sys.stdout.
+            batch_size (int): Maximum number of records written per batch.
+            auto_start (bool): Start the listener immediately.
+        """
+        self.pc = pc
+        self.queue = queue if queue is not None else Queue()
+        self.socket_path = socket_path
+        self.handler = handler or PrintsCharmingLogHandler(pc=pc)
+        self.stream = stream
+        self.batch_size = max(1, batch_size)
+
+        self._writer_thread: Optional[threading.Thread] = None
+        self._server_socket: Optional[socket.socket] = None
+        self._server_thread: Optional[threading.Thread] = None
+        self._readers: Dict[threading.Thread, socket.socket] = {}
+        self._readers_lock = threading.Lock()
+        self._stopping = threading.Event()
+
+        if auto_start:
+            self.start()
+
+    def start(self) -> None:
+        """Start the writer thread and, if configured, the socket server."""
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+        self._stopping.clear()
+        self._writer_thread = threading.Thread(
+            target=self._monitor, name=f"{self.__class__.__name__}-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server_socket.bind(self.socket_path)
+            self._server_socket.listen()
+            # accept() is not interrupted by close() on every platform, so poll
+            self._server_socket.settimeout(self.poll_interval)
+            self._server_thread = threading.Thread(
+                target=self._serve, name=f"{self.__class__.__name__}-server", daemon=True
+            )
+            self._server_thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop accepting connections, let the socket readers queue what they
+        have received, write all pending records and stop the writer thread.
+        """
+        self._stopping.set()
+        if self._server_thread:
+            self._server_thread.join()
+            self._server_thread = None
+        if self._server_socket:
+            try:
+                self._server_socket.close()
+            finally:
+                self._server_socket = None
+                if self.socket_path and os.path.exists(self.socket_path):
+                    os.unlink(self.socket_path)
+
+        # Readers exit on EOF, or once their connection is idle after stop()
+        with self._readers_lock:
+            readers = list(self._readers.items())
+        for thread, _ in readers:
+            thread.join(self.drain_timeout)
+        for thread, connection in readers:
+            if thread.is_alive():
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                thread.join()
+
+        if self._writer_thread:
+            self.queue.put(self._sentinel)
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def __enter__(self) -> 'PrintsCharmingLogListener':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _serve(self) -> None:
+        """
+        Accept connections and start a reader thread for each one. After
+        stop(), connections already waiting in the backlog are still accepted.
+        """
+        server_socket = self._server_socket
+        while True:
+            stopping = self._stopping.is_set()
+            if stopping:
+                server_socket.setblocking(False)
+            try:
+                connection, _ = server_socket.accept()
+            except (socket.timeout, BlockingIOError):
+                if stopping:
+                    break
+                continue
+            except OSError:
+                break
+            connection.settimeout(self.poll_interval)
+            reader = threading.Thread(
+                target=self._read_connection, args=(connection,),
+                name=f"{self.__class__.__name__}-reader", daemon=True
+            )
+            with self._readers_lock:
+                self._readers[reader] = connection
+            reader.start()
+
+    def _read_connection(self, connection: socket.socket) -> None:
+        """
+        Read length-prefixed frames from one sender and queue the records.
+
+        The loop ends when the sender closes or resets the connection, or
+        when the connection is idle after `stop()`. A truncated last frame is
+        discarded, and the connection is always closed.
+        """
+        buffer = bytearray()
+        try:
+            with connection:
+                while True:
+                    try:
+                        chunk = connection.recv(65536)
+                    except socket.timeout:
+                        if self._stopping.is_set():
+                            break
+                        continue
+                    except OSError:
+                        break  # ConnectionResetError and friends: the sender went away
+                    if not chunk:
+                        break
+                    buffer += chunk
+
+                    while len(buffer) >= 4:
+                        end = 4 + struct.unpack_from('>L', buffer)[0]
+                        if len(buffer) < end:
+                            break
+                        payload = bytes(buffer[4:end])
+                        del buffer[:end]
+                        try:
+                            self.queue.put(decode_record(payload))
+                        except (ValueError, TypeError):
+                            continue  # Skip malformed frames
+        finally:
+            with self._readers_lock:
+                self._readers.pop(threading.current_thread(), None)
+
+    def render(self, compact: CompactLogRecord) -> str:
+        """
+        Render a received record through the handler.
+
+        Args:
+            compact (CompactLogRecord): The received record.
+
+        Returns:
+            str: The rendered text, without a trailing newline.
+        """
+        return compact.append_exc_text(self.handler.render(compact.to_record()))
+
+    def _monitor(self) -> None:
+        """Writer thread: drain records in batches and write each batch at once."""
+        q = self.queue
+        running = True
+        while running:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except Empty:
+                    break
+
+            rendered: List[str] = []
+            last_record = None
+            for compact in batch:
+                if compact is self._sentinel:
+                    running = False
+                    continue
+                last_record = compact
+                try:
+                    rendered.append(self.render(compact))
+                except Exception:
+                    self.handler.handleError(compact.to_record())
+
+            if rendered:
+                stream = self.stream or sys.stdout
+                try:
+                    stream.write('\n'.join(rendered) + '\n')
+                    stream.flush()
+                except Exception:
+                    self.handler.handleError(last_record.to_record())
@@ -0,0 +1,183 @@
+# prints_charming.logging.render_cache.py
+
+import re
+import logging
+import string
+from collections.abc import Mapping
+from typing import Callable, Optional, Tuple
+
+
+
+
+class RecordRenderCache:
+    """
+    Per-record cache of the parsed message, shared by every handler that
+    formats the same `logging.LogRecord`.
+
+    The message template and args are captured once, and the plain and styled
+    message variants are built lazily on first use. Each arg is formatted with
+    its own format spec and conversion (`{0:.2f}`, `{name!r}`, `%5.1f`) before
+    it is styled. A template that cannot be formatted falls back to the plain
+    message, as `LogRecord.getMessage` would produce it. The record itself is never
+    modified apart from attaching this cache, so handlers attached after a
+    `PrintsCharmingFormatter` see the original `msg`, `args` and attributes.
+
+    Attributes:
+        msg (str): The message template (`str(record.msg)`).
+        args (Any): The original record args.
+    """
+
+    __slots__ = ('msg', 'args', '_plain', '_styled_key', '_styled')
+
+    attr_name = '_pc_render_cache'
+
+    _formatter = string.Formatter()
+
+    # printf-style conversion specifier, as accepted by `str % args`
+    _percent_pattern = re.compile(
+        r"%(?:\((?P<key>[^)]*)\))?(?P<spec>[#0\- +]*(?:\*|\d+)?(?:\.(?:\*|\d+))?[hlL]?(?P<type>[diouxXeEfFgGcrsa%]))"
+    )
+
+    def __init__(self, record: logging.LogRecord) -> None:
+        """
+        Initialize the cache from a log record.
+
+        Args:
+            record (logging.LogRecord): The log record.
+        """
+        self.msg = str(record.msg)
+        self.args = record.args
+        self._plain = None
+
+        # Single-entry cache: handlers sharing a record almost always share
+        # the style codes, and a dict per record adds GC pressure at high rates
+        self._styled_key: Optional[Tuple[str, str, str]] = None
+        self._styled = ''
+
+
+
+    @classmethod
+    def for_record(cls, record: logging.LogRecord) -> 'RecordRenderCache':
+        """
+        Returns the cache attached to the record, creating it on first use.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            RecordRenderCache: The cache for this record.
+        """
+        cache = record.__dict__.get(cls.attr_name)
+        if cache is None:
+            cache = cls(record)
+            setattr(record, cls.attr_name, cache)
+        return cache
+
+
+    def _format(self, wrap: Optional[Callable[[str], str]] = None) -> str:
+        """
+        Substitutes args into the message template using `str.format`,
+        falling back to %-style formatting for records from other libraries.
+        Each formatted arg is passed through `wrap` if given.
+
+        Raises:
+            Exception: Any error raised while formatting with either style.
+        """
+        if '{' not in self.msg and '%' in self.msg:
+            return self._format_percent(wrap)
+        try:
+            return self._format_braces(wrap)
+        except (IndexError, KeyError, ValueError, TypeError, AttributeError):
+            return self._format_percent(wrap)
+
+
+    def _format_braces(self, wrap: Optional[Callable[[str], str]]) -> str:
+        """Formats the template `str.format`-style, one replacement field at a time."""
+        if isinstance(self.args, Mapping):
+            args, kwargs = (), self.args
+        else:
+            args, kwargs = self.args, {}
+
+        formatter = self._formatter
+        parts = []
+        auto_index = 0
+        for literal, field_name, format_spec, conversion in formatter.parse(self.msg):
+            parts.append(literal)
+            if field_name is None:
+                continue
+            if not field_name or field_name[0] in '.[':
+                field_name = f"{auto_index}{field_name}"
+                auto_index += 1
+            value = formatter.convert_field(formatter.get_field(field_name, args, kwargs)[0], conversion)
+            if format_spec and '{' in format_spec:
+                format_spec = formatter.vformat(format_spec, args, kwargs)
+            text = formatter.format_field(value, format_spec)
+            parts.append(wrap(text) if wrap else text)
+        return ''.join(parts)
+
+
+    def _format_percent(self, wrap: Optional[Callable[[str], str]]) -> str:
+        """
+        Formats the template %-style, as `LogRecord.getMessage` does, one
+        conversion specifier at a time.
+        """
+        if wrap is None or '*' in self.msg:
+            return self.msg % self.args
+
+        args = self.args
+        positional = iter(args if not isinstance(args, Mapping) else (args,))
+
+        def substitute(match: 're.Match') -> str:
+            if match.group('type') == '%':
+                return '%'
+            key = match.group('key')
+            value = args[key] if key is not None else next(positional)
+            return wrap(f"%{match.group('spec')}" % (value,))
+
+        try:
+            message = self._percent_pattern.sub(substitute, self.msg)
+        except StopIteration:
+            raise TypeError("not enough arguments for format string")
+        return message
+
+
+    def plain_message(self) -> str:
+        """
+        Returns the message with args substituted and no styling.
+
+        Returns:
+            str: The plain message.
+        """
+        if self._plain is None:
+            try:
+                self._plain = self._format() if self.args else self.msg
+            except Exception:
+                self._plain = self.msg
+        return self._plain
+
+
+    def styled_message(self, args_style_code: str, message_style_code: str, reset: str) -> str:
+        """
+        Returns the message wrapped in `message_style_code`, with each arg
+        styled with `args_style_code`. The most recent result is cached.
+
+        Args:
+            args_style_code (str): Style code applied to each arg.
+            message_style_code (str): Style code applied to the message.
+            reset (str): ANSI reset code.
+
+        Returns:
+            str: The styled message.
+        """
+        key = (args_style_code, message_style_code, reset)
+        if key != self._styled_key:
+            if self.args:
+                try:
+                    message = self._format(lambda text: f"{args_style_code}{text}{reset}{message_style_code}")
+                except Exception:
+                    message = self.plain_message()
+            else:
+                message = self.msg
+            self._styled = f"{message_style_code}{message}{reset}"
+            self._styled_key = key
+        return self._styled
@@ -15,7 +15,6 @@ import copy
 import re
 import logging
 import inspect
-from datetime import datetime
 from dataclasses import dataclass, asdict
 
 from functools import wraps
@@ -46,12 +45,13 @@ from .regex_patterns import (
 
 from .prints_style import PStyle
 from .prints_ui import PrintsUI
-from .utils import compute_bg_color_map
+from .utils import compute_bg_color_map, detect_plain_output
 from .trie_manager import TrieManager
 from .markdown_processor import MarkdownProcessor
 from .formatter import Formatter
 from .internal_logging_utils import shared_logger
 from .terminal_size_watcher import TerminalSizeWatcher
+from .timestamp_formatter import TimestampFormatter
 from .segment_styler import SegmentStyler
 from .progress_bar import PBar
 
@@ -827,6 +827,7 @@ class PrintsCharming:
                  terminal_title: str = "PrintsCharming Terminal",
                  style_conditions: Optional[Any] = None,
                  formatter: Optional['Formatter'] = None,
+                 plain_output: Optional[bool] = None,
                  ) -> None:
 
         """
@@ -880,10 +881,22 @@ class PrintsCharming:
         :param formatter: supply your own formatter class instance to be used
                           for formatting text printed using the print method in
                           this class.
+
+        :param plain_output: if True, skip the styling pipeline entirely and
+                             write plain text with no ANSI codes. If None
+                             (default), plain output is enabled automatically
+                             when stdout is not a terminal or NO_COLOR is set.
         """
 
         self.config = {**DEFAULT_CONFIG, **(config or {})}
 
+        self.plain_output = (
+            detect_plain_output() if plain_output is None else plain_output
+        )
+
+        # Per-second cached timestamps for internal logging
+        self.timestamp_formatter = TimestampFormatter(ms_sep='.')
+
         self.color_map = (
             color_map
             or PrintsCharming.shared_color_map
@@ -1001,7 +1014,8 @@ class PrintsCharming:
             "stdout": sys.stdout,
             "stdin": sys.stdin,
         }
-        self.write("set_window_title", title=self.single_terminal_config["title"])
+        if not self.plain_output:
+            self.write("set_window_title", title=self.single_terminal_config["title"])
 
 
     def find_terminal_emulator(self):
@@ -1406,6 +1420,9 @@ class PrintsCharming:
         :param reset: Whether to reset styles after the text.
         :return: The styled text with the applied ANSI code.
         """
+        if self.plain_output:
+            return str(text)
+
         return f'{code}{text}{self.reset if reset else ''}'
 
 
@@ -1421,6 +1438,9 @@ class PrintsCharming:
         :param reset: Whether to reset styles after the text.
         :return: The styled text.
         """
+        if self.plain_output:
+            return str(text)
+
         self.debug(
             "Applying style_name: {} to text: {}",
             self._apply_style_internal('info', style_name),
@@ -1518,6 +1538,9 @@ class PrintsCharming:
         :return: The text styled with the specified color.
         """
         text = str(text)
+        if self.plain_output:
+            return text
+
         if text.isspace() and fill_space:
             color_code = self.bg_color_map.get(
                 color_name,
@@ -2818,6 +2841,11 @@ class PrintsCharming:
               **kwargs: Any) -> None:
 
 
+        if self.plain_output:
+            return self._print_plain(
+                args, sep, prog_sep, prog_step, prog_direction, start, end,
+                filename, return_styled_text, kwargs
+            )
 
         converted_args = [str(arg) for arg in args] if self.config["args_to_strings"] else args
         self.debug(f'converted_args:\n{converted_args}')
@@ -3355,6 +3383,49 @@ class PrintsCharming:
             # print(start + styled_text, end=end)
 
 
+    def _print_plain(self,
+                     args: Tuple[Any, ...],
+                     sep: str,
+                     prog_sep: str,
+                     prog_step: int,
+                     prog_direction: str,
+                     start: str,
+                     end: str,
+                     filename: Optional[str],
+                     return_styled_text: bool,
+                     kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Fast path for `print` when plain output is enabled. Skips trie matching,
+        styling and wrapping and writes the text without any ANSI codes.
+
+        :return: The plain text if `return_styled_text` is True, otherwise None.
+        """
+        converted_args = [str(arg) for arg in args] if self.config["args_to_strings"] else args
+
+        if not prog_sep:
+            text = sep.join(converted_args)
+        else:
+            text = self.format_with_sep(converted_args=converted_args, sep=sep, prog_sep=prog_sep, prog_step=prog_step, prog_direction=prog_direction)
+
+        text = start + text
+
+        # Substitute placeholders without styling the values
+        if self.config["kwargs"] and kwargs:
+            for key, value in kwargs.items():
+                text = text.replace(f"{{{key}}}", str(value))
+
+        if self.contains_ansi_codes(text):
+            text = PrintsCharming.remove_ansi_codes(text)
+
+        if return_styled_text:
+            return text + end
+
+        if filename:
+            self.write_file(text, filename, end)
+        else:
+            sys.stdout.write(text + end)
+
+
     def compare_dicts(self, dict1: Dict[str, Any], dict2: Dict[str, Any], keys: List[str]) -> Dict[str, bool]:
         """
         Compares two dictionaries for specified keys.
@@ -4861,9 +4932,6 @@ class PrintsCharming:
         if kwargs:
             message = message.format(**kwargs)
 
-        timestamp = time.time()
-        formatted_timestamp = datetime.fromtimestamp(timestamp).strftime(self._TIMESTAMP_FORMAT)
-
         timestamp_style = 'timestamp'
 
         level_styles = {
@@ -4877,7 +4945,9 @@ class PrintsCharming:
         log_level_style = level_styles.get(level, 'default')
 
         styled_log_level_prefix = self._apply_style_internal(log_level_style, f"LOG[{logging.getLevelName(level)}]")
-        styled_timestamp = self._apply_style_internal(timestamp_style, formatted_timestamp)
+        styled_timestamp = self.timestamp_formatter.format_styled(
+            time.time(), timestamp_style, self._apply_style_internal
+        )
         styled_level = self._apply_style_internal(log_level_style, logging.getLevelName(level))
         styled_text = self._apply_style_internal(log_level_style, message)
 
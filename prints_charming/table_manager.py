@@ -1,11 +1,21 @@
 # table_manager.py
 
+import io
 import os
 import sys
+import csv
+import html
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from itertools import chain, islice, repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
 
 from .prints_charming import PrintsCharming
+from .utils import sgr_to_css_style
 
 
 
@@ -19,6 +29,367 @@ class BoundCell:
 
 
 
+class AsyncBoundCell(BoundCell):
+    """
+    BoundCell whose value is fetched in the background, at its own interval,
+    by TableManager.run_bound_table_async.
+
+    `data_source` may be a coroutine function or any callable returning an
+    awaitable; other callables are run in a worker thread. A call that times
+    out keeps its thread, and later fetches wait for that call instead of
+    starting another, so a slow source never holds more than one thread.
+
+    get_value() never blocks and returns the last fetched value unchanged.
+    While the value is stale, `marker` is `stale_marker`; bound tables show
+    it after the formatted value, so numbers keep their alignment. A value
+    is stale if it was never fetched, the last fetch failed or timed out,
+    or the last success is older than `stale_after` seconds.
+    """
+    def __init__(self,
+                 data_source: Callable[[], Any],
+                 interval: float = 1.0,
+                 timeout: Optional[float] = None,
+                 stale_after: Optional[float] = None,
+                 stale_marker: str = "?",
+                 initial: Any = ""):
+        super().__init__(data_source)
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.stale_marker = stale_marker
+        self.value = initial
+        self.last_success: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self.is_async = inspect.iscoroutinefunction(data_source) or inspect.iscoroutinefunction(
+            getattr(type(data_source), '__call__', None)
+        )
+        self._pending: Optional[asyncio.Future] = None  # Worker thread call still running
+
+    @property
+    def stale(self) -> bool:
+        if self.error is not None or self.last_success is None:
+            return True
+        return self.stale_after is not None and time.monotonic() - self.last_success > self.stale_after
+
+    @property
+    def marker(self) -> str:
+        return self.stale_marker if self.stale_marker and self.stale else ''
+
+    def get_value(self) -> Any:
+        return self.value
+
+    async def fetch(self) -> bool:
+        """
+        Fetches a new value, waiting at most `timeout` seconds. Failures and
+        timeouts keep the previous value and mark it stale.
+
+        :return: Whether the displayed value or marker changed.
+        """
+        before = (self.value, self.marker)
+        try:
+            if self.is_async:
+                value = await asyncio.wait_for(self.data_source(), self.timeout)
+            else:
+                pending = self._pending
+                if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+                    pending = self._pending = asyncio.ensure_future(asyncio.to_thread(self.data_source))
+                # Shielded, so a timeout leaves the call running for the next fetch
+                value = await asyncio.wait_for(asyncio.shield(pending), self.timeout)
+                self._pending = None
+                if inspect.isawaitable(value):
+                    value = await asyncio.wait_for(value, self.timeout)
+            self.value = value
+            self.last_success = time.monotonic()
+            self.error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.error = e
+            if self._pending is not None and self._pending.done():
+                self._pending = None
+        return (self.value, self.marker) != before
+
+
+
+
+class ColumnStyle:
+    """
+    Column-wise conditional style, usable as a value in
+    `conditional_style_functions`.
+
+    `func` receives a whole column (a NumPy array for NumPy or pandas input,
+    otherwise a list) and returns one index into `styles` per cell. A
+    negative index or None leaves the cell to the default column style.
+    With row-oriented data, `func` is called with a one-element list.
+    """
+    def __init__(self, func: Callable[[Any], Sequence[Optional[int]]], styles: List[str]):
+        self.func = func
+        self.styles = styles
+
+    def column_styles(self, column: Any) -> List[Optional[str]]:
+        indices = self.func(column)
+        if hasattr(indices, 'tolist'):
+            indices = indices.tolist()
+        styles = self.styles
+        return [styles[i] if i is not None and i >= 0 else None for i in indices]
+
+    def __call__(self, cell: Any) -> Optional[str]:
+        return self.column_styles([cell])[0]
+
+
+
+
+class TableFormatPlan:
+    """
+    Formatting plan compiled once per table from its format_params.
+
+    Resolves, for each column, the alignment, header style, how data cells
+    are styled (specific header handler, conditional style function and its
+    arity, default column style or cell style) and the SGR prefix and suffix
+    of each style. format_cell then only pads and wraps.
+
+    With `cache_size`, formatted data cells are kept in an LRU keyed by
+    (column, type, str(), width, row parity). Columns whose output depends on
+    the rest of the row (specific headers, two-argument conditional
+    functions) are never cached.
+
+    The style prefixes and suffixes record the style code they were built
+    from; check_styles drops them, and the LRU, after a style they use is
+    added or edited or plain_output changes.
+    """
+
+    # How data cells of a column are styled
+    SPECIFIC, CONDITIONAL, DEFAULT, CELL, NONE = range(5)
+
+    # Marks a header or default column style that is not set
+    UNSTYLED = object()
+
+    def __init__(self, pc: PrintsCharming, header: List[Any], format_params: Dict[str, Any], cache_size: int = 0):
+        self.pc = pc
+        self.header = list(header)
+        self.header_ref = header
+        self.format_params = format_params
+        self.use_styles = format_params.get('use_styles', True)
+        self.cache_size = cache_size
+        self.cache: OrderedDict = OrderedDict()
+        self._affixes: Dict[str, Tuple[str, str, Any]] = {}  # Style name -> (prefix, suffix, style key)
+
+        col_alignments = format_params.get('col_alignments')
+        header_style = format_params.get('header_style')
+        header_column_styles = format_params.get('header_column_styles')
+        conditional_style_functions = format_params.get('conditional_style_functions')
+        default_column_styles = format_params.get('default_column_styles')
+        specific_headers = format_params.get('specific_headers', {})
+        cell_style = format_params.get('cell_style')
+
+        self.alignments = []
+        self.header_styles = []
+        self.kinds = []
+        self.handlers = []
+        self.row_args = []
+        self.default_styles = []
+        self.cacheable = []
+        for col_idx, column_name in enumerate(self.header):
+            # None aligns by type: numbers right, everything else left
+            self.alignments.append(
+                col_alignments[col_idx] if col_alignments and col_idx < len(col_alignments) else None
+            )
+            if header_column_styles and col_idx in header_column_styles:
+                self.header_styles.append(header_column_styles[col_idx])
+            else:
+                self.header_styles.append(header_style or self.UNSTYLED)
+
+            has_default_style = bool(default_column_styles) and col_idx in default_column_styles
+            self.default_styles.append(default_column_styles[col_idx] if has_default_style else self.UNSTYLED)
+
+            handler = None
+            row_arg = False
+            if specific_headers and column_name in specific_headers:
+                kind = self.SPECIFIC
+                handler = specific_headers[column_name]
+            elif conditional_style_functions and column_name in conditional_style_functions:
+                kind = self.CONDITIONAL
+                handler = conditional_style_functions[column_name]
+                # Check once whether the function requires the entire row as an argument
+                row_arg = not isinstance(handler, ColumnStyle) and handler.__code__.co_argcount == 2
+            elif has_default_style:
+                kind = self.DEFAULT
+            elif cell_style:
+                kind = self.CELL
+            else:
+                kind = self.NONE
+            self.kinds.append(kind)
+            self.handlers.append(handler)
+            self.row_args.append(row_arg)
+            self.cacheable.append(kind != self.SPECIFIC and not row_arg)
+
+        if isinstance(cell_style, list):
+            self.cell_styles = (cell_style[1], cell_style[0])  # Indexed by row parity
+        else:
+            self.cell_styles = (cell_style, cell_style)
+
+
+    def matches(self, header: List[Any], format_params: Dict[str, Any]) -> bool:
+        """
+        Returns whether the plan was compiled for this header and format_params.
+        """
+        return format_params is self.format_params and (
+            (header is self.header_ref and len(header) == len(self.header)) or list(header) == self.header
+        )
+
+
+    def style(self, style_name: str, text: str) -> str:
+        """
+        Wraps text in a style, as `PrintsCharming.apply_style` would.
+        """
+        if text.isspace():
+            return self.pc.apply_style(style_name, text)
+        affixes = self._affixes.get(style_name)
+        if affixes is None:
+            self.style_code(style_name)
+            affixes = self._affixes[style_name]
+        return f"{affixes[0]}{text}{affixes[1]}"
+
+
+    def style_code(self, style_name: str) -> str:
+        """
+        Returns the SGR code a style applies, as `PrintsCharming.apply_style` would.
+        """
+        affixes = self._affixes.get(style_name)
+        if affixes is None:
+            prefix, suffix = self.pc.apply_style(style_name, '\0').split('\0')
+            affixes = self._affixes[style_name] = (prefix, suffix, self._style_key(style_name))
+        return affixes[0]
+
+
+    def _style_key(self, style_name: str) -> Tuple[Optional[str], Optional[str], bool]:
+        # The code apply_style would resolve, falling back through color_map
+        pc = self.pc
+        code = pc.style_codes.get(style_name, pc.color_map.get(style_name, pc.color_map.get('default')))
+        return code, pc.reset, pc.plain_output
+
+
+    def check_styles(self) -> bool:
+        """
+        Drops the cached style affixes and formatted cells if any style they
+        were built from has changed since.
+
+        :return: Whether the caches were dropped.
+        """
+        for style_name, affixes in self._affixes.items():
+            if affixes[2] != self._style_key(style_name):
+                self._affixes.clear()
+                self.cache.clear()
+                return True
+        return False
+
+
+    def alignment(self, cell: Any, col_idx: int) -> str:
+        """
+        Returns the alignment of a cell: the column's, or right for numbers and left otherwise.
+        """
+        alignment = self.alignments[col_idx]
+        if alignment is None:
+            return 'right' if isinstance(cell, (int, float)) else 'left'
+        return alignment
+
+
+    def style_name(self, cell: Any, row: List[Any], row_idx: int, col_idx: int) -> Optional[str]:
+        """
+        Returns the name of the style format_cell applies to a cell, or None.
+        Cells of specific header columns are styled by their handler, and
+        report None.
+        """
+        if not self.use_styles:
+            return None
+        if row_idx == 0:
+            style = self.header_styles[col_idx]
+            return None if style is self.UNSTYLED else style
+        kind = self.kinds[col_idx]
+        if kind == self.CONDITIONAL:
+            style = self.handlers[col_idx](cell, row) if self.row_args[col_idx] else self.handlers[col_idx](cell)
+            if style:
+                return style
+            default_style = self.default_styles[col_idx]
+            return None if default_style is self.UNSTYLED else default_style
+        if kind == self.DEFAULT:
+            return self.default_styles[col_idx]
+        if kind == self.CELL:
+            return self.cell_styles[row_idx % 2]
+        return None
+
+
+    def format_cell(self, cell: Any, row: List[Any], row_idx: int, col_idx: int, max_length: int, text: Optional[str] = None) -> str:
+        """
+        Aligns and styles one cell.
+
+        :param cell: The cell value.
+        :param row: The cell's row, passed to specific header handlers and
+                    two-argument conditional style functions.
+        :param row_idx: Index of the row (0 is the header).
+        :param col_idx: Index of the column.
+        :param max_length: Width of the column.
+        :param text: Text displayed instead of `str(cell)`, e.g. a truncated
+                     value. Alignment and styles are still decided by `cell`.
+        :return: The formatted cell.
+        """
+        cell_str = str(cell) if text is None else text
+
+        key = None
+        if row_idx and self.cache_size and self.cacheable[col_idx]:
+            key = (col_idx, type(cell), cell_str, max_length, row_idx % 2)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+                return cached
+
+        # Apply alignment
+        alignment = self.alignments[col_idx]
+        if alignment is None:
+            alignment = 'right' if isinstance(cell, (int, float)) else 'left'
+        if alignment == 'right':
+            aligned_cell = cell_str.rjust(max_length)
+        elif alignment == 'center':
+            aligned_cell = cell_str.center(max_length)
+        else:
+            aligned_cell = cell_str.ljust(max_length)
+
+        # Apply styles
+        if not self.use_styles:
+            pass
+        elif row_idx == 0:
+            # Header row styles
+            if self.header_styles[col_idx] is not self.UNSTYLED:
+                aligned_cell = self.style(self.header_styles[col_idx], aligned_cell)
+        else:
+            # Data row styles
+            kind = self.kinds[col_idx]
+            if kind == self.SPECIFIC:
+                aligned_cell = self.handlers[col_idx](cell_str, aligned_cell, row, row_idx, col_idx, max_length)
+            elif kind == self.CONDITIONAL:
+                if self.row_args[col_idx]:
+                    style = self.handlers[col_idx](cell, row)
+                else:
+                    style = self.handlers[col_idx](cell)
+                if style:
+                    aligned_cell = self.style(style, aligned_cell)
+                elif self.default_styles[col_idx] is not self.UNSTYLED:
+                    aligned_cell = self.style(self.default_styles[col_idx], aligned_cell)
+            elif kind == self.DEFAULT:
+                aligned_cell = self.style(self.default_styles[col_idx], aligned_cell)
+            elif kind == self.CELL:
+                aligned_cell = self.style(self.cell_styles[row_idx % 2], aligned_cell)
+
+        if key is not None:
+            self.cache[key] = aligned_cell
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return aligned_cell
+
+
+
+
+
 class TableManager:
 
     def __init__(
@@ -26,7 +397,8 @@ class TableManager:
         pc: Union[PrintsCharming, str, None] = None,
         conditional_styles: dict = None,
         specific_headers: dict = None,
-        ansi_escape_pattern: str = 'csi'
+        ansi_escape_pattern: str = 'csi',
+        format_cache_size: int = 0
     ) -> None:
 
         if isinstance(pc, str):
@@ -45,6 +417,15 @@ class TableManager:
         self.tables = {}
         self.previous_values = {}
 
+        # Compiled per-table formatting plans, see get_format_plan
+        self.format_plans: Dict[int, TableFormatPlan] = {}
+        self.max_format_plans = 64
+        self.format_cache_size = format_cache_size
+
+        # Style name -> (style code, CSS class, rule), for HTML export
+        self.css_classes: Dict[str, Tuple[str, str, str]] = {}
+        self.css_class_names = {'pc-align-right', 'pc-align-center'}
+
         self.border_char = "-"
         self.col_sep = " | "
         self.title_style = "header_text"
@@ -70,83 +451,300 @@ class TableManager:
 
 
 
+    def get_format_plan(self, header: List[Any], format_params: Dict[str, Any]) -> TableFormatPlan:
+        """
+        Returns the compiled TableFormatPlan for a header and format_params,
+        compiling it on first use. Plans are looked up by the identity of
+        format_params, so a stored table reuses its plan (and LRU) across
+        refreshes and re-renders, until a style it uses changes.
+        """
+        plan = self.format_plans.get(id(format_params))
+        if plan is None or not plan.matches(header, format_params):
+            if len(self.format_plans) >= self.max_format_plans:
+                # Keep plans of stored tables, drop those of ephemeral ones
+                stored = {id(info.get("format_params")) for info in self.tables.values()}
+                for key in [key for key in self.format_plans if key not in stored]:
+                    del self.format_plans[key]
+            plan = TableFormatPlan(self.pc, header, format_params, self.format_cache_size)
+            self.format_plans[id(format_params)] = plan
+        else:
+            plan.check_styles()
+        return plan
+
+
     def format_cell(self, cell, row, row_idx, col_idx, max_col_lengths, header, format_params):
-        cell_str = str(cell)
-        max_length = max_col_lengths[col_idx]
+        plan = self.get_format_plan(header, format_params)
+        return plan.format_cell(cell, row, row_idx, col_idx, max_col_lengths[col_idx])
 
-        # Determine alignment
-        alignment = 'left'  # Default alignment
-        col_alignments = format_params.get('col_alignments')
-        if col_alignments and col_idx < len(col_alignments):
-            alignment = col_alignments[col_idx]
-        elif isinstance(cell, (int, float)):
-            alignment = 'right'
 
-        # Apply alignment
-        if alignment == 'left':
-            aligned_cell = cell_str.ljust(max_length)
-        elif alignment == 'center':
-            aligned_cell = cell_str.center(max_length)
-        elif alignment == 'right':
-            aligned_cell = cell_str.rjust(max_length)
-        else:
-            aligned_cell = cell_str.ljust(max_length)  # Fallback
+    @staticmethod
+    def cell_marker(cell: Any) -> str:
+        """
+        Returns the marker shown after a cell's formatted value: the
+        stale_marker of a stale AsyncBoundCell, otherwise ''.
+        """
+        return cell.marker if isinstance(cell, AsyncBoundCell) else ''
 
-        # Apply styles
-        use_styles = format_params.get('use_styles', True)
-        if row_idx == 0:
-            # Header row styles
-            header_style = format_params.get('header_style')
-            header_column_styles = format_params.get('header_column_styles')
-            if header_column_styles and col_idx in header_column_styles:
-                aligned_cell = self.pc.apply_style(header_column_styles[col_idx], aligned_cell)
-            elif header_style:
-                aligned_cell = self.pc.apply_style(header_style, aligned_cell)
-        else:
-            # Data row styles
-            conditional_style_functions = format_params.get('conditional_style_functions')
-            default_column_styles = format_params.get('default_column_styles')
-            specific_headers = format_params.get('specific_headers', {})
-            cell_style = format_params.get('cell_style')
-            column_name = header[col_idx]
 
-            # Handle specific headers
-            if specific_headers and column_name in specific_headers:
-                specific_handler = specific_headers[column_name]
-                aligned_cell = specific_handler(cell_str, aligned_cell, row, row_idx, col_idx, max_length)
+    @staticmethod
+    def format_marked_cell(plan: 'TableFormatPlan', cell: Any, row: List[Any], row_idx: int, col_idx: int, max_length: int, marker: str, text: Optional[str] = None) -> str:
+        """
+        Formats a cell with plan.format_cell, leaving room for `marker` after it.
+        `text`, if given, is displayed instead of `str(cell)`.
+        """
+        if not marker:
+            return plan.format_cell(cell, row, row_idx, col_idx, max_length, text)
+        return plan.format_cell(cell, row, row_idx, col_idx, max(0, max_length - len(marker)), text) + marker
 
-            # Apply conditional styles if provided
-            elif conditional_style_functions and column_name in conditional_style_functions:
-                style_func = conditional_style_functions[column_name]
-                # Check if the function requires the entire row as an argument
-                if style_func.__code__.co_argcount == 2:
-                    style = style_func(cell, row)
-                else:
-                    style = style_func(cell)
-                if style:
-                    aligned_cell = self.pc.apply_style(style, aligned_cell)
+
+    @staticmethod
+    def compute_col_widths(rows: List[List[Any]], col_widths: Optional[List[int]] = None) -> List[int]:
+        """
+        Computes the width of each column as the longest `str()` of its cells.
+
+        :param rows: Rows to measure (the header included). BoundCell
+                     instances are resolved.
+        :param col_widths: Optional starting widths, updated in place.
+        :return: The list of column widths.
+        """
+        if col_widths is None:
+            col_widths = [0] * len(rows[0])
+        for row in rows:
+            for i, cell in enumerate(row):
+                marker = ''
+                if isinstance(cell, BoundCell):
+                    marker = TableManager.cell_marker(cell)
+                    cell = cell.get_value()
+                cell_length = len(str(cell)) + len(marker)
+                if cell_length > col_widths[i]:
+                    col_widths[i] = cell_length
+        return col_widths
+
+
+    @staticmethod
+    def get_border_length(max_col_lengths: List[int], col_sep: str) -> int:
+        """
+        Returns the visible length of a border line for the given column widths.
+        """
+        return sum(max_col_lengths) + len(max_col_lengths) * len(col_sep) + len(col_sep) - 2
+
+
+    def format_row(self,
+                   row: List[Any],
+                   row_idx: int,
+                   max_col_lengths: List[int],
+                   header: List[Any],
+                   format_params: Dict[str, Any],
+                   styled_col_sep: str,
+                   markers: Optional[List[str]] = None,
+                   texts: Optional[List[Optional[str]]] = None
+                   ) -> str:
+        """
+        Formats and joins the cells of one row, including the outer separators.
+
+        :param row: The row's cells. BoundCell instances are resolved, unless
+                    `markers` is given.
+        :param row_idx: Index of the row (0 is the header).
+        :param max_col_lengths: Column widths.
+        :param header: The header row.
+        :param format_params: Formatting parameters, as stored by generate_table.
+        :param styled_col_sep: The (styled) column separator.
+        :param markers: Markers of an already resolved row, as returned by
+                        truncate_row.
+        :param texts: Per-column display overrides (None keeps `str(cell)`),
+                      as returned by truncate_row.
+        :return: The row string.
+        """
+        plan = self.get_format_plan(header, format_params)
+        aligned_row = []
+        for col_idx, cell in enumerate(row):
+            if markers is not None:
+                marker = markers[col_idx]
+            else:
+                marker = ''
+                if isinstance(cell, BoundCell):
+                    marker = self.cell_marker(cell)
+                    cell = cell.get_value()
+            text = texts[col_idx] if texts is not None else None
+            aligned_cell = self.format_marked_cell(plan, cell, row, row_idx, col_idx, max_col_lengths[col_idx], marker, text)
+            aligned_row.append(aligned_cell)
+
+        # Create a row string
+        if format_params.get('target_text_box'):
+            col_sep = format_params.get('col_sep', self.col_sep)
+            col_sep_style = format_params.get('col_sep_style')
+            return self.pc.apply_style(col_sep_style, col_sep.lstrip()) + styled_col_sep.join(aligned_row) + self.pc.apply_style(col_sep_style, col_sep.rstrip())
+        return styled_col_sep + styled_col_sep.join(aligned_row) + styled_col_sep
+
+
+    @staticmethod
+    def to_columns(table_data: Any) -> Optional[Tuple[List[Any], List[Any]]]:
+        """
+        Splits column-oriented table data into its header and columns.
+
+        Supported inputs are a mapping of header to sequence (lists, tuples or
+        NumPy arrays), a pandas DataFrame and a NumPy structured array. Neither
+        NumPy nor pandas is imported; they are detected by their attributes.
+
+        :param table_data: The table data.
+        :return: (header, columns), or None if table_data is a list of rows.
+        """
+        if isinstance(table_data, Mapping):
+            return list(table_data.keys()), list(table_data.values())
+        columns = getattr(table_data, 'columns', None)
+        if columns is not None and hasattr(table_data, 'iloc'):
+            # pandas DataFrame, by position so duplicate labels are kept
+            return list(columns), [table_data.iloc[:, i].to_numpy() for i in range(len(columns))]
+        names = getattr(getattr(table_data, 'dtype', None), 'names', None)
+        if names:
+            # NumPy structured array
+            return list(names), [table_data[name] for name in names]
+        return None
+
+
+    @staticmethod
+    def column_values(column: Any) -> List[Any]:
+        """
+        Returns a column as a list of Python objects (NumPy scalars are converted).
+        """
+        if hasattr(column, 'tolist'):
+            return column.tolist()
+        return list(column)
+
+
+    def format_columns(self,
+                       header: List[Any],
+                       columns: List[Any],
+                       format_params: Dict[str, Any],
+                       styled_col_sep: str
+                       ) -> Tuple[List[int], List[str]]:
+        """
+        Formats column-oriented data a column at a time. Every cell is
+        converted with `str()` once, widths are taken per column, and
+        alignment and styles are resolved once per column instead of per cell.
+        NumPy and pandas columns are converted to Python lists first; the
+        per-cell work is plain Python, not NumPy string operations. BoundCell
+        instances are resolved once, and stale markers are placed as in the
+        row path. The output matches formatting the same data row by row.
+
+        :param header: The header row.
+        :param columns: The columns, one sequence per header entry.
+        :param format_params: Formatting parameters, as stored by generate_table.
+        :param styled_col_sep: The (styled) column separator.
+        :return: The column widths and the formatted rows, header first.
+        """
+        if len(columns) != len(header):
+            raise ValueError(f"Expected {len(header)} columns, got {len(columns)}.")
+
+        values = [self.column_values(column) for column in columns]
+        num_rows = len(values[0]) if values else 0
+        for name, column_values in zip(header, values):
+            if len(column_values) != num_rows:
+                raise ValueError(
+                    f"Column '{name}' has {len(column_values)} values, expected {num_rows}."
+                )
+
+        # Resolve bound cells once, keeping their markers for after styling
+        markers: List[Optional[List[str]]] = [None] * len(values)
+        for col_idx, column_values in enumerate(values):
+            if any(isinstance(value, BoundCell) for value in column_values):
+                markers[col_idx] = [self.cell_marker(value) for value in column_values]
+                values[col_idx] = [
+                    value.get_value() if isinstance(value, BoundCell) else value for value in column_values
+                ]
+
+        # Convert once, then measure
+        cell_strs = [list(map(str, column_values)) for column_values in values]
+        max_col_lengths = [
+            max(len(str(name)), max(map(len, strs), default=0))
+            if marks is None else
+            max(len(str(name)), max((len(text) + len(mark) for text, mark in zip(strs, marks)), default=0))
+            for name, strs, marks in zip(header, cell_strs, markers)
+        ]
+
+        # Alignment and style precedence come from the same plan as format_cell
+        plan = self.get_format_plan(header, format_params)
+        styled = plan.style
+
+        def get_row(r: int) -> List[Any]:
+            return [column_values[r] for column_values in values]
+
+        formatted_columns = []
+        for col_idx, (column, column_values, strs) in enumerate(zip(columns, values, cell_strs)):
+            width = max_col_lengths[col_idx]
+
+            # Align
+            alignment = plan.alignments[col_idx]
+            if alignment is not None:
+                alignments = repeat(alignment, num_rows)
+            elif getattr(getattr(column, 'dtype', None), 'kind', None) in ('b', 'i', 'u', 'f'):
+                alignments = repeat('right', num_rows)
+            else:
+                alignments = ['right' if isinstance(v, (int, float)) else 'left' for v in column_values]
+            marks = markers[col_idx]
+            if marks is None:
+                aligned = [
+                    s.center(width) if a == 'center' else s.rjust(width) if a == 'right' else s.ljust(width)
+                    for s, a in zip(strs, alignments)
+                ]
+            else:
+                aligned = [
+                    s.center(width - len(m)) if a == 'center' else s.rjust(width - len(m)) if a == 'right' else s.ljust(width - len(m))
+                    for s, a, m in zip(strs, alignments, marks)
+                ]
+
+            if not plan.use_styles:
+                formatted_columns.append(aligned if marks is None else [text + m for text, m in zip(aligned, marks)])
+                continue
+
+            # Style a column at a time
+            kind = plan.kinds[col_idx]
+            default_style = plan.default_styles[col_idx]
+            if kind == plan.SPECIFIC:
+                handler = plan.handlers[col_idx]
+                aligned = [
+                    handler(strs[r], aligned[r], get_row(r), r + 1, col_idx, width)
+                    for r in range(num_rows)
+                ]
+            elif kind == plan.CONDITIONAL:
+                style_func = plan.handlers[col_idx]
+                if isinstance(style_func, ColumnStyle):
+                    cell_styles = style_func.column_styles(column)
+                elif plan.row_args[col_idx]:
+                    cell_styles = [style_func(column_values[r], get_row(r)) for r in range(num_rows)]
                 else:
-                    if default_column_styles and col_idx in default_column_styles:
-                        # Apply column-specific styles if provided
-                        aligned_cell = self.pc.apply_style(default_column_styles[col_idx], aligned_cell)
-            #elif default_column_styles and col_idx in default_column_styles:
-                #aligned_cell = self.pc.apply_style(default_column_styles[col_idx], aligned_cell)
-            elif default_column_styles and col_idx in default_column_styles:
-                # Apply column-specific styles if provided
-                aligned_cell = self.pc.apply_style(default_column_styles[col_idx], aligned_cell)
-            elif cell_style:
-                if isinstance(cell_style, list):
-                    # Apply alternating styles based on the row index
-                    style_to_apply = cell_style[0] if row_idx % 2 == 1 else cell_style[1]
-                    aligned_cell = self.pc.apply_style(style_to_apply, aligned_cell)
+                    cell_styles = list(map(style_func, column_values))
+                if default_style is plan.UNSTYLED:
+                    aligned = [styled(style, text) if style else text for style, text in zip(cell_styles, aligned)]
                 else:
-                    aligned_cell = self.pc.apply_style(cell_style, aligned_cell)
+                    aligned = [styled(style or default_style, text) for style, text in zip(cell_styles, aligned)]
+            elif kind == plan.DEFAULT:
+                aligned = [styled(default_style, text) for text in aligned]
+            elif kind == plan.CELL:
+                # Row r + 1 is the table row of data row r
+                aligned = [styled(plan.cell_styles[(r + 1) % 2], text) for r, text in enumerate(aligned)]
+            if marks is not None:
+                aligned = [text + m for text, m in zip(aligned, marks)]
+            formatted_columns.append(aligned)
+
+        # Assemble rows
+        if format_params.get('target_text_box'):
+            col_sep = format_params.get('col_sep', self.col_sep)
+            col_sep_style = format_params.get('col_sep_style')
+            left = self.pc.apply_style(col_sep_style, col_sep.lstrip())
+            right = self.pc.apply_style(col_sep_style, col_sep.rstrip())
+        else:
+            left = right = styled_col_sep
 
-        return aligned_cell
+        table_output = [self.format_row(header, 0, max_col_lengths, header, format_params, styled_col_sep)]
+        table_output.extend(
+            f"{left}{styled_col_sep.join(cells)}{right}" for cells in zip(*formatted_columns)
+        )
+        return max_col_lengths, table_output
 
 
     def generate_table(self,
-                       table_data: List[List[Any]],
+                       table_data: Union[List[List[Any]], Mapping[Any, Sequence[Any]], Any],
                        table_name: str = None,
                        show_table_name: bool = False,
                        table_style: str = "default",
@@ -172,7 +770,12 @@ class TableManager:
         """
         Generates a table with optional styling and alignment as a string.
 
-        :param table_data: A list of lists representing the rows of the table.
+        Column-oriented data (a dict of sequences or NumPy arrays, a pandas
+        DataFrame or a NumPy structured array) is formatted a column at a time,
+        which is several times faster for large tables. Its header is taken
+        from the keys, column labels or field names.
+
+        :param table_data: A list of lists representing the rows of the table, or column-oriented data.
         :param table_name: The name of the table (used for storage and reference).
         :param show_table_name: Whether to display the table name as a title.
         :param table_style: The style to apply to the entire table.
@@ -187,6 +790,7 @@ class TableManager:
         :param cell_style: Style name or list of styles for the table cells.
         :param target_text_box: Whether to target a specific text box (used in some rendering contexts).
         :param conditional_style_functions: A dictionary defining conditional styles based on cell values.
+                                            Values may also be ColumnStyle instances, which style a whole column at once.
         :param double_space: Whether to double-space the table rows.
         :param use_styles: Whether to use styles (True) or plain text (False).
         :param ephemeral: If True, the table is not stored for future updates.
@@ -194,25 +798,15 @@ class TableManager:
         :return: A string representing the formatted table.
         """
 
+        # Plain output never generates SGR codes, regardless of the styles requested
+        if self.pc.plain_output:
+            use_styles = False
 
         if use_styles:
             styled_col_sep = self.pc.apply_style(col_sep_style, col_sep) if col_sep_style else col_sep
         else:
             styled_col_sep = self.pc.apply_color(col_sep_style, col_sep) if col_sep_style else col_sep
 
-        # Step 1: Automatic Column Sizing
-        max_col_lengths = [0] * len(table_data[0])
-        for row in table_data:
-            for i, cell in enumerate(row):
-                if isinstance(cell, BoundCell):
-                    cell = cell.get_value()
-                cell_length = len(str(cell))
-                max_col_lengths[i] = max(max_col_lengths[i], cell_length)
-
-        # Step 2: Prepare Table Output
-        table_output = []
-        header = table_data[0]
-
         # If `specific_headers` is a string, retrieve the corresponding dictionary from `self.specific_headers`
         if isinstance(specific_headers, str):
             specific_headers = self.specific_headers.get(specific_headers, {})
@@ -232,21 +826,32 @@ class TableManager:
             "target_text_box": target_text_box,
         }
 
-        # Process each row
-        for row_idx, row in enumerate(table_data):
-            aligned_row = []
-            for col_idx, cell in enumerate(row):
-                if isinstance(cell, BoundCell):
-                    cell = cell.get_value()
-                aligned_cell = self.format_cell(cell, row, row_idx, col_idx, max_col_lengths, header, format_params)
-                aligned_row.append(aligned_cell)
+        # Re-rendering a stored table with the same parameters reuses its format plan and cache
+        stored_params = self.tables.get(table_name, {}).get("format_params") if table_name else None
+        if stored_params == format_params:
+            format_params = stored_params
+
+        columnar = self.to_columns(table_data)
+        if columnar is not None:
+            # Column-oriented data: size and format a column at a time
+            header, columns = columnar
+            max_col_lengths, table_output = self.format_columns(header, columns, format_params, styled_col_sep)
+            if table_name and not ephemeral:
+                # Stored tables are kept as rows for refresh_bound_table
+                table_data = [list(header)] + [list(row) for row in zip(*map(self.column_values, columns))]
+        else:
+            # Step 1: Automatic Column Sizing
+            max_col_lengths = self.compute_col_widths(table_data)
 
-            # Create a row string and add to table output
-            if target_text_box:
-                row_str = self.pc.apply_style(col_sep_style, col_sep.lstrip()) + styled_col_sep.join(aligned_row) + self.pc.apply_style(col_sep_style, col_sep.rstrip())
-            else:
-                row_str = styled_col_sep + styled_col_sep.join(aligned_row) + styled_col_sep
-            table_output.append(row_str)
+            # Step 2: Prepare Table Output
+            table_output = []
+            header = table_data[0]
+
+            # Process each row
+            for row_idx, row in enumerate(table_data):
+                table_output.append(
+                    self.format_row(row, row_idx, max_col_lengths, header, format_params, styled_col_sep)
+                )
 
         # Step 3: Generate Borders and Assemble Table
         table_lines = []
@@ -255,8 +860,9 @@ class TableManager:
         # Generate border line
         #table_str = ""
         #border_line = ""  # Initialize border_line to ensure it always has a value
+        border_length = self.get_border_length(max_col_lengths, col_sep)
+        border_line = None
         if border_style:
-            border_length = sum(max_col_lengths) + len(max_col_lengths) * len(col_sep) + len(col_sep) - 2
             border_line = self.pc.apply_style(border_style, border_char * border_length)
             table_lines.append(border_line)
             line_number += 1
@@ -315,6 +921,12 @@ class TableManager:
                 "max_col_lengths": max_col_lengths,
                 "border_length": border_length,
                 "border_line": border_line,
+                "layout_params": {
+                    "show_table_name": show_table_name,
+                    "border_char": border_char,
+                    "border_style": border_style,
+                    "double_space": double_space,
+                },
                 "bound": True,
             }
 
@@ -322,6 +934,426 @@ class TableManager:
 
 
 
+    def stream_table(self,
+                     rows: Iterable[List[Any]],
+                     col_widths: Optional[Union[List[int], Dict[str, int]]] = None,
+                     sample_size: int = 1000,
+                     row_window: Optional[Tuple[int, int]] = None,
+                     overflow: str = 'truncate',
+                     table_name: Optional[str] = None,
+                     show_table_name: bool = False,
+                     border_char: str = "-",
+                     col_sep: str = " | ",
+                     border_style: Optional[str] = None,
+                     col_sep_style: Optional[str] = None,
+                     header_style: Optional[str] = None,
+                     header_column_styles: Optional[Dict[int, str]] = None,
+                     col_alignments: Optional[List[str]] = None,
+                     default_column_styles: Optional[Dict[int, str]] = None,
+                     specific_headers: Union[Dict[str, Callable[[Any, List[Any], int, int, int], str]], str, None] = None,
+                     cell_style: Optional[Union[str, List[str]]] = None,
+                     target_text_box: bool = False,
+                     conditional_style_functions: Optional[Dict[str, Callable[[Any], Optional[str]]]] = None,
+                     double_space: bool = False,
+                     use_styles: bool = True,
+                     ) -> Iterator[str]:
+        """
+        Streams a table line by line, for tables too large to build with
+        generate_table. Rows are consumed lazily, nothing is stored in
+        self.tables and the full output is never held in memory.
+
+        Column widths come from `col_widths` if given, otherwise from the
+        header and the first `sample_size` rows. Cells wider than their column
+        are handled according to `overflow`.
+
+        :param rows: An iterable of rows whose first row is the header.
+        :param col_widths: Optional schema: a list of widths, or a dict mapping
+                           header names to widths. Columns are never narrower
+                           than their header, and columns missing from the
+                           schema are as wide as their header.
+        :param sample_size: Number of rows sampled to compute widths when
+                            col_widths is not given.
+        :param row_window: Optional (start, stop) range of data rows to render,
+                           0-based and excluding the header. Rows outside the
+                           window are skipped without being formatted.
+        :param overflow: 'truncate' cuts cells wider than their column and
+                         ends them with '…', 'ignore' prints them as is.
+        :param table_name: The name of the table, shown if show_table_name.
+        :param show_table_name: Whether to display the table name as a title.
+        :param border_char: Character used for table borders.
+        :param col_sep: Column separator string.
+        :param border_style: Style name for the table borders.
+        :param col_sep_style: Style name for the column separators.
+        :param header_style: Style name for the header row.
+        :param header_column_styles: A dictionary mapping column indices to style names for the header row.
+        :param col_alignments: A list of strings ('left', 'center', 'right') for column alignments.
+        :param default_column_styles: A dictionary mapping column indices to style names for data cells.
+        :param specific_headers: Header-specific formatting functions, or the name of a stored configuration.
+        :param cell_style: Style name or list of styles for the table cells.
+        :param target_text_box: Whether to target a specific text box (used in some rendering contexts).
+        :param conditional_style_functions: A dictionary defining conditional styles based on cell values.
+        :param double_space: Whether to double-space the table rows.
+        :param use_styles: Whether to use styles (True) or plain text (False).
+        :return: An iterator over the table's lines, without newlines.
+        """
+        if overflow not in ('truncate', 'ignore'):
+            raise ValueError(f"Invalid overflow '{overflow}'. Choose from ['truncate', 'ignore'].")
+
+        # Plain output never generates SGR codes, regardless of the styles requested
+        if self.pc.plain_output:
+            use_styles = False
+
+        if use_styles:
+            styled_col_sep = self.pc.apply_style(col_sep_style, col_sep) if col_sep_style else col_sep
+        else:
+            styled_col_sep = self.pc.apply_color(col_sep_style, col_sep) if col_sep_style else col_sep
+
+        # Slice sequences directly so a window into a large list skips the rows before it
+        start, stop = row_window if row_window else (0, None)
+        window = (start, stop) if row_window else None
+        if isinstance(rows, Sequence):
+            if not rows:
+                return
+            header = rows[0]
+            data_rows: Iterator[List[Any]] = iter(rows[1 + start:None if stop is None else 1 + stop])
+            window = None
+        else:
+            data_rows = iter(rows)
+            header = next(data_rows, None)
+            if header is None:
+                return
+
+        # Column widths from the schema or from a sample of the rows
+        if col_widths is None:
+            sample = list(islice(data_rows, sample_size))
+            max_col_lengths = self.compute_col_widths([header] + sample)
+            data_rows = chain(sample, data_rows)
+        elif isinstance(col_widths, dict):
+            max_col_lengths = [max(col_widths.get(str(name), 0), len(str(name))) for name in header]
+        else:
+            widths = list(col_widths) + [0] * (len(header) - len(col_widths))
+            max_col_lengths = [max(width, len(str(name))) for width, name in zip(widths, header)]
+
+        if window:
+            data_rows = islice(data_rows, *window)
+
+        if isinstance(specific_headers, str):
+            specific_headers = self.specific_headers.get(specific_headers, {})
+
+        format_params = {
+            "col_alignments": col_alignments,
+            "col_sep": col_sep,
+            "col_sep_style": col_sep_style,
+            "header_style": header_style,
+            "header_column_styles": header_column_styles,
+            "default_column_styles": default_column_styles,
+            "specific_headers": specific_headers,
+            "cell_style": cell_style,
+            "conditional_style_functions": conditional_style_functions,
+            "use_styles": use_styles,
+            "target_text_box": target_text_box,
+        }
+
+        border_length = self.get_border_length(max_col_lengths, col_sep)
+        border_line = self.pc.apply_style(border_style, border_char * border_length) if border_style else None
+
+        if border_line:
+            yield border_line
+        if show_table_name and table_name:
+            yield self.pc.apply_style(self.title_style, table_name.center(border_length))
+            if border_line:
+                yield border_line
+
+        yield self.format_row(header, 0, max_col_lengths, header, format_params, styled_col_sep)
+        if border_line:
+            yield border_line
+
+        truncate = overflow == 'truncate'
+        for row_idx, row in enumerate(data_rows, start=1 + start):
+            if truncate:
+                row, markers, texts = self.truncate_row(row, max_col_lengths)
+                yield self.format_row(row, row_idx, max_col_lengths, header, format_params, styled_col_sep, markers, texts)
+            else:
+                yield self.format_row(row, row_idx, max_col_lengths, header, format_params, styled_col_sep)
+            if double_space:
+                yield ""
+
+        if border_line:
+            yield border_line
+
+
+    @staticmethod
+    def truncate_row(row: List[Any], max_col_lengths: List[int]) -> Tuple[List[Any], List[str], Optional[List[Optional[str]]]]:
+        """
+        Resolves the row's BoundCell instances once and cuts the text of cells
+        wider than their column to fit, ending it with '…'. The values are
+        kept, so styles and alignment see the same types as in rows that fit.
+
+        :param row: The row's cells.
+        :param max_col_lengths: Column widths.
+        :return: (resolved values, markers, display texts or None if no cell
+                 was cut), for format_row.
+        """
+        values = list(row)
+        markers = [''] * len(values)
+        texts = None
+        for i, cell in enumerate(values):
+            if isinstance(cell, BoundCell):
+                markers[i] = TableManager.cell_marker(cell)
+                cell = values[i] = cell.get_value()
+            cell_str = str(cell)
+            width = max(0, max_col_lengths[i] - len(markers[i]))
+            if len(cell_str) > width:
+                if texts is None:
+                    texts = [None] * len(values)
+                texts[i] = cell_str[:width - 1] + '…' if width else ''
+        return values, markers, texts
+
+
+
+    export_formats = {'.csv': 'csv', '.md': 'markdown', '.markdown': 'markdown', '.html': 'html', '.htm': 'html'}
+
+
+    def get_css_class(self, style_name: str) -> Tuple[str, str]:
+        """
+        Returns the CSS class name and rule for a style, translating the
+        style's SGR code with utils.sgr_to_css_style. The rule is rebuilt only
+        when the style's code changes.
+
+        The code is looked up as apply_style would, but regardless of
+        plain_output, so exports styled in non-terminal runs keep their colors.
+        Class names are unique per style name.
+        """
+        pc = self.pc
+        code = pc.style_codes.get(style_name, pc.color_map.get(style_name, pc.color_map.get('default', '')))
+        css = self.css_classes.get(style_name)
+        if css is None or css[0] != code:
+            if css is not None:
+                class_name = css[1]
+            else:
+                base_name = 'pc-' + ''.join(c if c.isalnum() or c in '-_' else '-' for c in str(style_name))
+                class_name = base_name
+                suffix = 1
+                while class_name in self.css_class_names:
+                    suffix += 1
+                    class_name = f"{base_name}-{suffix}"
+                self.css_class_names.add(class_name)
+            css = self.css_classes[style_name] = (code, class_name, f".{class_name} {{ {sgr_to_css_style(code)} }}")
+        return css[1], css[2]
+
+
+    def iter_export(self,
+                    table_data: Any = None,
+                    fmt: str = 'csv',
+                    table_name: Optional[str] = None,
+                    col_alignments: Optional[List[str]] = None,
+                    header_style: Optional[str] = None,
+                    header_column_styles: Optional[Dict[int, str]] = None,
+                    default_column_styles: Optional[Dict[int, str]] = None,
+                    specific_headers: Union[Dict[str, Callable[[Any, List[Any], int, int, int], str]], str, None] = None,
+                    cell_style: Optional[Union[str, List[str]]] = None,
+                    conditional_style_functions: Optional[Dict[str, Callable[[Any], Optional[str]]]] = None,
+                    use_styles: bool = True,
+                    chunk_rows: int = 1000,
+                    ) -> Iterator[str]:
+        """
+        Exports a table as CSV, Markdown or HTML, yielding the output in
+        chunks of `chunk_rows` rows. Rows are consumed lazily and no ANSI codes
+        are generated.
+
+        Alignment and styles come from the same TableFormatPlan as
+        generate_table. Markdown uses the alignment of each column. HTML maps
+        each style to a CSS class once (see get_css_class); styles first met
+        while streaming rows get their rules in a style block after the table.
+
+        :param table_data: Rows with the header first (any iterable), or
+                           column-oriented data. If None, the stored table
+                           `table_name` is exported with its own format
+                           parameters.
+        :param fmt: 'csv', 'markdown' or 'html'.
+        :param table_name: Name of a stored table, or the HTML caption.
+        :param col_alignments: A list of strings ('left', 'center', 'right') for column alignments.
+        :param header_style: Style name for the header row (HTML).
+        :param header_column_styles: A dictionary mapping column indices to style names for the header row (HTML).
+        :param default_column_styles: A dictionary mapping column indices to style names for data cells (HTML).
+        :param specific_headers: Header-specific formatting functions. Their cells are exported as plain text.
+        :param cell_style: Style name or list of styles for the table cells (HTML).
+        :param conditional_style_functions: A dictionary defining conditional styles based on cell values (HTML).
+        :param use_styles: Whether to export styles as CSS classes (HTML).
+        :param chunk_rows: Rows per yielded chunk.
+        :return: An iterator over output chunks.
+        """
+        if fmt not in ('csv', 'markdown', 'html'):
+            raise ValueError(f"Invalid fmt '{fmt}'. Choose from ['csv', 'markdown', 'html'].")
+
+        if table_data is None:
+            if table_name not in self.tables:
+                raise ValueError(f"Table '{table_name}' not found in TableManager.")
+            table_info = self.tables[table_name]
+            table_data = table_info["data"]
+            format_params = table_info["format_params"]
+        else:
+            if isinstance(specific_headers, str):
+                specific_headers = self.specific_headers.get(specific_headers, {})
+            format_params = {
+                "col_alignments": col_alignments,
+                "header_style": header_style,
+                "header_column_styles": header_column_styles,
+                "default_column_styles": default_column_styles,
+                "specific_headers": specific_headers,
+                "cell_style": cell_style,
+                "conditional_style_functions": conditional_style_functions,
+                "use_styles": use_styles,
+            }
+
+        columnar = self.to_columns(table_data)
+        if columnar is not None:
+            header, columns = columnar
+            data_rows: Iterator[List[Any]] = zip(*map(self.column_values, columns))
+        else:
+            data_rows = iter(table_data)
+            header = next(data_rows, None)
+            if header is None:
+                return
+        header = [cell.get_value() if isinstance(cell, BoundCell) else cell for cell in header]
+        data_rows = (
+            [cell.get_value() if isinstance(cell, BoundCell) else cell for cell in row]
+            for row in data_rows
+        )
+        plan = self.get_format_plan(header, format_params)
+
+        if fmt == 'csv':
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            writer.writerow(header)
+            while True:
+                chunk = list(islice(data_rows, chunk_rows))
+                writer.writerows(chunk)
+                yield buffer.getvalue()
+                if len(chunk) < chunk_rows:
+                    return
+                buffer.seek(0)
+                buffer.truncate()
+
+        elif fmt == 'markdown':
+            def escape(cell: Any) -> str:
+                return str(cell).replace('|', '\\|').replace('\n', '<br>')
+
+            # Columns aligned by type follow the first data row
+            first = next(data_rows, None)
+            markers = {'left': ':---', 'right': '---:', 'center': ':---:'}
+            lines = [
+                '| ' + ' | '.join(map(escape, header)) + ' |',
+                '| ' + ' | '.join(
+                    markers.get(plan.alignment(first[col_idx] if first else None, col_idx), '---')
+                    for col_idx in range(len(header))
+                ) + ' |',
+            ]
+            if first is not None:
+                data_rows = chain([first], data_rows)
+            while True:
+                chunk = list(islice(data_rows, chunk_rows))
+                lines.extend('| ' + ' | '.join(map(escape, row)) + ' |' for row in chunk)
+                yield '\n'.join(lines) + '\n'
+                if len(chunk) < chunk_rows:
+                    return
+                lines = []
+
+        else:
+            rules = {}  # Style name -> rule, in order of first use
+            late_rules = []
+
+            def cell_html(tag: str, cell: Any, row: List[Any], row_idx: int, col_idx: int) -> str:
+                classes = []
+                style_name = plan.style_name(cell, row, row_idx, col_idx)
+                if style_name is not None:
+                    class_name, rule = self.get_css_class(style_name)
+                    if style_name not in rules:
+                        rules[style_name] = rule
+                        if row_idx:
+                            late_rules.append(rule)
+                    classes.append(class_name)
+                alignment = plan.alignment(cell, col_idx)
+                if alignment in ('right', 'center'):
+                    classes.append(f"pc-align-{alignment}")
+                class_attr = f' class="{" ".join(classes)}"' if classes else ''
+                return f"<{tag}{class_attr}>{html.escape(str(cell))}</{tag}>"
+
+            # Rules for styles known before the rows are read
+            static_styles = []
+            if plan.use_styles:
+                static_styles += [plan.style_name(name, header, 0, col_idx) for col_idx, name in enumerate(header)]
+                static_styles += [style for style in plan.default_styles if style is not plan.UNSTYLED]
+                static_styles += [style for style in plan.cell_styles if style]
+            for style_name in static_styles:
+                if style_name is not None and style_name not in rules:
+                    rules[style_name] = self.get_css_class(style_name)[1]
+
+            head = [
+                '<style>',
+                '.pc-align-right { text-align: right; }',
+                '.pc-align-center { text-align: center; }',
+                *rules.values(),
+                '</style>',
+                '<table class="pc-table">',
+            ]
+            if table_name:
+                head.append(f"<caption>{html.escape(table_name)}</caption>")
+            head.append(
+                '<thead><tr>'
+                + ''.join(cell_html('th', name, header, 0, col_idx) for col_idx, name in enumerate(header))
+                + '</tr></thead>'
+            )
+            head.append('<tbody>')
+            yield '\n'.join(head) + '\n'
+
+            row_idx = 0
+            while True:
+                chunk = list(islice(data_rows, chunk_rows))
+                lines = []
+                for row in chunk:
+                    row_idx += 1
+                    lines.append(
+                        '<tr>'
+                        + ''.join(cell_html('td', cell, row, row_idx, col_idx) for col_idx, cell in enumerate(row))
+                        + '</tr>'
+                    )
+                if lines:
+                    yield '\n'.join(lines) + '\n'
+                if len(chunk) < chunk_rows:
+                    break
+
+            tail = ['</tbody>', '</table>']
+            if late_rules:
+                tail.extend(['<style>', *late_rules, '</style>'])
+            yield '\n'.join(tail) + '\n'
+
+
+    def export_table(self, file: Union[str, os.PathLike, TextIO], table_data: Any = None, fmt: Optional[str] = None, **kwargs: Any) -> None:
+        """
+        Writes a table to a file as CSV, Markdown or HTML, chunk by chunk.
+        See iter_export for the parameters.
+
+        :param file: A path or a text file object.
+        :param table_data: The table data, or None to export the stored table `table_name`.
+        :param fmt: 'csv', 'markdown' or 'html'. Inferred from the file extension if None.
+        """
+        if fmt is None:
+            extension = os.path.splitext(os.fspath(file) if not hasattr(file, 'write') else getattr(file, 'name', ''))[1].lower()
+            fmt = self.export_formats.get(extension)
+            if fmt is None:
+                raise ValueError(f"Cannot infer the export format from '{extension}'. Pass fmt explicitly.")
+
+        chunks = self.iter_export(table_data, fmt, **kwargs)
+        if hasattr(file, 'write'):
+            for chunk in chunks:
+                file.write(chunk)
+        else:
+            with open(file, 'w', encoding='utf-8', newline='') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+
+
     @staticmethod
     def resolve_bound_instances(table_data):
         return [
@@ -361,9 +1393,148 @@ class TableManager:
         return len(self.ansi_escape_pattern.sub('', s))
 
 
-    def refresh_bound_table(self, table_name: str, starting_line: int = 0) -> None:
+    @staticmethod
+    def get_row_line(table_info: Dict[str, Any], row_idx: int) -> int:
+        """
+        Returns the line of a stored table's row, relative to the table's
+        first line being line 1. Row 0 is the header.
+        """
+        layout_params = table_info.get("layout_params", {})
+        data_start_line = table_info["data_start_line"]
+        if row_idx == 0:
+            # The header sits above the header-data separator, if any
+            return data_start_line - (1 if table_info.get("border_line") else 0)
+        step = 2 if layout_params.get("double_space") else 1
+        return data_start_line + 1 + (row_idx - 1) * step
+
+
+    @staticmethod
+    def update_col_widths(table_info: Dict[str, Any], cell_strs: List[List[str]], shrink_after: Optional[int] = None) -> Optional[int]:
+        """
+        Updates a stored table's column widths for new cell values.
+
+        Columns grow as soon as a value no longer fits. With `shrink_after`,
+        a column shrinks only once it has needed less width for that many
+        consecutive calls, so values that flicker between widths do not
+        reflow the table on every refresh. Without it, columns never shrink.
+
+        :param table_info: The stored table, as in self.tables.
+        :param cell_strs: The `str()` of every cell, header row first.
+        :param shrink_after: Consecutive calls before a column shrinks, or None.
+        :return: The index of the leftmost resized column, or None.
+        """
+        max_col_lengths = table_info["max_col_lengths"]
+        needed = [0] * len(max_col_lengths)
+        for row in cell_strs:
+            for col_idx, cell_str in enumerate(row):
+                if len(cell_str) > needed[col_idx]:
+                    needed[col_idx] = len(cell_str)
+
+        shrink_counts = table_info.setdefault("shrink_counts", [0] * len(max_col_lengths))
+        resize_from = None
+        for col_idx, width in enumerate(needed):
+            current = max_col_lengths[col_idx]
+            if width > current:
+                max_col_lengths[col_idx] = width
+                shrink_counts[col_idx] = 0
+            elif width < current and shrink_after is not None:
+                shrink_counts[col_idx] += 1
+                if shrink_counts[col_idx] < shrink_after:
+                    continue
+                max_col_lengths[col_idx] = width
+                shrink_counts[col_idx] = 0
+            else:
+                shrink_counts[col_idx] = 0
+                continue
+            if resize_from is None:
+                resize_from = col_idx
+        return resize_from
+
+
+    def _relayout_output(self,
+                         table_name: str,
+                         resolved_data: List[List[Any]],
+                         resize_from: int,
+                         col_offsets: List[int],
+                         old_border_length: int,
+                         starting_line: int,
+                         markers: Optional[List[List[str]]] = None
+                         ) -> List[str]:
+        """
+        Returns the output that redraws a stored table after its columns from
+        `resize_from` on changed width: those columns on every row, and the
+        borders and title, which span the whole table.
+        """
+        table_info = self.tables[table_name]
+        format_params = table_info.get('format_params', {})
+        layout_params = table_info.get("layout_params", {})
+        max_col_lengths = table_info["max_col_lengths"]
+        col_sep = format_params.get('col_sep', self.col_sep)
+        col_sep_style = format_params.get('col_sep_style')
+        use_styles = format_params.get('use_styles', True) and not self.pc.plain_output
+        header = resolved_data[0]
+
+        if use_styles:
+            styled_col_sep = self.pc.apply_style(col_sep_style, col_sep) if col_sep_style else col_sep
+        else:
+            styled_col_sep = self.pc.apply_color(col_sep_style, col_sep) if col_sep_style else col_sep
+        if format_params.get('target_text_box'):
+            right_edge = self.pc.apply_style(col_sep_style, col_sep.rstrip())
+        else:
+            right_edge = styled_col_sep
+
+        border_length = self.get_border_length(max_col_lengths, col_sep)
+        # Erase what a wider table left behind
+        erase = '\033[K' if border_length < old_border_length else ''
+
+        plan = self.get_format_plan(header, format_params)
+        output = []
+        for row_idx, row in enumerate(resolved_data):
+            cells = [
+                self.format_marked_cell(
+                    plan, row[col_idx], row, row_idx, col_idx, max_col_lengths[col_idx],
+                    markers[row_idx][col_idx] if markers else ''
+                )
+                for col_idx in range(resize_from, len(row))
+            ]
+            y = starting_line + self.get_row_line(table_info, row_idx)
+            output.append(f"\033[{y};{col_offsets[resize_from]}H{styled_col_sep.join(cells)}{right_edge}{erase}")
+
+        border_style = layout_params.get("border_style")
+        border_line = None
+        if border_style:
+            border_line = self.pc.apply_style(border_style, layout_params.get("border_char", self.border_char) * border_length)
+            last_line = self.get_row_line(table_info, len(resolved_data) - 1) + (2 if layout_params.get("double_space") else 1)
+            border_lines = {1, self.get_row_line(table_info, 0) + 1, last_line}
+            if layout_params.get("show_table_name"):
+                border_lines.add(3)
+            for y in sorted(border_lines):
+                output.append(f"\033[{starting_line + y};1H{border_line}{erase}")
+        if layout_params.get("show_table_name"):
+            title_y = starting_line + (2 if border_style else 1)
+            output.append(f"\033[{title_y};1H{self.pc.apply_style(self.title_style, table_name.center(border_length))}{erase}")
+
+        table_info["border_length"] = border_length
+        table_info["border_line"] = border_line
+        return output
+
+
+    def refresh_bound_table(self, table_name: str, starting_line: int = 0, shrink_after: Optional[int] = None) -> Dict[str, int]:
         """
         Refreshes a bound table by updating only changed cells in-place.
+
+        Changed cells are collected into one buffer, each as a cursor move
+        followed by the cell padded to its column width, and written with a
+        single write and flush.
+
+        When a value no longer fits its column, the column widens and only
+        the columns from it to the right are redrawn, along with the borders
+        and title. See update_col_widths for `shrink_after`.
+
+        :param table_name: The name of the bound table.
+        :param starting_line: Screen line the table starts on.
+        :param shrink_after: Consecutive refreshes a column must need less width before it shrinks. None never shrinks.
+        :return: Refresh statistics: 'cells_changed', 'columns_redrawn' and 'bytes_written'.
         """
         if table_name not in self.tables or not self.tables[table_name]["bound"]:
             raise ValueError(f"Table '{table_name}' is not a bound table.")
@@ -372,66 +1543,174 @@ class TableManager:
         table_info = self.tables[table_name]
         table_data = table_info["data"]
         previous_data = self.previous_values[table_name]
-        data_start_line = table_info["data_start_line"]
         format_params = table_info.get('format_params', {})
         max_col_lengths = table_info["max_col_lengths"]
         col_sep = format_params.get('col_sep', " | ")
         target_text_box = format_params.get('target_text_box', False)
 
-        # Adjust data_start_line with starting_line
-        data_start_line += starting_line
-
-        # Resolve BoundCell instances
+        # Resolve BoundCell instances; stale markers count towards the width
         resolved_data = self.resolve_bound_instances(table_data)
+        markers = [[self.cell_marker(cell) for cell in row] for row in table_data]
+        cell_strs = [
+            [f"{cell}{marker}" for cell, marker in zip(row, row_markers)]
+            for row, row_markers in zip(resolved_data, markers)
+        ]
 
         # Get header row
         header = resolved_data[0]
-
-        # Compare and update cells
+        plan = self.get_format_plan(header, format_params)
+
+        # Widen (or, with hysteresis, narrow) columns whose values changed width
+        old_border_length = table_info.get("border_length") or self.get_border_length(max_col_lengths, col_sep)
+        resize_from = self.update_col_widths(table_info, cell_strs, shrink_after)
+
+        # Screen column of each cell, as computed by get_cursor_position
+        x = 1 + (len(col_sep.lstrip()) if target_text_box else len(col_sep))
+        col_offsets = []
+        for col_length in max_col_lengths:
+            col_offsets.append(x)
+            x += col_length + len(col_sep)
+
+        # Compare and collect changed cells left of any resized column
+        output = []
+        cells_changed = 0
         for row_idx, row in enumerate(resolved_data):
+            previous_row = previous_data[row_idx]
+            y = starting_line + self.get_row_line(table_info, row_idx)
             for col_idx, cell in enumerate(row):
-                new_value = str(cell)
-                if new_value != previous_data[row_idx][col_idx]:
+                new_value = cell_strs[row_idx][col_idx]
+                if new_value != previous_row[col_idx]:
+                    cells_changed += 1
+                    previous_row[col_idx] = new_value
+                    if resize_from is not None and col_idx >= resize_from:
+                        continue  # Redrawn with its column below
+
                     # Format cell
-                    aligned_cell = self.format_cell(cell, row, row_idx, col_idx, max_col_lengths, header, format_params)
+                    aligned_cell = self.format_marked_cell(
+                        plan, cell, row, row_idx, col_idx, max_col_lengths[col_idx], markers[row_idx][col_idx]
+                    )
 
-                    # Calculate cursor position
-                    cursor_position = self.get_cursor_position(row_idx, col_idx, max_col_lengths, col_sep, data_start_line, target_text_box)
+                    # Pad to the column width so the old content is overwritten in the same write
+                    cell_length = self.visible_length(aligned_cell) if '\x1b' in aligned_cell else len(aligned_cell)
+                    if cell_length < max_col_lengths[col_idx]:
+                        aligned_cell += ' ' * (max_col_lengths[col_idx] - cell_length)
 
-                    # Move cursor to position
-                    #print(cursor_position, end='')
-                    self.pc.write(cursor_position)
+                    output.append(f"\033[{y};{col_offsets[col_idx]}H")
+                    output.append(aligned_cell)
 
-                    # **Clear the cell area**
-                    #print(' ' * max_col_lengths[col_idx], end='', flush=True)
-                    self.pc.write(' ' * max_col_lengths[col_idx])
+        columns_redrawn = 0
+        if resize_from is not None:
+            output.extend(
+                self._relayout_output(table_name, resolved_data, resize_from, col_offsets, old_border_length, starting_line, markers)
+            )
+            columns_redrawn = len(max_col_lengths) - resize_from
 
-                    # Calculate the visible length of the styled cell
-                    #cell_visible_length = self.visible_length(aligned_cell)
+        bytes_written = 0
+        if output:
+            buffer = ''.join(output)
+            self.pc.write(buffer)
+            bytes_written = len(buffer.encode(getattr(sys.stdout, 'encoding', None) or 'utf-8', 'replace'))
 
-                    # Clear the cell area
-                    #print(' ' * cell_visible_length, end='', flush=True)
+        return {"cells_changed": cells_changed, "columns_redrawn": columns_redrawn, "bytes_written": bytes_written}
 
-                    # Move cursor back to start of cell
-                    #print(cursor_position, end='')
-                    self.pc.write(cursor_position)
 
-                    # Print updated cell content
-                    #print(aligned_cell, end='')
-                    self.pc.write(aligned_cell)
+    @staticmethod
+    def get_async_cells(table_data: List[List[Any]]) -> List[AsyncBoundCell]:
+        """
+        Returns the AsyncBoundCells of a table, row by row.
+        """
+        return [cell for row in table_data for cell in row if isinstance(cell, AsyncBoundCell)]
 
-                    # Update previous data
-                    previous_data[row_idx][col_idx] = new_value
 
-                    """
-                    # Move cursor and print updated cell
-                    print(cursor_position + aligned_cell, end='')
+    async def gather_bound_cells(self, table_name: str) -> int:
+        """
+        Fetches every AsyncBoundCell of a stored table concurrently, each with
+        its own timeout, so a slow source does not hold up the others.
+
+        :param table_name: The name of the bound table.
+        :return: The number of cells whose displayed value changed.
+        """
+        if table_name not in self.tables:
+            raise ValueError(f"Table '{table_name}' not found in TableManager.")
+        cells = self.get_async_cells(self.tables[table_name]["data"])
+        return sum(await asyncio.gather(*(cell.fetch() for cell in cells)))
 
-                    # Update previous data
-                    previous_data[row_idx][col_idx] = new_value
-                    """
 
-        sys.stdout.flush()
+    async def run_bound_table_async(self,
+                                    table_name: str,
+                                    starting_line: int = 0,
+                                    max_fps: Optional[float] = 30.0,
+                                    stop_event: Optional[asyncio.Event] = None,
+                                    shrink_after: Optional[int] = None,
+                                    ) -> Dict[str, int]:
+        """
+        Keeps a bound table updated from its AsyncBoundCells until stopped.
+
+        Every AsyncBoundCell is fetched concurrently on its own interval. When
+        values change, the changed cells are redrawn through
+        refresh_bound_table in one batched write, at most `max_fps` times a
+        second, so changes arriving close together share a frame. Cells with
+        `stale_after` are also redrawn when they become stale. Plain
+        BoundCells are read on each redraw.
+
+        :param table_name: The name of the bound table, already printed.
+        :param starting_line: Screen line the table starts on.
+        :param max_fps: Maximum redraws per second.
+        :param stop_event: Event that stops the loop. Cancelling the task also stops it.
+        :param shrink_after: Redraws a column must need less width before it shrinks.
+        :return: Totals for 'frames', 'cells_changed' and 'bytes_written'.
+        """
+        if table_name not in self.tables or not self.tables[table_name]["bound"]:
+            raise ValueError(f"Table '{table_name}' is not a bound table.")
+
+        cells = self.get_async_cells(self.tables[table_name]["data"])
+        stop_event = stop_event or asyncio.Event()
+        changed = asyncio.Event()
+        frame_period = 1.0 / max_fps if max_fps else 0.0
+        totals = {"frames": 0, "cells_changed": 0, "bytes_written": 0}
+        loop = asyncio.get_running_loop()
+
+        # Wake up without changes often enough to show values going stale
+        stale_periods = [cell.stale_after for cell in cells if cell.stale_after is not None]
+        stale_check = min(stale_periods) / 2 if stale_periods else None
+
+        async def poll(cell: AsyncBoundCell) -> None:
+            next_fetch = loop.time()
+            while True:
+                if await cell.fetch():
+                    changed.set()
+                # Fixed-rate schedule; a slow fetch delays only its own cell
+                next_fetch = max(next_fetch + cell.interval, loop.time())
+                await asyncio.sleep(next_fetch - loop.time())
+
+        pollers = [asyncio.create_task(poll(cell)) for cell in cells]
+        try:
+            while not stop_event.is_set():
+                waiters = [asyncio.ensure_future(changed.wait()), asyncio.ensure_future(stop_event.wait())]
+                try:
+                    await asyncio.wait(waiters, timeout=stale_check, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for waiter in waiters:
+                        waiter.cancel()
+                if stop_event.is_set():
+                    break
+
+                changed.clear()
+                stats = self.refresh_bound_table(table_name, starting_line, shrink_after)
+                if stats["cells_changed"]:
+                    totals["frames"] += 1
+                    totals["cells_changed"] += stats["cells_changed"]
+                    totals["bytes_written"] += stats["bytes_written"]
+
+                # Frame pacing: changes made meanwhile are drawn in the next frame
+                if frame_period:
+                    await asyncio.sleep(frame_period)
+        finally:
+            for poller in pollers:
+                poller.cancel()
+            await asyncio.gather(*pollers, return_exceptions=True)
+
+        return totals
 
 
     def add_bound_table(self, **kwargs) -> str:
@@ -489,31 +1768,188 @@ class TableManager:
 
 
 
-    def live_update(self, table_name: str, update_callback: Callable[[], List[List[Any]]], interval: float = 1.0):
+    def _prepare_live_data(self, table_data: Any) -> List[List[Any]]:
+        """
+        Returns table data as a list of rows, converting column-oriented data.
         """
-        Creates a live-updating table that refreshes at a specified interval.
+        columnar = self.to_columns(table_data)
+        if columnar is None:
+            return table_data
+        header, columns = columnar
+        return [list(header)] + [list(row) for row in zip(*map(self.column_values, columns))]
 
-        Args:
-            table_name (str): The name of the table to update.
-            update_callback (Callable): A function that returns updated table data.
-            interval (float): Time in seconds between updates.
+
+    def _begin_live(self, table_name: str, use_alt_buffer: bool) -> None:
+        """
+        Takes over the screen and draws the stored table at the top left.
+        """
+        table_info = self.tables[table_name]
+        if table_name not in self.previous_values:
+            self.previous_values[table_name] = [
+                [str(cell) for cell in row]
+                for row in self.resolve_bound_instances(table_info["data"])
+            ]
+        screen = ('alt_buffer',) if use_alt_buffer else ()
+        self.pc.write(*screen, 'hide_cursor', 'cursor_home', 'clear_screen', table_info["generated_table"])
+
+
+    def _end_live(self, use_alt_buffer: bool) -> None:
+        """
+        Restores the screen and cursor after a live update.
+        """
+        if use_alt_buffer:
+            self.pc.write('normal_buffer', 'show_cursor')
+        else:
+            self.pc.write('show_cursor', '\n')
+
+
+    def _live_tick(self, table_name: str, table_data: Optional[Any], shrink_after: Optional[int] = None) -> Dict[str, int]:
+        """
+        Applies new table data, if any, and redraws what changed.
+
+        Data of the same shape is diffed cell by cell through
+        refresh_bound_table. A change of shape regenerates and repaints the
+        whole table.
+        """
+        table_info = self.tables[table_name]
+        if table_data is not None:
+            table_data = self._prepare_live_data(table_data)
+            previous_data = self.previous_values[table_name]
+            if len(table_data) != len(previous_data) or any(
+                len(row) != len(previous_row) for row, previous_row in zip(table_data, previous_data)
+            ):
+                table_str = self.generate_table(
+                    table_data,
+                    table_name=table_name,
+                    **table_info["format_params"],
+                    **table_info.get("layout_params", {}),
+                )
+                self.previous_values[table_name] = [
+                    [str(cell) for cell in row]
+                    for row in self.resolve_bound_instances(table_data)
+                ]
+                self.pc.write('cursor_home', 'clear_screen', table_str)
+                return {
+                    "cells_changed": sum(map(len, table_data)),
+                    "columns_redrawn": len(table_data[0]),
+                    "bytes_written": len(table_str.encode('utf-8', 'replace')),
+                }
+            table_info["data"] = table_data
+        return self.refresh_bound_table(table_name, shrink_after=shrink_after)
+
+
+    def live_update(self,
+                    table_name: str,
+                    update_callback: Optional[Callable[[], Any]] = None,
+                    interval: float = 1.0,
+                    max_fps: Optional[float] = 30.0,
+                    use_alt_buffer: bool = True,
+                    stop_event: Optional[threading.Event] = None,
+                    max_ticks: Optional[int] = None,
+                    shrink_after: Optional[int] = None,
+                    ) -> Dict[str, int]:
+        """
+        Keeps a stored table updated on screen until cancelled.
+
+        The table is drawn once, then only changed cells are rewritten each
+        tick (see refresh_bound_table), so a tick costs in proportion to the
+        cells that changed. Runs until `stop_event` is set, `max_ticks` is
+        reached or KeyboardInterrupt; the screen and cursor are restored in
+        all cases.
+
+        :param table_name: The name of the table to update.
+        :param update_callback: A function returning updated table data (rows or column-oriented). If None, the table's BoundCells provide the values.
+        :param interval: Time in seconds between updates.
+        :param max_fps: Maximum redraws per second, capping small intervals.
+        :param use_alt_buffer: Draw in the alternate screen buffer and restore the screen on exit.
+        :param stop_event: Event that stops the loop, e.g. from another thread.
+        :param max_ticks: Stop after this many updates.
+        :param shrink_after: Ticks a column must need less width before it shrinks. None never shrinks; columns always grow to fit.
+        :return: Totals for 'ticks', 'cells_changed' and 'bytes_written'.
         """
         if table_name not in self.tables:
             raise ValueError(f"Table '{table_name}' not found in TableManager.")
 
+        period = max(interval, 1.0 / max_fps if max_fps else 0.0)
+        stop_event = stop_event or threading.Event()
+        totals = {"ticks": 0, "cells_changed": 0, "bytes_written": 0}
+
+        self._begin_live(table_name, use_alt_buffer)
         try:
-            while True:
-                # Fetch the latest table data
-                self.tables[table_name]["data"] = update_callback()
+            next_tick = time.monotonic()
+            while not stop_event.is_set() and (max_ticks is None or totals["ticks"] < max_ticks):
+                stats = self._live_tick(table_name, update_callback() if update_callback else None, shrink_after)
+                totals["ticks"] += 1
+                totals["cells_changed"] += stats["cells_changed"]
+                totals["bytes_written"] += stats["bytes_written"]
+
+                # Fixed-rate schedule; skip missed ticks instead of bursting to catch up
+                next_tick = max(next_tick + period, time.monotonic())
+                stop_event.wait(next_tick - time.monotonic())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._end_live(use_alt_buffer)
+
+        return totals
+
+
+    async def live_update_async(self,
+                                table_name: str,
+                                update_callback: Optional[Callable[[], Any]] = None,
+                                interval: float = 1.0,
+                                max_fps: Optional[float] = 30.0,
+                                use_alt_buffer: bool = True,
+                                stop_event: Optional[asyncio.Event] = None,
+                                max_ticks: Optional[int] = None,
+                                shrink_after: Optional[int] = None,
+                                ) -> Dict[str, int]:
+        """
+        Asynchronous variant of live_update. `update_callback` may be a
+        coroutine function. Cancelling the task stops the loop and restores
+        the screen before the cancellation propagates.
+
+        :param table_name: The name of the table to update.
+        :param update_callback: A function or coroutine function returning updated table data. If None, the table's BoundCells provide the values.
+        :param interval: Time in seconds between updates.
+        :param max_fps: Maximum redraws per second, capping small intervals.
+        :param use_alt_buffer: Draw in the alternate screen buffer and restore the screen on exit.
+        :param stop_event: Event that stops the loop.
+        :param max_ticks: Stop after this many updates.
+        :param shrink_after: Ticks a column must need less width before it shrinks. None never shrinks; columns always grow to fit.
+        :return: Totals for 'ticks', 'cells_changed' and 'bytes_written'.
+        """
+        if table_name not in self.tables:
+            raise ValueError(f"Table '{table_name}' not found in TableManager.")
 
-                # Clear the previous output
-                os.system('clear')
-                print(self.generate_table(self.tables[table_name]["data"], table_name=table_name))
+        period = max(interval, 1.0 / max_fps if max_fps else 0.0)
+        stop_event = stop_event or asyncio.Event()
+        totals = {"ticks": 0, "cells_changed": 0, "bytes_written": 0}
+        loop = asyncio.get_running_loop()
 
-                # Wait before updating again
-                time.sleep(interval)
-        except KeyboardInterrupt:
-            print("Live update terminated.")
+        self._begin_live(table_name, use_alt_buffer)
+        try:
+            next_tick = loop.time()
+            while not stop_event.is_set() and (max_ticks is None or totals["ticks"] < max_ticks):
+                table_data = None
+                if update_callback:
+                    table_data = update_callback()
+                    if inspect.isawaitable(table_data):
+                        table_data = await table_data
+                stats = self._live_tick(table_name, table_data, shrink_after)
+                totals["ticks"] += 1
+                totals["cells_changed"] += stats["cells_changed"]
+                totals["bytes_written"] += stats["bytes_written"]
+
+                next_tick = max(next_tick + period, loop.time())
+                try:
+                    await asyncio.wait_for(stop_event.wait(), next_tick - loop.time())
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._end_live(use_alt_buffer)
+
+        return totals
 
 
 
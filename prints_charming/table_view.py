@@ -0,0 +1,415 @@
+# table_view.py
+
+import numbers
+from bisect import bisect_left, insort
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .table_manager import TableManager, BoundCell
+
+
+
+def sort_key(value: Any) -> Tuple[int, Any]:
+    """
+    Sort key that orders mixed column values without raising: numbers
+    (including NumPy scalars and Decimal) first, then everything else by
+    `str()`, then NaN, then None. NaN gets its own bucket because it does
+    not compare with anything, and the sort indexes need a strict order.
+    """
+    if value is None:
+        return (3, '')
+    if isinstance(value, (numbers.Real, Decimal)):
+        try:
+            if value != value:
+                return (2, '')
+        except ArithmeticError:
+            return (2, '')  # Signaling Decimal NaN
+        return (0, value)
+    return (1, str(value))
+
+
+
+
+class TableView:
+    """
+    Interactive view over a large table: sort, filter and scroll without
+    re-sorting the data or regenerating the whole table.
+
+    - Sorting uses one index list per column (row numbers ordered by value),
+      built the first time the column is sorted and kept up to date by
+      append_rows and update_cell.
+    - Filters are kept as one mask per filter (a bytearray with one byte per
+      row), combined when the view changes.
+    - Only the `height` rows of the viewport are formatted. draw() prints the
+      view at a fixed screen position; after that, scroll() and refresh()
+      rewrite only the screen lines that changed, using the terminal's scroll
+      region to move the lines that stay visible when scrolling by less than
+      a page.
+
+    Column widths are fixed when the view is created (from `col_widths` or
+    from all rows), so the layout does not move while scrolling. Wider
+    values are truncated.
+    """
+
+    def __init__(self,
+                 table_manager: TableManager,
+                 table_data: Any,
+                 height: int = 20,
+                 col_widths: Optional[Union[List[int], Dict[str, int]]] = None,
+                 border_char: str = "-",
+                 col_sep: str = " | ",
+                 border_style: Optional[str] = None,
+                 col_sep_style: Optional[str] = None,
+                 header_style: Optional[str] = None,
+                 header_column_styles: Optional[Dict[int, str]] = None,
+                 col_alignments: Optional[List[str]] = None,
+                 default_column_styles: Optional[Dict[int, str]] = None,
+                 specific_headers: Union[Dict[str, Callable[[Any, List[Any], int, int, int], str]], str, None] = None,
+                 cell_style: Optional[Union[str, List[str]]] = None,
+                 conditional_style_functions: Optional[Dict[str, Callable[[Any], Optional[str]]]] = None,
+                 use_styles: bool = True,
+                 ) -> None:
+        """
+        :param table_manager: The TableManager used for formatting.
+        :param table_data: Rows with the header first, or column-oriented data
+                           (see TableManager.generate_table).
+        :param height: Number of data rows in the viewport.
+        :param col_widths: Optional column widths: a list, or a dict mapping header
+                           names to widths. Computed from all rows if not given.
+        :param border_char: Character used for table borders.
+        :param col_sep: Column separator string.
+        :param border_style: Style name for the table borders.
+        :param col_sep_style: Style name for the column separators.
+        :param header_style: Style name for the header row.
+        :param header_column_styles: A dictionary mapping column indices to style names for the header row.
+        :param col_alignments: A list of strings ('left', 'center', 'right') for column alignments.
+        :param default_column_styles: A dictionary mapping column indices to style names for data cells.
+        :param specific_headers: Header-specific formatting functions, or the name of a stored configuration.
+        :param cell_style: Style name or list of styles for the table cells.
+        :param conditional_style_functions: A dictionary defining conditional styles based on cell values.
+        :param use_styles: Whether to use styles (True) or plain text (False).
+        """
+        self.tm = table_manager
+        self.pc = table_manager.pc
+        self.height = max(1, height)
+
+        columnar = self.tm.to_columns(table_data)
+        if columnar is not None:
+            header, columns = columnar
+            rows = [list(row) for row in zip(*map(self.tm.column_values, columns))]
+        else:
+            header, rows = table_data[0], [list(row) for row in table_data[1:]]
+        self.header = list(header)
+        self.rows: List[List[Any]] = self.tm.resolve_bound_instances(rows)
+
+        if col_widths is None:
+            self.col_widths = self.tm.compute_col_widths([self.header] + self.rows)
+        elif isinstance(col_widths, dict):
+            self.col_widths = [max(col_widths.get(str(name), 0), len(str(name))) for name in self.header]
+        else:
+            widths = list(col_widths) + [0] * (len(self.header) - len(col_widths))
+            self.col_widths = [max(width, len(str(name))) for width, name in zip(widths, self.header)]
+
+        if self.pc.plain_output:
+            use_styles = False
+        if use_styles:
+            self.styled_col_sep = self.pc.apply_style(col_sep_style, col_sep) if col_sep_style else col_sep
+        else:
+            self.styled_col_sep = self.pc.apply_color(col_sep_style, col_sep) if col_sep_style else col_sep
+        if isinstance(specific_headers, str):
+            specific_headers = self.tm.specific_headers.get(specific_headers, {})
+
+        self.format_params = {
+            "col_alignments": col_alignments,
+            "col_sep": col_sep,
+            "col_sep_style": col_sep_style,
+            "header_style": header_style,
+            "header_column_styles": header_column_styles,
+            "default_column_styles": default_column_styles,
+            "specific_headers": specific_headers,
+            "cell_style": cell_style,
+            "conditional_style_functions": conditional_style_functions,
+            "use_styles": use_styles,
+            "target_text_box": False,
+        }
+        self.border_length = self.tm.get_border_length(self.col_widths, col_sep)
+        self.border_line = self.pc.apply_style(border_style, border_char * self.border_length) if border_style else None
+
+        # column -> row numbers ordered by (value, row number), built lazily
+        self.sort_indexes: Dict[int, List[int]] = {}
+        self.sort_column: Optional[int] = None
+        self.descending = False
+
+        # filter name -> (column or None, predicate, mask)
+        self.filters: Dict[str, Tuple[Optional[int], Callable[[Any], bool], bytearray]] = {}
+
+        self.offset = 0
+        self.starting_line = 0
+        self.is_drawn = False
+        self._order: Optional[List[int]] = None
+        self._drawn: Optional[List[str]] = None
+
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the table."""
+        return len(self.rows)
+
+
+    @property
+    def visible_count(self) -> int:
+        """Number of rows that pass the filters."""
+        return len(self.order)
+
+
+    def column_index(self, column: Union[int, str]) -> int:
+        """
+        Returns the index of a column given by index or header name.
+        """
+        if isinstance(column, int):
+            return column
+        try:
+            return self.header.index(column)
+        except ValueError:
+            raise ValueError(f"Unknown column '{column}'. Choose from {self.header}.")
+
+
+    def _index_key(self, col_idx: int) -> Callable[[int], Tuple[Tuple[int, Any], int]]:
+        rows = self.rows
+        return lambda i: (sort_key(rows[i][col_idx]), i)
+
+
+    def get_sort_index(self, column: Union[int, str]) -> List[int]:
+        """
+        Returns the row numbers ordered by a column, building the index on first use.
+        """
+        col_idx = self.column_index(column)
+        index = self.sort_indexes.get(col_idx)
+        if index is None:
+            index = self.sort_indexes[col_idx] = sorted(range(len(self.rows)), key=self._index_key(col_idx))
+        return index
+
+
+    def sort_by(self, column: Optional[Union[int, str]], descending: bool = False) -> None:
+        """
+        Orders the view by a column. None restores the original row order.
+        """
+        self.sort_column = None if column is None else self.column_index(column)
+        self.descending = descending
+        self._order = None
+
+
+    def set_filter(self, name: str, predicate: Callable[[Any], bool], column: Optional[Union[int, str]] = None) -> None:
+        """
+        Adds or replaces a named filter. Rows are shown only if every filter keeps them.
+
+        :param name: The filter's name.
+        :param predicate: Called with the cell value if `column` is given, otherwise with the row.
+        :param column: Optional column, by index or header name.
+        """
+        col_idx = None if column is None else self.column_index(column)
+        if col_idx is None:
+            mask = bytearray(bool(predicate(row)) for row in self.rows)
+        else:
+            mask = bytearray(bool(predicate(row[col_idx])) for row in self.rows)
+        self.filters[name] = (col_idx, predicate, mask)
+        self._order = None
+
+
+    def remove_filter(self, name: str) -> None:
+        """Removes a named filter, if present."""
+        if self.filters.pop(name, None) is not None:
+            self._order = None
+
+
+    def clear_filters(self) -> None:
+        """Removes all filters."""
+        self.filters.clear()
+        self._order = None
+
+
+    @property
+    def order(self) -> List[int]:
+        """Row numbers of the rows that pass the filters, in view order."""
+        if self._order is None:
+            if self.sort_column is None:
+                order = range(len(self.rows))
+            else:
+                order = self.get_sort_index(self.sort_column)
+            if self.descending:
+                order = reversed(order)
+
+            masks = [mask for _, _, mask in self.filters.values()]
+            if not masks:
+                self._order = list(order)
+            elif len(masks) == 1:
+                mask = masks[0]
+                self._order = [i for i in order if mask[i]]
+            else:
+                self._order = [i for i in order if all(mask[i] for mask in masks)]
+        return self._order
+
+
+    def append_rows(self, rows: List[List[Any]]) -> None:
+        """
+        Appends rows, inserting them into the built sort indexes and filter
+        masks instead of rebuilding them.
+        """
+        start = len(self.rows)
+        self.rows.extend(self.tm.resolve_bound_instances(rows))
+        for col_idx, index in self.sort_indexes.items():
+            key = self._index_key(col_idx)
+            for i in range(start, len(self.rows)):
+                insort(index, i, key=key)
+        for col_idx, predicate, mask in self.filters.values():
+            for row in self.rows[start:]:
+                mask.append(bool(predicate(row if col_idx is None else row[col_idx])))
+        self._order = None
+
+
+    def update_cell(self, row_number: int, column: Union[int, str], value: Any) -> None:
+        """
+        Sets one cell, repositioning the row in that column's sort index and
+        re-evaluating the filters for that row only.
+
+        :param row_number: Index of the data row (0 is the first row after the header).
+        :param column: The column, by index or header name.
+        :param value: The new value.
+        """
+        col_idx = self.column_index(column)
+        if isinstance(value, BoundCell):
+            value = value.get_value()
+        index = self.sort_indexes.get(col_idx)
+        key = self._index_key(col_idx)
+        if index is not None:
+            del index[bisect_left(index, key(row_number), key=key)]
+        self.rows[row_number][col_idx] = value
+        if index is not None:
+            insort(index, row_number, key=key)
+
+        row = self.rows[row_number]
+        for filter_col, predicate, mask in self.filters.values():
+            mask[row_number] = bool(predicate(row if filter_col is None else row[filter_col]))
+        self._order = None
+
+
+    def scroll_to(self, offset: int) -> Dict[str, int]:
+        """
+        Moves the viewport so the row at `offset` (in view order) is at the top,
+        and redraws what changed if the view is on screen.
+
+        :return: Redraw statistics, see refresh.
+        """
+        previous = self.offset
+        self.offset = max(0, min(offset, self.visible_count - self.height))
+        return self.refresh(scrolled=self.offset - previous)
+
+
+    def scroll(self, delta: int) -> Dict[str, int]:
+        """Scrolls the viewport by `delta` rows (negative scrolls up)."""
+        return self.scroll_to(self.offset + delta)
+
+
+    def page_down(self) -> Dict[str, int]:
+        """Scrolls down by one viewport."""
+        return self.scroll(self.height)
+
+
+    def page_up(self) -> Dict[str, int]:
+        """Scrolls up by one viewport."""
+        return self.scroll(-self.height)
+
+
+    def viewport_rows(self) -> List[int]:
+        """Row numbers shown in the viewport, top to bottom."""
+        order = self.order
+        # Sorting or filtering may have shortened the view
+        self.offset = max(0, min(self.offset, len(order) - self.height))
+        return order[self.offset:self.offset + self.height]
+
+
+    def render_lines(self) -> List[str]:
+        """
+        Returns the lines of the view: borders, header and the viewport rows,
+        padded with empty lines up to `height`.
+        """
+        tm = self.tm
+        lines = []
+        if self.border_line:
+            lines.append(self.border_line)
+        lines.append(tm.format_row(self.header, 0, self.col_widths, self.header, self.format_params, self.styled_col_sep))
+        if self.border_line:
+            lines.append(self.border_line)
+
+        for position, row_number in enumerate(self.viewport_rows(), start=self.offset + 1):
+            row, markers, texts = tm.truncate_row(self.rows[row_number], self.col_widths)
+            lines.append(tm.format_row(row, position, self.col_widths, self.header, self.format_params, self.styled_col_sep, markers, texts))
+        lines.extend([''] * (self.height - (len(lines) - (3 if self.border_line else 1))))
+
+        if self.border_line:
+            lines.append(self.border_line)
+        return lines
+
+
+    def render(self) -> str:
+        """Returns the view as a string."""
+        return '\n'.join(self.render_lines())
+
+
+    def draw(self, starting_line: int = 0) -> Dict[str, int]:
+        """
+        Prints the whole view at a fixed screen position; later scroll() and
+        refresh() calls update it in place.
+
+        :param starting_line: Screen lines above the view, as in TableManager.refresh_bound_table.
+        """
+        self.starting_line = starting_line
+        self.is_drawn = True
+        self._drawn = None
+        return self.refresh()
+
+
+    def refresh(self, scrolled: int = 0) -> Dict[str, int]:
+        """
+        Rewrites the screen lines of a drawn view that changed, in one write.
+
+        When the viewport moved by less than a page, the rows that stay
+        visible are moved with the terminal's scroll region instead of being
+        rewritten.
+
+        :param scrolled: Rows the viewport moved since the last refresh.
+        :return: Statistics: 'lines_written' and 'bytes_written'.
+        """
+        if not self.is_drawn:
+            return {"lines_written": 0, "bytes_written": 0}
+
+        lines = self.render_lines()
+        drawn = self._drawn if self._drawn is not None and len(self._drawn) == len(lines) else [None] * len(lines)
+        output = []
+
+        viewport_start = 3 if self.border_line else 1
+        if self._drawn is not None and 0 < abs(scrolled) < self.height:
+            top = self.starting_line + 1 + viewport_start
+            bottom = top + self.height - 1
+            viewport = drawn[viewport_start:viewport_start + self.height]
+            if scrolled > 0:
+                output.append(f"\033[{top};{bottom}r\033[{scrolled}S\033[r")
+                viewport = viewport[scrolled:] + [''] * scrolled
+            else:
+                output.append(f"\033[{top};{bottom}r\033[{-scrolled}T\033[r")
+                viewport = [''] * -scrolled + viewport[:scrolled]
+            drawn[viewport_start:viewport_start + self.height] = viewport
+
+        lines_written = 0
+        for i, line in enumerate(lines):
+            if line != drawn[i]:
+                output.append(f"\033[{self.starting_line + 1 + i};1H{line}\033[K")
+                lines_written += 1
+        self._drawn = lines
+
+        bytes_written = 0
+        if output:
+            buffer = ''.join(output)
+            self.pc.write(buffer)
+            bytes_written = len(buffer.encode('utf-8', 'replace'))
+        return {"lines_written": lines_written, "bytes_written": bytes_written}
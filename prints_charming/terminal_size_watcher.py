@@ -20,6 +20,7 @@ class TerminalSizeWatcher:
         self.is_watching = False  # Flag to indicate if the watcher is active
         self.stop_watching_flag = False  # Flag to stop the watcher thread
         self.watcher_thread = None
+        self.resize_callbacks = []  # Called with (width, height) after a resize
 
         # Initialize terminal dimensions
         self.pc.terminal_width, self.pc.terminal_height = self.get_terminal_size()
@@ -56,9 +57,30 @@ class TerminalSizeWatcher:
                     # Ultimate fallback
                     return 80, 24
 
+    def add_resize_callback(self, callback):
+        """
+        Register a callback called with (width, height) whenever the terminal
+        size changes, so consumers can cache the width instead of querying it.
+        """
+        if callback not in self.resize_callbacks:
+            self.resize_callbacks.append(callback)
+
+
+    def remove_resize_callback(self, callback):
+        """Unregister a callback added with add_resize_callback."""
+        if callback in self.resize_callbacks:
+            self.resize_callbacks.remove(callback)
+
+
+    def notify_resize(self):
+        for callback in list(self.resize_callbacks):
+            callback(self.pc.terminal_width, self.pc.terminal_height)
+
+
     def update_terminal_size(self, signum=None, frame=None):
         """Update terminal size on resize."""
         self.pc.terminal_width, self.pc.terminal_height = self.get_terminal_size()
+        self.notify_resize()
         #print(f"Terminal resized: {self.pc.terminal_width}x{self.pc.terminal_height}")
 
 
@@ -68,6 +90,7 @@ class TerminalSizeWatcher:
             width, height = self.get_terminal_size()
             if (width, height) != (self.pc.terminal_width, self.pc.terminal_height):
                 self.pc.terminal_width, self.pc.terminal_height = width, height
+                self.notify_resize()
                 print(f"Terminal resized: {self.pc.terminal_width}x{self.pc.terminal_height}")
             time.sleep(0.5)  # Adjust polling interval as needed
 
@@ -0,0 +1,54 @@
+import gzip
+import logging
+
+from prints_charming.logging.archive_handler import PrintsCharmingArchiveHandler
+
+
+def make_handler(path, **kwargs):
+    handler = PrintsCharmingArchiveHandler(str(path), max_bytes=100, backup_count=3, **kwargs)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    return handler
+
+
+def write(handler, *messages):
+    for message in messages:
+        handler.handle(logging.makeLogRecord({'msg': message}))
+
+
+def test_rotation_counts_existing_size_after_reopen(tmp_path):
+    path = tmp_path / 'app.log'
+
+    handler = make_handler(path, compression=None)
+    write(handler, *['a' * 9] * 6)
+    handler.close()
+    assert path.stat().st_size == 60
+
+    handler = make_handler(path, compression=None)
+    write(handler, *['b' * 9] * 6)
+    handler.close()
+
+    # Without the existing 60 bytes the second handler would never reach max_bytes
+    rotated = (tmp_path / 'app.log.1').read_text()
+    assert len(rotated) >= 100
+    assert rotated + path.read_text() == 'aaaaaaaaa\n' * 6 + 'bbbbbbbbb\n' * 6
+
+
+def test_gzip_archive_is_readable_after_reopen(tmp_path):
+    path = tmp_path / 'app.log.gz'
+
+    for message in ('first', 'second'):
+        handler = make_handler(path)
+        write(handler, message)
+        handler.close()
+
+    assert gzip.decompress(path.read_bytes()) == b'first\nsecond\n'
+
+
+def test_records_after_close_are_dropped(tmp_path):
+    handler = make_handler(tmp_path / 'app.log', compression=None)
+    handler.close()
+
+    write(handler, 'late')
+
+    assert handler.dropped_records == 1
+    assert (tmp_path / 'app.log').read_bytes() == b''
@@ -0,0 +1,57 @@
+import sys
+import traceback
+
+import pytest
+
+from prints_charming.exceptions.base_exceptions import format_bounded_traceback
+
+
+def recurse(n):
+    return recurse(n + 1)
+
+
+def raise_chained():
+    try:
+        {}['missing']
+    except KeyError as e:
+        raise ValueError('bad value') from e
+
+
+def capture(func, *args):
+    try:
+        func(*args)
+    except BaseException:
+        return sys.exc_info()
+    pytest.fail('no exception raised')
+
+
+@pytest.mark.parametrize('func, args', [
+    (recurse, (0,)),
+    (raise_chained, ()),
+    (int, ('x',)),
+])
+def test_unbounded_matches_format_exception(func, args):
+    exc_info = capture(func, *args)
+    expected = ''.join(traceback.format_exception(*exc_info))
+    assert format_bounded_traceback(*exc_info, collapse_repeats=False) == expected
+
+
+def test_recursion_is_collapsed():
+    exc_info = capture(recurse, 0)
+    expected = ''.join(traceback.format_exception(*exc_info))
+    collapsed = format_bounded_traceback(*exc_info)
+    assert len(collapsed.splitlines()) <= len(expected.splitlines())
+    assert 'more times]' in collapsed
+    assert collapsed.endswith(expected.splitlines(keepends=True)[-1])
+
+
+def test_max_frames_and_max_chain():
+    exc_info = capture(recurse, 0)
+    bounded = format_bounded_traceback(*exc_info, max_frames=4, collapse_repeats=False)
+    assert 'frames omitted' in bounded or 'more time' in bounded
+
+    exc_info = capture(raise_chained)
+    bounded = format_bounded_traceback(*exc_info, max_chain=1)
+    assert 'KeyError' not in bounded
+    assert '1 earlier chained exception(s) omitted' in bounded
+    assert bounded.rstrip().endswith('ValueError: bad value')
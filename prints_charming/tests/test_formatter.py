@@ -0,0 +1,33 @@
+import logging
+
+import pytest
+
+from prints_charming import PrintsCharming
+from prints_charming.logging.formatter import PrintsCharmingFormatter
+
+
+def make_record(lineno=1):
+    return logging.LogRecord('app', logging.INFO, '/src/app.py', lineno, 'hello %s', ('world',), None, func='main')
+
+
+@pytest.fixture
+def formatter():
+    return PrintsCharmingFormatter(PrintsCharming(plain_output=False), call_site_cache_size=2)
+
+
+def test_style_record_attributes_is_deprecated_and_leaves_record_alone(formatter):
+    record = make_record()
+
+    with pytest.warns(DeprecationWarning):
+        styled = formatter.style_record_attributes(record)
+
+    assert styled['filename'] == formatter.apply_style('filename', 'app.py')
+    assert styled['lineno'] == formatter.apply_style('line_number', 1)
+    assert (record.filename, record.name, record.funcName, record.lineno) == ('app.py', 'app', 'main', 1)
+
+
+def test_call_site_prefix_cache_is_bounded_lru(formatter):
+    for lineno in (1, 2, 1, 3):
+        formatter.format(make_record(lineno))
+
+    assert [key[2] for key in formatter._prefix_cache] == [1, 3]
@@ -0,0 +1,70 @@
+import re
+
+import pytest
+
+from prints_charming import PrintsCharming
+from prints_charming.frame_builder import FrameBuilder
+
+
+SGR = re.compile(r'\x1b\[[0-9;]*m')
+
+
+@pytest.fixture
+def pc():
+    return PrintsCharming(plain_output=False)
+
+
+@pytest.fixture
+def fb(pc):
+    return FrameBuilder(pc=pc, horiz_width=40, horiz_char='-')
+
+
+@pytest.mark.parametrize('params', [
+    dict(),
+    dict(text_styles='green', text_alignments='left'),
+    dict(text_styles=['red', 'blue', 'vblue'], text_alignments=['right', 'left', 'center'],
+         horiz_border_top_style='vblue', vert_border_left=False),
+    dict(table_strs=['ab\ncd', '\x1b[31mx\x1b[0m'], horiz_border_top=False, vert_border_right=False),
+])
+@pytest.mark.parametrize('texts', [
+    ['hello', 'world wide web of many many words here', 'x'],
+    ['', '  ', 'a\n\nb'],
+    ['averyveryveryveryveryveryveryverylongword', 'q', 'r'],
+])
+def test_template_matches_generate_frame(fb, params, texts):
+    template = fb.compile_frame(['a', 'b', 'c'], **params)
+    expected = fb.generate_frame(texts=texts, ephemeral=True, **params)
+    assert template.render(a=texts[0], b=texts[1], c=texts[2]) == expected
+
+
+@pytest.mark.parametrize('width', [5, 10, 17, 30])
+def test_styled_wrapping_matches_plain_wrapping(pc, fb, width):
+    text = 'status: ' + pc.apply_style('red', 'very bad things are happening now') + ' ok done'
+
+    styled = fb.split_text_to_lines_with_widths(text, width)
+    plain = fb.split_text_to_lines_with_widths(pc.remove_ansi_codes(text), width)
+
+    assert [(pc.remove_ansi_codes(line), w) for line, w in styled] == plain
+    for line, _ in styled:
+        # Every wrapped line closes the style it opens
+        codes = ''
+        for code in SGR.findall(line):
+            codes = '' if code == pc.reset else codes + code
+        assert codes == '', repr(line)
+
+
+def test_styled_frame_lines_have_equal_width(pc, fb):
+    text = 'status: ' + pc.apply_style('red', 'very bad things are happening now') + ' ok done'
+    frame = fb.generate_frame(texts=[text], ephemeral=True)
+    assert len({len(pc.remove_ansi_codes(line)) for line in frame.split('\n')}) == 1
+
+
+@pytest.mark.parametrize('old, new, span', [
+    ('abc', 'ab', (2, ' ')),
+    ('ab漢字cd', 'ab漢子cd', (4, '子')),
+    ('漢字x', 'a字x', (0, 'a字x ')),
+    ('\x1b[31m日本\x1b[0m!', '\x1b[31m日本\x1b[0m?', (4, '?')),
+    ('same', 'same', None),
+])
+def test_changed_span_uses_display_columns(fb, old, new, span):
+    assert fb.get_changed_span(old, new) == span
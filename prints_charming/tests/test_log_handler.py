@@ -0,0 +1,126 @@
+import logging
+
+import pytest
+
+from prints_charming import PrintsCharming
+from prints_charming.logging.formatter import PrintsCharmingFormatter
+from prints_charming.logging.log_handler import PrintsCharmingQueueHandler, PrintsCharmingRingBufferHandler
+
+
+@pytest.fixture
+def pc():
+    return PrintsCharming(plain_output=True)
+
+
+def make_record(msg, *args):
+    return logging.LogRecord('test', logging.INFO, 'app.py', 1, msg, args, None)
+
+
+def queued_messages(handler):
+    return [record.getMessage() for record in list(handler.queue.queue)]
+
+
+def make_queue_handler(pc, **kwargs):
+    return PrintsCharmingQueueHandler(pc, formatter=logging.Formatter('%(message)s'), **kwargs)
+
+
+@pytest.mark.parametrize('policy, kept, dropped', [
+    ('block', ['0', '1'], 1),
+    ('drop', ['0', '1'], 1),
+    ('drop_oldest', ['1', '2'], 1),
+])
+def test_overflow_policies(pc, policy, kept, dropped):
+    handler = make_queue_handler(pc, queue_size=2, overflow_policy=policy, block_timeout=0.01, auto_start=False)
+
+    for i in range(3):
+        handler.handle(make_record(str(i)))
+
+    assert queued_messages(handler) == kept
+    assert handler.dropped_records == dropped
+
+
+def test_close_writes_pending_records(pc, capsys):
+    handler = make_queue_handler(pc, auto_start=False)
+    for i in range(5):
+        handler.handle(make_record('record %s', i))
+
+    handler.start()
+    handler.close()
+
+    lines = [line.rstrip() for line in capsys.readouterr().out.splitlines()]
+    assert lines == [f'record {i}' for i in range(5)]
+
+
+@pytest.mark.parametrize('formatter', [
+    logging.Formatter('%(message)s'),
+    PrintsCharmingFormatter(PrintsCharming(plain_output=False)),
+], ids=['stdlib', 'prints_charming'])
+def test_message_is_snapshot_when_queued(pc, formatter):
+    handler = PrintsCharmingQueueHandler(pc, formatter=formatter, auto_start=False)
+    items = ['a']
+
+    handler.handle(make_record('items %s', items))
+    items.append('b')
+
+    record = handler.queue.get_nowait()
+    assert "['a']" in handler.format(record)
+    assert "'b'" not in handler.format(record)
+
+
+class CountingFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__('%(message)s')
+        self.formatted = []
+
+    def format(self, record):
+        self.formatted.append(record.getMessage())
+        return super().format(record)
+
+
+def make_ring_handler(pc, capacity):
+    formatter = CountingFormatter()
+    return PrintsCharmingRingBufferHandler(pc, capacity=capacity, formatter=formatter, container_width=10), formatter
+
+
+def test_ring_buffer_wraps_around(pc):
+    handler, _ = make_ring_handler(pc, capacity=3)
+    for i in range(5):
+        handler.handle(make_record('msg %d', i))
+
+    assert handler.total_records == 5
+    assert handler.record_count == 3
+    assert [record.msg % record.args for record in handler.records()] == ['msg 2', 'msg 3', 'msg 4']
+    assert [line.rstrip() for line in handler.render_window(height=10)] == ['msg 2', 'msg 3', 'msg 4']
+
+    with pytest.raises(ValueError):
+        PrintsCharmingRingBufferHandler(pc, capacity=0)
+
+
+def test_ring_buffer_formats_only_the_visible_window(pc):
+    handler, formatter = make_ring_handler(pc, capacity=100)
+    for i in range(50):
+        handler.handle(make_record('msg %d', i))
+    assert formatter.formatted == []
+
+    window = handler.render_window(height=2, scroll=3)
+    assert window == ['msg 45'.ljust(10), 'msg 46'.ljust(10)]
+    assert formatter.formatted == ['msg 46', 'msg 45']
+
+
+def test_ring_buffer_line_cache_keyed_by_seq_and_width(pc):
+    handler, formatter = make_ring_handler(pc, capacity=2)
+    handler.handle(make_record('first record'))
+    handler.handle(make_record('second'))
+
+    assert handler.render_window(height=3) == ['first reco', 'rd'.ljust(10), 'second'.ljust(10)]
+    handler.render_window(height=3)
+    assert formatter.formatted == ['second', 'first record']
+
+    # A resize reformats at the new width
+    assert handler.render_window(height=3, width=20) == ['first record'.ljust(20), 'second'.ljust(20)]
+    assert formatter.formatted[2:] == ['second', 'first record']
+
+    # Overwriting a slot drops its cached lines, even at the same width
+    handler.handle(make_record('third'))
+    assert handler.render_window(height=3, width=20) == ['second'.ljust(20), 'third'.ljust(20)]
+    assert formatter.formatted[4:] == ['third']
@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+
+from prints_charming.logging.filters import LogSuppressionFilter
+
+
+class Ambiguous:
+    """Mimics numpy arrays and DataFrames: `==` raises instead of returning a bool."""
+
+    def __eq__(self, other):
+        raise ValueError("The truth value of an array is ambiguous.")
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return 'Ambiguous()'
+
+
+class Unrepresentable:
+    def __repr__(self):
+        raise RuntimeError("no repr")
+
+    def __str__(self):
+        return 'unrepresentable'
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def logger():
+    logger = logging.Logger('test_logging_filters')
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.messages = handler.messages
+    return logger
+
+
+def log_at(logger, lineno, msg, *args):
+    logger.handle(logger.makeRecord(logger.name, logging.WARNING, 'app.py', lineno, msg, args, None))
+
+
+def test_coalesces_records_with_non_comparable_args(logger):
+    suppression = LogSuppressionFilter().attach(logger)
+    array = Ambiguous()
+
+    for _ in range(3):
+        log_at(logger, 1, "value %s", array)
+    suppression.flush()
+
+    assert logger.messages == ['value Ambiguous()', 'last message repeated 2 times']
+
+
+def test_unrepresentable_args_are_never_duplicates(logger):
+    LogSuppressionFilter().attach(logger)
+    value = Unrepresentable()
+
+    for _ in range(2):
+        log_at(logger, 1, "value %s", value)
+
+    assert logger.messages == ['value unrepresentable'] * 2
+
+
+def test_rate_limit_buckets_are_capped(logger):
+    suppression = LogSuppressionFilter(
+        coalesce_duplicates=False, rate=1, burst=1, max_call_sites=2, clock=lambda: 0.0
+    ).attach(logger)
+
+    for lineno in (1, 1, 2, 3):
+        log_at(logger, lineno, "line %s", lineno)
+
+    assert len(suppression._buckets) == 2
+    assert logger.messages == [
+        'line 1', 'line 2', 'suppressed 1 records from app.py:1 (rate limit 1/s)', 'line 3'
+    ]
+
+
+def test_rate_limited_record_is_not_reported_as_repeated(logger):
+    suppression = LogSuppressionFilter(rate=1, burst=1, clock=lambda: 0.0).attach(logger)
+
+    log_at(logger, 1, "first")
+    for _ in range(3):
+        log_at(logger, 1, "dropped")
+    suppression.flush()
+
+    assert logger.messages == ['first', 'suppressed 3 records from app.py:1 (rate limit 1/s)']
@@ -0,0 +1,114 @@
+import io
+import logging
+import socket
+import struct
+
+import pytest
+
+from prints_charming import PrintsCharming
+from prints_charming.logging.log_handler import CompactLogRecord, PrintsCharmingLogHandler
+from prints_charming.logging.multiprocess import (
+    PrintsCharmingLogListener,
+    PrintsCharmingQueueSender,
+    PrintsCharmingSocketSender,
+    decode_record,
+    encode_record,
+)
+
+
+def make_record(msg, *args):
+    return logging.LogRecord('child', logging.INFO, 'child.py', 7, msg, args, None)
+
+
+def frame(msg):
+    return encode_record(CompactLogRecord.from_record(make_record(msg)))
+
+
+@pytest.fixture
+def make_listener():
+    def make(**kwargs):
+        pc = PrintsCharming(plain_output=True)
+        handler = PrintsCharmingLogHandler(pc, formatter=logging.Formatter('%(name)s %(message)s'), container_width=80)
+        stream = io.StringIO()
+        listener = PrintsCharmingLogListener(pc, handler=handler, stream=stream, **kwargs)
+        listener.output = lambda: [line.rstrip() for line in stream.getvalue().splitlines()]
+        return listener
+    return make
+
+
+def test_encode_decode_round_trip():
+    compact = CompactLogRecord.from_record(make_record('%s and %d', 'text', 3))
+    encoded = encode_record(compact)
+
+    assert struct.unpack('>L', encoded[:4])[0] == len(encoded) - 4
+    assert decode_record(encoded[4:]) == compact
+
+
+def test_queue_round_trip(make_listener):
+    listener = make_listener()
+    sender = PrintsCharmingQueueSender(listener.queue)
+
+    for i in range(3):
+        sender.handle(make_record('queued %s', i))
+    listener.stop()
+
+    assert listener.output() == [f'child queued {i}' for i in range(3)]
+
+
+def test_socket_round_trip(make_listener, tmp_path):
+    path = str(tmp_path / 'log.sock')
+    listener = make_listener(socket_path=path)
+    sender = PrintsCharmingSocketSender(path)
+
+    for i in range(3):
+        sender.handle(make_record('sent %s', i))
+    # The sender stays connected: stop() must still drain what it sent
+    listener.stop()
+    sender.close()
+
+    assert listener.output() == [f'child sent {i}' for i in range(3)]
+
+
+def test_truncated_frame_is_discarded(make_listener, tmp_path):
+    path = str(tmp_path / 'log.sock')
+    listener = make_listener(socket_path=path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(frame('complete') + frame('truncated')[:-3])
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(frame('next connection'))
+    listener.stop()
+
+    assert listener.output() == ['child complete', 'child next connection']
+
+
+class ResettingConnection:
+    """Delivers some bytes, then fails like a peer that reset the connection."""
+
+    def __init__(self, data):
+        self.chunks = [data]
+        self.closed = False
+
+    def recv(self, size):
+        if self.chunks:
+            return self.chunks.pop()
+        raise ConnectionResetError(104, 'Connection reset by peer')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+
+def test_reset_connection_is_closed_cleanly(make_listener):
+    listener = make_listener(auto_start=False)
+    connection = ResettingConnection(frame('before reset') + frame('cut')[:5])
+
+    listener._read_connection(connection)
+
+    assert connection.closed
+    assert listener.queue.get_nowait().msg == 'before reset'
+    assert listener.queue.empty()
@@ -0,0 +1,321 @@
+import asyncio
+import csv
+import io
+import threading
+import time
+
+import pytest
+
+from prints_charming import PrintsCharming
+from prints_charming.table_manager import AsyncBoundCell, BoundCell, TableFormatPlan, TableManager
+
+
+ROWS = [
+    ["Name", "Score", "Note"],
+    ["Alice", -1.5, "a|b"],
+    ["Bob", 2, "<x> & y"],
+]
+
+STYLE_PARAMS = dict(
+    header_style='orange',
+    cell_style='green',
+    conditional_style_functions={'Score': lambda v: 'red' if v < 0 else None},
+)
+
+
+@pytest.fixture(params=[True, False], ids=['plain', 'styled'])
+def tm(request):
+    return TableManager(pc=PrintsCharming(plain_output=request.param))
+
+
+def export(tm, fmt, rows=ROWS, **kwargs):
+    return ''.join(tm.iter_export(rows, fmt, **kwargs))
+
+
+def test_html_export_keeps_styles_under_plain_output():
+    plain = export(TableManager(pc=PrintsCharming(plain_output=True)), 'html', **STYLE_PARAMS)
+    styled = export(TableManager(pc=PrintsCharming(plain_output=False)), 'html', **STYLE_PARAMS)
+
+    assert plain == styled
+    assert '.pc-orange { color:' in plain
+    assert '<td class="pc-red pc-align-right">-1.5</td>' in plain
+    assert '&lt;x&gt; &amp; y' in plain
+
+
+def test_html_export_class_names_are_unique(tm):
+    html = export(tm, 'html', **STYLE_PARAMS)
+    rules = [line.split(' {')[0] for line in html.splitlines() if line.startswith('.')]
+    assert len(rules) == len(set(rules))
+
+
+def test_csv_export_round_trips(tm):
+    rows = list(csv.reader(io.StringIO(export(tm, 'csv', **STYLE_PARAMS))))
+    assert rows == [[str(cell) for cell in row] for row in ROWS]
+
+
+def test_markdown_export_escapes_pipes(tm):
+    lines = export(tm, 'markdown', **STYLE_PARAMS).splitlines()
+    assert lines[0] == '| Name | Score | Note |'
+    assert lines[1] == '| :--- | ---: | :--- |'
+    assert lines[2] == '| Alice | -1.5 | a\\|b |'
+
+
+def test_stream_table_matches_generate_table(tm):
+    streamed = '\n'.join(tm.stream_table(iter(ROWS), **STYLE_PARAMS))
+    assert streamed == tm.generate_table(ROWS, **STYLE_PARAMS)
+
+
+def test_stream_table_row_window_and_truncation():
+    tm = TableManager(pc=PrintsCharming(plain_output=True))
+    rows = [["id", "value"]] + [[i, 'x' * i] for i in range(10)]
+
+    lines = list(tm.stream_table(iter(rows), col_widths=[2, 5], row_window=(7, 9)))
+
+    assert len(lines) == 3
+    assert 'x' * 4 + '…' in lines[1]
+    assert all(tm.visible_length(line) == tm.visible_length(lines[0]) for line in lines)
+
+
+def test_stream_table_row_window_keeps_row_numbering():
+    tm = TableManager(pc=PrintsCharming(plain_output=False))
+    rows = [["id", "value"]] + [[i, 'x' * i] for i in range(8)]
+    # The same widths generate_table computes from every row
+    params = dict(row_window=(2, 5), cell_style=['red', 'blue'], col_widths=[2, 7])
+
+    from_list = list(tm.stream_table(rows, **params))
+    from_iterator = list(tm.stream_table(iter(rows), **params))
+    full = tm.generate_table(rows, cell_style=['red', 'blue']).split('\n')
+
+    assert from_list == from_iterator
+    assert from_list[1:] == full[3:6]
+
+
+def test_stream_table_fills_short_col_widths_from_header():
+    tm = TableManager(pc=PrintsCharming(plain_output=True))
+    lines = list(tm.stream_table([["id", "value"], [1, 'abcdefgh']], col_widths=[2]))
+    assert lines == [' | id | value | ', ' |  1 | abcd… | ']
+
+
+def test_stream_table_truncation_resolves_bound_cells_once():
+    tm = TableManager(pc=PrintsCharming(plain_output=False))
+    calls = []
+    seen_types = []
+
+    def source():
+        calls.append(1)
+        return 123456.5
+
+    lines = list(tm.stream_table(
+        [["id", "v"], [1, BoundCell(source)], [2, 3.5]],
+        col_widths={'v': 4},
+        conditional_style_functions={'v': lambda v: seen_types.append(type(v))},
+    ))
+
+    assert len(calls) == 1
+    assert seen_types == [float, float]
+    assert [tm.pc.remove_ansi_codes(line) for line in lines[1:]] == [' |  1 | 123… | ', ' |  2 |  3.5 | ']
+
+
+def test_columnar_input_resolves_bound_cells_like_rows(tm):
+    calls = []
+
+    def source():
+        calls.append(1)
+        return 42
+
+    columns = {'k': ['x', 'y'], 'v': [BoundCell(source), 3.25]}
+    rows = [['k', 'v'], ['x', BoundCell(source)], ['y', 3.25]]
+    kwargs = dict(cell_style=['red', 'blue'], conditional_style_functions={'v': lambda v: 'green' if v > 4 else None})
+
+    assert tm.generate_table(columns, **kwargs) == tm.generate_table(rows, **kwargs)
+
+    del calls[:]
+    tm.generate_table(columns, **kwargs)
+    assert len(calls) == 1
+
+
+def test_format_plan_notices_color_map_changes():
+    pc = PrintsCharming(plain_output=False)
+    plan = TableFormatPlan(pc, ["a"], {'cell_style': 'indigo'}, 16)
+    assert 'indigo' not in pc.style_codes
+
+    before = plan.style('indigo', 'x')
+    assert plan.check_styles() is False
+
+    pc.color_map['indigo'] = '\033[38;5;1m'
+    assert plan.check_styles() is True
+    assert plan.style('indigo', 'x') != before
+    assert plan.style('indigo', 'x') == pc.apply_style('indigo', 'x')
+
+
+def test_async_bound_cell_timeout_keeps_one_worker_thread():
+    calls = []
+    release = threading.Event()
+
+    def slow_source():
+        calls.append(1)
+        release.wait(5)
+        return 7
+
+    async def run():
+        cell = AsyncBoundCell(slow_source, timeout=0.05, initial=0)
+        assert await cell.fetch() is False
+        assert isinstance(cell.error, asyncio.TimeoutError)
+        assert cell.stale and cell.marker == '?' and cell.get_value() == 0
+
+        # A second timeout waits for the same call instead of starting another
+        await cell.fetch()
+        release.set()
+        assert await cell.fetch() is True
+        return cell
+
+    cell = asyncio.run(run())
+    assert len(calls) == 1
+    assert cell.get_value() == 7 and not cell.stale and cell.marker == ''
+
+
+def test_async_bound_cell_stale_after_and_failure():
+    results = [1.5]
+
+    async def source():
+        if not results:
+            raise RuntimeError("source down")
+        return results.pop()
+
+    async def run():
+        cell = AsyncBoundCell(source, stale_after=0.05, stale_marker='*')
+        assert await cell.fetch() is True
+        assert cell.marker == ''
+        await asyncio.sleep(0.1)
+        assert cell.marker == '*'
+
+        # A failed fetch keeps the last value and marks it stale
+        assert await cell.fetch() is False
+        assert isinstance(cell.error, RuntimeError)
+        return cell
+
+    cell = asyncio.run(run())
+    assert cell.get_value() == 1.5 and cell.stale
+
+
+def test_gather_bound_cells_fetches_concurrently():
+    tm = TableManager(pc=PrintsCharming(plain_output=True))
+
+    async def slow():
+        await asyncio.sleep(5)
+
+    async def fast():
+        return 3
+
+    tm.add_bound_table(
+        table_data=[["a", "b"], [AsyncBoundCell(slow, timeout=0.2), AsyncBoundCell(fast)]],
+        table_name="gather",
+    )
+    with pytest.raises(ValueError):
+        asyncio.run(tm.gather_bound_cells("missing"))
+
+    started = time.monotonic()
+    assert asyncio.run(tm.gather_bound_cells("gather")) == 1
+    assert time.monotonic() - started < 1
+    assert [cell.stale for cell in tm.tables["gather"]["data"][1]] == [True, False]
+
+
+def test_run_bound_table_async_redraws_changed_cells(capsys):
+    tm = TableManager(pc=PrintsCharming(plain_output=True))
+    values = iter(range(1, 1000))
+
+    async def source():
+        return next(values)
+
+    tm.add_bound_table(table_data=[["n"], [AsyncBoundCell(source, interval=0.01)]], table_name="live")
+    capsys.readouterr()
+
+    async def run():
+        stop_event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.2, stop_event.set)
+        return await tm.run_bound_table_async("live", max_fps=None, stop_event=stop_event)
+
+    totals = asyncio.run(run())
+    out = capsys.readouterr().out
+    assert totals["frames"] >= 2
+    assert totals["cells_changed"] >= totals["frames"]
+    assert totals["bytes_written"] == len(out.encode())
+    assert tm.previous_values["live"][1][0] in out
+
+
+def test_live_update_diffs_ticks_and_restores_screen(capsys):
+    tm = TableManager(pc=PrintsCharming(plain_output=True))
+    tm.generate_table([["a", "b"], [1, 2]], table_name="live")
+    updates = iter([
+        [["a", "b"], [1, 2]],
+        [["a", "b"], [1, 3]],
+        {"a": [1, 1], "b": [3, 4]},  # Column-oriented, with a new row
+    ])
+    capsys.readouterr()
+
+    totals = tm.live_update("live", lambda: next(updates), interval=0, max_fps=None, max_ticks=3)
+    out = capsys.readouterr().out
+
+    # Unchanged tick writes nothing, a changed cell is written alone, a new shape repaints
+    assert totals["ticks"] == 3
+    assert totals["cells_changed"] == 1 + 6
+    assert "\033[2;8H3\033[H\033[2J" in out
+    assert out.startswith("\033[?1049h\033[?25l")
+    assert out.endswith("\033[?1049l\033[?25h")
+    assert tm.previous_values["live"] == [["a", "b"], ["1", "3"], ["1", "4"]]
+
+
+def test_live_update_async_cancel_restores_screen(capsys):
+    tm = TableManager(pc=PrintsCharming(plain_output=True))
+    tm.generate_table([["n"], [0]], table_name="live")
+    counter = iter(range(1, 1000))
+
+    async def update():
+        return [["n"], [next(counter)]]
+
+    async def run():
+        task = asyncio.ensure_future(tm.live_update_async("live", update, interval=0.01, max_fps=None))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    capsys.readouterr()
+    asyncio.run(run())
+    out = capsys.readouterr().out
+    assert out.endswith("\033[?1049l\033[?25h")
+    assert int(tm.previous_values["live"][1][0]) > 1
+
+    with pytest.raises(ValueError):
+        asyncio.run(tm.live_update_async("missing"))
+
+
+def test_refresh_bound_table_relayouts_from_widened_column(capsys):
+    tm = TableManager(pc=PrintsCharming(plain_output=True))
+    value = {"b": 2}
+    tm.add_bound_table(
+        table_data=[["a", "b", "c"], [1, BoundCell(lambda: value["b"]), 3]],
+        table_name="relayout",
+        border_style="blue",
+        show_table_name=True,
+    )
+    capsys.readouterr()
+
+    value["b"] = 12345
+    stats = tm.refresh_bound_table("relayout", shrink_after=2)
+    out = capsys.readouterr().out
+    assert stats["columns_redrawn"] == 2
+    assert tm.tables["relayout"]["max_col_lengths"] == [1, 5, 1]
+    # Columns from b on are redrawn on every row, then the widened borders and title
+    assert "\033[4;8Hb     | c | " in out and "\033[6;8H12345 | 3 | " in out
+    assert "\033[1;1H" + "-" * 17 in out and "\033[2;1H" + "relayout".center(17) in out
+    assert "\033[K" not in out
+
+    # The column shrinks back only after two narrower refreshes, erasing the old width
+    value["b"] = 2
+    assert tm.refresh_bound_table("relayout", shrink_after=2)["columns_redrawn"] == 0
+    assert tm.tables["relayout"]["max_col_lengths"] == [1, 5, 1]
+    capsys.readouterr()
+    assert tm.refresh_bound_table("relayout", shrink_after=2)["columns_redrawn"] == 2
+    assert tm.tables["relayout"]["max_col_lengths"] == [1, 1, 1]
+    assert "\033[6;8H2 | 3 | \033[K" in capsys.readouterr().out
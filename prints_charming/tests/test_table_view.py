@@ -0,0 +1,96 @@
+import math
+import re
+from decimal import Decimal
+
+import pytest
+
+from prints_charming import PrintsCharming
+from prints_charming.table_manager import TableManager
+from prints_charming.table_view import TableView, sort_key
+
+
+NAN = float('nan')
+
+
+def make_view(rows, height=3, **kwargs):
+    tm = TableManager(pc=PrintsCharming(plain_output=True))
+    return TableView(tm, [["id", "v"]] + [[i, v] for i, v in enumerate(rows)], height=height, **kwargs)
+
+
+def expected_order(view, col_idx=1):
+    return sorted(range(view.row_count), key=lambda i: (sort_key(view.rows[i][col_idx]), i))
+
+
+def test_sort_key_orders_mixed_values():
+    values = [3, None, 'b', NAN, 1.5, Decimal('2'), 'a', Decimal('NaN')]
+
+    ordered = sorted(values, key=sort_key)
+
+    assert ordered[:5] == [1.5, Decimal('2'), 3, 'a', 'b']
+    assert math.isnan(ordered[5]) and ordered[6].is_nan()
+    assert ordered[7] is None
+
+
+def test_sort_numpy_scalars_numerically():
+    np = pytest.importorskip('numpy')
+    view = make_view([np.int64(10), np.int64(100), np.int64(9)])
+    view.sort_by('v')
+    assert view.order == [2, 0, 1]
+
+
+def test_update_cell_keeps_sort_index_with_nan():
+    view = make_view([5, NAN, 3, 1, NAN, 4, 2])
+    view.sort_by('v')
+    assert view.order == [3, 6, 2, 5, 0, 1, 4]
+
+    view.update_cell(6, 'v', 0)
+
+    assert view.order == [6, 3, 2, 5, 0, 1, 4]
+    assert view.sort_indexes[1] == expected_order(view)
+
+
+def test_append_rows_and_update_cell_keep_indexes_and_masks():
+    view = make_view([5, 3, 8])
+    view.sort_by('v', descending=True)
+    view.set_filter('small', lambda v: v < 7, column='v')
+    assert view.order == [0, 1]
+
+    view.append_rows([[3, 6], [4, 1]])
+    assert view.order == [3, 0, 1, 4]
+
+    view.update_cell(2, 'v', 2)
+    assert view.order == [3, 0, 1, 2, 4]
+    assert view.sort_indexes[1] == expected_order(view)
+
+    view.remove_filter('small')
+    view.sort_by(None)
+    assert view.order == [0, 1, 2, 3, 4]
+
+
+def test_row_filters_combine():
+    view = make_view(list(range(10)))
+    view.set_filter('even', lambda row: row[1] % 2 == 0)
+    view.set_filter('big', lambda v: v > 3, column='v')
+    assert view.order == [4, 6, 8]
+    view.clear_filters()
+    assert view.visible_count == 10
+
+
+def test_refresh_scrolls_with_scroll_region_and_rewrites_new_rows(monkeypatch):
+    view = make_view(list(range(10)), height=3)
+    writes = []
+    monkeypatch.setattr(view.pc, 'write', lambda text: writes.append(text))
+
+    assert view.draw(starting_line=2)['lines_written'] == 4
+    stats = view.scroll(1)
+
+    assert stats['lines_written'] == 1
+    assert writes[-1].startswith('\033[4;6r\033[1S\033[r')
+    assert re.findall(r'\033\[(\d+);1H', writes[-1]) == ['6']
+    assert view.render_lines()[1:] == [' |  1 | 1 | ', ' |  2 | 2 | ', ' |  3 | 3 | ']
+
+    stats = view.page_down()
+    assert stats['lines_written'] == 3
+    assert view.offset == 4
+
+    assert view.scroll(0) == {'lines_written': 0, 'bytes_written': 0}
@@ -0,0 +1,154 @@
+# timestamp_formatter.py
+
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+
+
+class TimestampFormatter:
+    """
+    Formats log timestamps, caching the formatted second.
+
+    At high log rates most records fall within the same second, so the
+    `time.localtime`/`time.strftime` work is done once per second (and per
+    date format) and only the millisecond field is appended per record. The
+    styled form of the second is cached per style name as well.
+
+    Shared by `PrintsCharmingFormatter`, `LoggingManager` and the internal
+    logger of `PrintsCharming`.
+    """
+
+    DEFAULT_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self,
+                 datefmt: Optional[str] = None,
+                 ms_sep: str = '.',
+                 ms_format: str = '{:03d}',
+                 converter: Callable[[Optional[float]], time.struct_time] = time.localtime
+                 ) -> None:
+        """
+        :param datefmt: strftime format for the seconds part. Defaults to
+                        DEFAULT_DATEFMT.
+        :param ms_sep: Separator placed between the seconds and milliseconds.
+        :param ms_format: Format string for the integer milliseconds field.
+        :param converter: Function converting an epoch time to a struct_time.
+        """
+        self.datefmt = datefmt or self.DEFAULT_DATEFMT
+        self.ms_sep = ms_sep
+        self.ms_format = ms_format
+        self.converter = converter
+
+        # (second, datefmt) -> formatted seconds; replaced atomically
+        self._seconds_cache: Tuple[Optional[Tuple[int, str]], str] = (None, '')
+
+        # (second, datefmt) -> {style_name: (styled head, style tail)}
+        self._styled_cache: Tuple[Optional[Tuple[int, str]], Dict[str, Tuple[str, str]]] = (None, {})
+
+
+    def clear(self) -> None:
+        """Clears the cached seconds and styled seconds."""
+        self._seconds_cache = (None, '')
+        self._styled_cache = (None, {})
+
+
+    def format_seconds(self, created: float, datefmt: Optional[str] = None) -> str:
+        """
+        Returns the formatted seconds part of a timestamp, cached per second.
+
+        :param created: Epoch time in seconds.
+        :param datefmt: Optional strftime format overriding self.datefmt.
+        :return: The formatted seconds.
+        """
+        key = (int(created), datefmt or self.datefmt)
+        cached_key, formatted = self._seconds_cache
+        if cached_key != key:
+            formatted = time.strftime(key[1], self.converter(created))
+            self._seconds_cache = (key, formatted)
+        return formatted
+
+
+    @staticmethod
+    def get_msecs(created: float) -> int:
+        """Returns the integer milliseconds of an epoch time."""
+        return int((created - int(created)) * 1000)
+
+
+    def format(self, created: float, msecs: Optional[float] = None, datefmt: Optional[str] = None) -> str:
+        """
+        Formats a full timestamp: the cached seconds followed by milliseconds.
+
+        :param created: Epoch time in seconds.
+        :param msecs: Milliseconds (e.g. `LogRecord.msecs`). Computed from
+                      `created` if not provided.
+        :param datefmt: Optional strftime format overriding self.datefmt.
+        :return: The formatted timestamp.
+        """
+        if msecs is None:
+            msecs = self.get_msecs(created)
+        return f"{self.format_seconds(created, datefmt)}{self.ms_sep}{self.ms_format.format(int(msecs))}"
+
+
+    def get_styled_parts(self,
+                         created: float,
+                         style_name: str,
+                         style_func: Callable[[str, Any], str],
+                         datefmt: Optional[str] = None
+                         ) -> Tuple[str, str]:
+        """
+        Returns the cached styled seconds split around the end of the text:
+        anything placed between the two parts is styled like the seconds.
+
+        :param created: Epoch time in seconds.
+        :param style_name: The style name passed to `style_func`.
+        :param style_func: Styling function, e.g. `PrintsCharming.apply_style`.
+        :param datefmt: Optional strftime format overriding self.datefmt.
+        :return: (style codes and seconds, style reset).
+        """
+        key = (int(created), datefmt or self.datefmt)
+        cached_key, styled_seconds = self._styled_cache
+        if cached_key != key:
+            styled_seconds = {}
+            self._styled_cache = (key, styled_seconds)
+
+        parts = styled_seconds.get(style_name)
+        if parts is None:
+            seconds = self.format_seconds(created, datefmt)
+            # Split the style wrapping around a placeholder to find where the text goes
+            head, placeholder, tail = style_func(style_name, '\x00').partition('\x00')
+            if placeholder:
+                parts = (f"{head}{seconds}", tail)
+            else:
+                parts = (style_func(style_name, seconds), '')
+            styled_seconds[style_name] = parts
+        return parts
+
+
+    def format_styled(self,
+                      created: float,
+                      style_name: str,
+                      style_func: Callable[[str, Any], str],
+                      msecs: Optional[float] = None,
+                      datefmt: Optional[str] = None,
+                      include_msecs: bool = True
+                      ) -> str:
+        """
+        Formats and styles a timestamp. The styled seconds are cached per
+        second and style name, so only the milliseconds field is appended per
+        call. The output is identical to `style_func(style_name, timestamp)`.
+
+        :param created: Epoch time in seconds.
+        :param style_name: The style name passed to `style_func`.
+        :param style_func: Styling function, e.g. `PrintsCharming.apply_style`.
+        :param msecs: Milliseconds. Computed from `created` if not provided.
+        :param datefmt: Optional strftime format overriding self.datefmt.
+        :param include_msecs: If False, only the styled seconds are returned.
+        :return: The styled timestamp.
+        """
+        head, tail = self.get_styled_parts(created, style_name, style_func, datefmt)
+        if not include_msecs:
+            return f"{head}{tail}"
+
+        if msecs is None:
+            msecs = self.get_msecs(created)
+        return f"{head}{self.ms_sep}{self.ms_format.format(int(msecs))}{tail}"
@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 import math
 import tty
@@ -441,6 +442,73 @@ def rgb_to_css_style(r_fg, g_fg, b_fg, r_bg=None, g_bg=None, b_bg=None) -> str:
     return style
 
 
+_sgr_sequence = re.compile(r'\x1b\[([0-9;]*)m')
+
+_sgr_effect_css = {
+    1: "font-weight: bold;",
+    2: "opacity: 0.7;",
+    3: "font-style: italic;",
+}
+
+# Combined into a single text-decoration declaration
+_sgr_decoration_css = {
+    4: "underline",
+    9: "line-through",
+}
+
+
+def sgr_to_css_style(code: str) -> str:
+    """
+    Convert a style code made of SGR sequences (e.g. '\\x1b[38;5;34m\\x1b[1m')
+    to a CSS style string. 256-color codes go through ansi_to_css_style,
+    truecolor codes through rgb_to_css_style. Unsupported parameters are ignored.
+    """
+    params = [int(p) if p else 0 for seq in _sgr_sequence.findall(code) for p in seq.split(';')]
+    fg = bg = None  # ANSI 256 index or RGB tuple
+    effects = []
+    decorations = []
+    i = 0
+    while i < len(params):
+        p = params[i]
+        if p in (38, 48) and i + 2 < len(params) and params[i + 1] == 5:
+            color = params[i + 2]
+            i += 3
+        elif p in (38, 48) and i + 4 < len(params) and params[i + 1] == 2:
+            color = tuple(params[i + 2:i + 5])
+            i += 5
+        else:
+            if 30 <= p <= 37 or 90 <= p <= 97:
+                fg = p - 30 if p < 90 else p - 82
+            elif 40 <= p <= 47 or 100 <= p <= 107:
+                bg = p - 40 if p < 100 else p - 92
+            elif p == 7:
+                fg, bg = bg, fg
+            elif p in _sgr_effect_css and _sgr_effect_css[p] not in effects:
+                effects.append(_sgr_effect_css[p])
+            elif p in _sgr_decoration_css and _sgr_decoration_css[p] not in decorations:
+                decorations.append(_sgr_decoration_css[p])
+            i += 1
+            continue
+        if p == 38:
+            fg = color
+        else:
+            bg = color
+
+    declarations = []
+    if fg is not None and not isinstance(fg, tuple) and not isinstance(bg, tuple):
+        declarations.append(ansi_to_css_style(fg, bg))
+    else:
+        if fg is not None:
+            declarations.append(rgb_to_css_style(*(fg if isinstance(fg, tuple) else ansi_to_rgb(fg))).rstrip())
+        if bg is not None:
+            r, g, b = bg if isinstance(bg, tuple) else ansi_to_rgb(bg)
+            declarations.append(f"background-color: rgb({r}, {g}, {b});")
+    declarations.extend(effects)
+    if decorations:
+        declarations.append(f"text-decoration: {' '.join(decorations)};")
+    return ' '.join(declarations)
+
+
 def ansi_to_html(index_fg: int, index_bg: int = None) -> str:
     """Convert ANSI 256 color indexes to an HTML span with both foreground and background colors."""
     rgb_fg = ansi_to_rgb(index_fg)
@@ -634,6 +702,30 @@ def terminal_supports_truecolor() -> bool:
     return False
 
 
+def detect_plain_output(stream=None) -> bool:
+    """
+    Detect whether output should be written as plain text without ANSI codes.
+
+    Follows the NO_COLOR convention (https://no-color.org): a non-empty
+    NO_COLOR disables colors, a non-empty FORCE_COLOR keeps them on. Otherwise
+    colors are only used when the stream is attached to a terminal.
+
+    :param stream: The stream that will receive output. Defaults to sys.stdout.
+    :return: True if styling should be skipped, False otherwise.
+    """
+    if os.getenv("NO_COLOR"):
+        return True
+    if os.getenv("FORCE_COLOR"):
+        return False
+
+    stream = stream or sys.stdout
+    try:
+        return not stream.isatty()
+    except (AttributeError, ValueError):
+        # Detached or closed streams are treated as non-terminals
+        return True
+
+
 
 
 